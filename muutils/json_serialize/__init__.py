@@ -16,21 +16,36 @@ This module plays nicely with and is a dependency of the [`ZANJ`](https://github
 from __future__ import annotations
 
 from muutils.json_serialize.array import arr_metadata, load_array
+from muutils.json_serialize.json_backend import (
+    json_dumps,
+    json_loads,
+    set_json_backend,
+)
 from muutils.json_serialize.json_serialize import (
     BASE_HANDLERS,
     JsonSerializer,
     json_serialize,
+    json_serialize_dumps,
 )
+from muutils.json_serialize.json_load import JsonLoader, json_load
 from muutils.json_serialize.serializable_dataclass import (
     SerializableDataclass,
     serializable_dataclass,
     serializable_field,
 )
-from muutils.json_serialize.util import try_catch, JSONitem, dc_eq
+from muutils.json_serialize.util import (
+    try_catch,
+    JSONitem,
+    dc_eq,
+    dc_hash,
+    resolve_refs,
+)
 
 __all__ = [
     # submodules
     "array",
+    "json_backend",
+    "json_load",
     "json_serialize",
     "serializable_dataclass",
     "serializable_field",
@@ -41,10 +56,17 @@ __all__ = [
     "BASE_HANDLERS",
     "JSONitem",
     "JsonSerializer",
+    "JsonLoader",
     "json_serialize",
+    "json_serialize_dumps",
+    "json_dumps",
+    "json_loads",
+    "set_json_backend",
     "try_catch",
     "JSONitem",
     "dc_eq",
+    "dc_hash",
+    "resolve_refs",
     "serializable_dataclass",
     "serializable_field",
     "SerializableDataclass",
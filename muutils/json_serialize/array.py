@@ -2,6 +2,16 @@
 
 - `array_list_meta` is less efficient (arrays are stored as nested lists), but preserves both metadata and human readability.
 - `array_b64_meta` is the most efficient, but is not human readable.
+- `array_text_meta` is a faster alternative to `array_list_meta` for large arrays: the values are formatted in bulk
+  into a single comma-separated string, and parsed back with `np.fromstring`
+- `array_b64z_meta` is `array_b64_meta` with the bytes compressed first, see `ArrayCodec`
+- `array_chunked_meta` splits the array into blocks of rows, each compressed and base64 encoded on its own, so
+  that arrays larger than memory can be written incrementally with `dump_array_chunked`, and a slice of rows
+  can be loaded with `load_array_rows` without decoding the rest
+- `array_summary_meta` stores only summary statistics (from `muutils.tensor_info.array_info`) and not the data,
+  so it can't be loaded back into an array
+- `array_blob_meta` writes the raw bytes to a binary sidecar file via an `ArrayBlobWriter`, and only metadata
+  (file, offset, shape, dtype) to json. `load_array` memory-maps the data back without copying
 - `external` is mostly for use in [`ZANJ`](https://github.com/mivanit/ZANJ)
 
 """
@@ -9,15 +19,21 @@
 from __future__ import annotations
 
 import base64
+import json
+import os
+import zlib
 import typing
 import warnings
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Iterable,
+    Iterator,
     Literal,
     Optional,
     Sequence,
+    TextIO,
     TypedDict,
     Union,
     overload,
@@ -36,6 +52,7 @@ if TYPE_CHECKING:
     import torch
     from muutils.json_serialize.json_serialize import JsonSerializer
 
+from muutils.json_serialize.json_backend import _NATIVE_ARRAYS  # pyright: ignore[reportPrivateUsage]
 from muutils.json_serialize.types import _FORMAT_KEY  # pyright: ignore[reportPrivateUsage]
 
 # TYPING: pyright complains way too much here
@@ -50,8 +67,13 @@ NumericList = typing.Union[
 ArrayMode = Literal[
     "list",
     "array_list_meta",
+    "array_text_meta",
     "array_hex_meta",
     "array_b64_meta",
+    "array_b64z_meta",
+    "array_chunked_meta",
+    "array_blob_meta",
+    "array_summary_meta",
     "external",
     "zero_dim",
 ]
@@ -59,8 +81,13 @@ ArrayMode = Literal[
 # Modes that produce SerializedArrayWithMeta (dict with metadata)
 ArrayModeWithMeta = Literal[
     "array_list_meta",
+    "array_text_meta",
     "array_hex_meta",
     "array_b64_meta",
+    "array_b64z_meta",
+    "array_chunked_meta",
+    "array_blob_meta",
+    "array_summary_meta",
     "zero_dim",
     "external",
 ]
@@ -87,16 +114,194 @@ class ArrayMetadata(TypedDict):
     n_elements: int
 
 
+class ArrayBlobRef(TypedDict):
+    """location of an array's bytes in a sidecar file, for `array_blob_meta`"""
+
+    file: str
+    offset: int
+    nbytes: int
+
+
 class SerializedArrayWithMeta(TypedDict):
-    """Serialized array with metadata (for array_list_meta, array_hex_meta, array_b64_meta, zero_dim modes)"""
+    """Serialized array with metadata (for array_list_meta, array_hex_meta, array_b64_meta, array_blob_meta, zero_dim modes)"""
 
     __muutils_format__: str
     data: typing.Union[
-        NumericList, str, int, float, bool
-    ]  # list, hex str, b64 str, or scalar for zero_dim
+        NumericList, str, int, float, bool, ArrayBlobRef
+    ]  # list, hex str, b64 str, blob location, or scalar for zero_dim
+    shape: list[int]
+    dtype: str
+    n_elements: int
+
+
+class SerializedArrayCompressed(SerializedArrayWithMeta):
+    """Serialized array with metadata and compressed base64 data (for array_b64z_meta mode)"""
+
+    codec: str
+    level: int
+
+
+class SerializedArrayChunked(SerializedArrayCompressed):
+    """Serialized array with metadata, and data as a list of compressed base64 blocks of rows (for array_chunked_meta mode)"""
+
+    chunk_rows: int
+
+
+class SerializedArraySummary(TypedDict):
+    """Serialized array with metadata and summary statistics instead of data (for array_summary_meta mode)"""
+
+    __muutils_format__: str
     shape: list[int]
     dtype: str
     n_elements: int
+    summary: dict[str, Any]
+
+
+# keys of `muutils.tensor_info.array_info` written by `array_summary_meta`
+ARRAY_SUMMARY_KEYS: tuple[str, ...] = (
+    "status",
+    "nan_count",
+    "min",
+    "max",
+    "mean",
+    "std",
+    "histogram",
+    "bins",
+)
+
+
+ArrayCodec = Literal["none", "zlib", "lz4", "zstd"]
+"""compression codecs for `array_b64z_meta` and `array_chunked_meta`. `none` and `zlib` are always available,
+`lz4` needs the `lz4` package and `zstd` the `zstandard` package"""
+
+# compress(data, level), decompress(data), default level
+_CodecFuncs = typing.Tuple[Callable[[bytes, int], bytes], Callable[[bytes], bytes], int]
+
+
+def _codec_none() -> _CodecFuncs:
+    return (lambda data, level: data), (lambda data: data), 0
+
+
+def _codec_zlib() -> _CodecFuncs:
+    return zlib.compress, zlib.decompress, 6
+
+
+def _codec_lz4() -> _CodecFuncs:
+    import lz4.frame  # type: ignore[import-not-found]
+
+    return (
+        lambda data, level: lz4.frame.compress(data, compression_level=level),  # pyright: ignore
+        lz4.frame.decompress,  # pyright: ignore
+        0,
+    )
+
+
+def _codec_zstd() -> _CodecFuncs:
+    import zstandard  # type: ignore[import-not-found]
+
+    return (
+        lambda data, level: zstandard.ZstdCompressor(level=level).compress(data),  # pyright: ignore
+        lambda data: zstandard.ZstdDecompressor().decompress(data),  # pyright: ignore
+        3,
+    )
+
+
+# each factory imports its codec, raising `ImportError` if it is not installed
+_CODEC_FACTORIES: dict[str, Callable[[], _CodecFuncs]] = {
+    "none": _codec_none,
+    "zlib": _codec_zlib,
+    "lz4": _codec_lz4,
+    "zstd": _codec_zstd,
+}
+
+
+def get_array_codec(codec: str) -> _CodecFuncs:
+    """get `(compress, decompress, default_level)` for a codec
+
+    # Raises:
+     - `ValueError` : if the codec is unknown
+     - `ImportError` : if the package for the codec is not installed
+    """
+    try:
+        factory: Callable[[], _CodecFuncs] = _CODEC_FACTORIES[codec]
+    except KeyError as e:
+        raise ValueError(
+            f"unknown array codec {codec!r}, expected one of {list(_CODEC_FACTORIES)}"
+        ) from e
+    return factory()
+
+
+# number of values formatted at once by `array_to_text`, bounds the temporary python objects
+_TEXT_CHUNK_SIZE: int = 2**16
+
+# significant digits needed to round-trip each float size, used when no precision is given.
+# 8-byte floats use the shortest round-tripping repr instead
+_FLOAT_ROUNDTRIP_DIGITS: dict[int, int] = {2: 5, 4: 9}
+
+
+def array_to_text(arr: np.ndarray, precision: Optional[int] = None) -> str:
+    """format the values of a bool, integer, or float array (in C order) as a comma-separated string
+
+    the values are formatted a chunk at a time with a single `%` operation, which is much faster than
+    encoding a nested list of python numbers as json
+
+    # Parameters:
+     - `arr : np.ndarray`
+        array to format
+     - `precision : int | None`
+        significant digits for floats. if `None`, floats are written with enough digits to round-trip exactly
+        (defaults to `None`)
+
+    # Raises:
+     - `ValueError` : if the dtype is not bool, integer, or float
+    """
+    flat: np.ndarray = arr.ravel()
+    kind: str = flat.dtype.kind
+    fmt: str
+    if kind == "b":
+        flat = flat.view(np.uint8)
+        fmt = "%d"
+    elif kind in "iu":
+        fmt = "%d"
+    elif kind == "f":
+        if precision is not None:
+            fmt = f"%.{precision}g"
+        elif flat.dtype.itemsize in _FLOAT_ROUNDTRIP_DIGITS:
+            fmt = f"%.{_FLOAT_ROUNDTRIP_DIGITS[flat.dtype.itemsize]}g"
+        else:
+            fmt = "%r"
+    else:
+        raise ValueError(
+            f"can only format bool, integer, or float arrays as text, got {arr.dtype = }"
+        )
+    chunks: list[str] = []
+    for start in range(0, flat.size, _TEXT_CHUNK_SIZE):
+        values: list[Any] = flat[start : start + _TEXT_CHUNK_SIZE].tolist()
+        chunks.append(",".join([fmt] * len(values)) % tuple(values))
+    return ",".join(chunks)
+
+
+def array_from_text(data: str, dtype: str, shape: Sequence[int]) -> np.ndarray:
+    """parse a string written by `array_to_text` back into an array
+
+    # Raises:
+     - `ValueError` : if the number of values does not match `shape`
+    """
+    np_dtype: np.dtype = np.dtype(dtype)
+    parse_dtype: np.dtype
+    if np_dtype.kind == "b":
+        parse_dtype = np.dtype(np.uint8)
+    elif np_dtype.kind == "f":
+        parse_dtype = np.dtype(np.float64)
+    else:
+        parse_dtype = np_dtype
+    values: np.ndarray = np.fromstring(data, dtype=parse_dtype, sep=",")
+    expected: int = int(np.prod(shape))
+    if values.size != expected:
+        raise ValueError(
+            f"expected {expected} values for {shape = }, but parsed {values.size}"
+        )
+    return values.astype(np_dtype, copy=False).reshape(shape)
 
 
 def arr_metadata(arr: Any) -> ArrayMetadata:  # pyright: ignore[reportAny]
@@ -110,6 +315,340 @@ def arr_metadata(arr: Any) -> ArrayMetadata:  # pyright: ignore[reportAny]
     }
 
 
+class ArrayBlobWriter:
+    """appends the raw bytes of arrays to a binary sidecar file, for the `array_blob_meta` array mode
+
+    pass to `JsonSerializer(array_blob=...)`. each array starts at an offset aligned to `alignment` bytes,
+    so that the memory-mapped arrays returned by `load_array` are aligned. C-contiguous arrays are
+    written straight from their buffer without copying.
+
+    use as a context manager, or call `close()` once done, before loading the arrays back
+
+    # Parameters:
+     - `path : str | os.PathLike`
+        file to write to. written into the json as given, so a relative path is resolved relative to
+        the working directory, or to the `blob_dir` passed to `load_array`
+     - `append : bool`
+        append to an existing file instead of truncating it
+        (defaults to `False`)
+     - `alignment : int`
+        alignment in bytes of the start of each array
+        (defaults to `64`)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        append: bool = False,
+        alignment: int = 64,
+    ) -> None:
+        self.path: str = os.fspath(path)
+        self.alignment: int = alignment
+        self._file: typing.BinaryIO = open(self.path, "ab" if append else "wb")
+        self.offset: int = self._file.tell()
+
+    def write(self, arr: np.ndarray) -> ArrayBlobRef:
+        """write the bytes of `arr` (in C order) and return where they are"""
+        if arr.dtype.hasobject:
+            raise ValueError(
+                f"cannot write arrays with object dtype to a blob: {arr.dtype = }"
+            )
+        padding: int = -self.offset % self.alignment
+        if padding:
+            self._file.write(b"\0" * padding)
+            self.offset += padding
+        # no copy if already C-contiguous
+        arr_c: np.ndarray = np.ascontiguousarray(arr)
+        start: int = self.offset
+        if arr_c.nbytes:
+            self._file.write(arr_c.data)
+        self.offset += arr_c.nbytes
+        return ArrayBlobRef(file=self.path, offset=start, nbytes=arr_c.nbytes)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "ArrayBlobWriter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+# array modes which write values rather than raw bytes
+_VALUE_ARRAY_MODES: frozenset[str] = frozenset(
+    {"list", "array_list_meta", "array_text_meta", "array_summary_meta"}
+)
+
+
+def array_to_numpy(
+    arr: "Union[np.ndarray, torch.Tensor]",
+    raw: bool = True,
+) -> tuple[np.ndarray, Optional[str]]:
+    """get a numpy array with the contents of `arr`, without copying where possible
+
+    numpy arrays are returned as-is. torch tensors are detached and, if on CPU, viewed with `.numpy()`
+    without copying, otherwise copied to CPU once. torch dtypes which numpy does not have, such as
+    `bfloat16` and the `float8` types, are handled as follows:
+
+    - if `raw`, the bytes are viewed as an unsigned integer dtype of the same size (`bfloat16` as `uint16`), for
+      modes which write raw bytes
+    - otherwise, the values are converted to `float32` (or `complex64` for complex types), for modes which write values
+
+    in both cases the second element of the return is the original dtype (such as `"torch.bfloat16"`),
+    which `serialize_array` writes under the key `dtype_tag`, and which the torch loader of `JsonLoader`
+    uses to restore the tensor. it is `None` when the numpy array has the original dtype
+    """
+    if isinstance(arr, np.ndarray):
+        return arr, None
+
+    import torch
+
+    tensor: torch.Tensor = arr.detach()
+    if tensor.device.type != "cpu":
+        tensor = tensor.cpu()
+    # no-ops unless the lazy conjugate/negative bits are set, which `.numpy()` refuses
+    tensor = tensor.resolve_conj().resolve_neg()
+    try:
+        return tensor.numpy(), None
+    except TypeError:
+        # "Got unsupported ScalarType ..."
+        pass
+
+    dtype_tag: str = str(tensor.dtype)
+    if raw:
+        itemsize: int = tensor.element_size()
+        # torch only has signed integer views for all sizes, so reinterpret on the numpy side
+        signed: dict[int, torch.dtype] = {
+            1: torch.int8,
+            2: torch.int16,
+            4: torch.int32,
+            8: torch.int64,
+        }
+        return (
+            tensor.view(signed[itemsize]).numpy().view(f"uint{itemsize * 8}"),
+            dtype_tag,
+        )
+    upcast: torch.dtype = torch.complex64 if tensor.is_complex() else torch.float32
+    return tensor.to(upcast).numpy(), dtype_tag
+
+
+def _as_bytes(arr_np: np.ndarray) -> np.ndarray:
+    """view the data of `arr_np` as flat bytes, copying only if it is not C-contiguous
+
+    the result supports the buffer protocol, so it can be passed to `base64`, `zlib`, etc. without `tobytes()`
+    """
+    return np.ascontiguousarray(arr_np).reshape(-1).view(np.uint8)
+
+
+def _get_content_hash() -> Callable[[Any], int]:
+    """fast non-cryptographic hash of a buffer: `xxhash.xxh3_64` if installed, otherwise `zlib.crc32`"""
+    try:
+        import xxhash  # type: ignore[import-not-found]
+    except ImportError:
+        return zlib.crc32
+    return xxhash.xxh3_64_intdigest  # type: ignore[no-any-return]
+
+
+_content_hash: Optional[Callable[[Any], int]] = None
+
+ArrayContentKey = typing.Tuple[str, str, typing.Tuple[int, ...], int]
+"""`(type name, dtype, shape, hash of the bytes)`, see `array_content_key`"""
+
+
+def array_content_key(
+    arr: "Union[np.ndarray, torch.Tensor]",
+) -> tuple[ArrayContentKey, np.ndarray]:
+    """a key for the contents of a numpy array or torch tensor, and a flat byte view of them
+
+    the hash in the key is not cryptographic, so two arrays with the same key should be confirmed
+    to be equal by comparing the bytes. used by `JsonSerializer(array_dedup=True)`
+    """
+    global _content_hash
+    if _content_hash is None:
+        _content_hash = _get_content_hash()
+    arr_np, dtype_tag = array_to_numpy(arr)
+    data: np.ndarray = _as_bytes(arr_np)
+    key: ArrayContentKey = (
+        f"{type(arr).__module__}.{type(arr).__name__}",
+        dtype_tag or str(arr_np.dtype),
+        tuple(arr_np.shape),
+        _content_hash(data),
+    )
+    return key, data
+
+
+ArrayQuantize = Literal["float16", "bfloat16", "int8"]
+"""lossy quantization of float arrays, see `quantize_array`"""
+
+
+class QuantizeParams(TypedDict):
+    """how a quantized array is stored. the original values are approximately `(stored - zero_point) * scale`"""
+
+    method: str
+    scale: float
+    zero_point: int
+
+
+class SerializedArrayQuantized(SerializedArrayWithMeta):
+    """Serialized array with metadata, whose data was quantized. `dtype` is the stored dtype"""
+
+    orig_dtype: str
+    quantize: QuantizeParams
+
+
+def quantize_array(
+    arr: np.ndarray, method: ArrayQuantize
+) -> tuple[np.ndarray, QuantizeParams]:
+    """lossily convert a float array to a smaller dtype
+
+    - `float16`: cast to `float16`. values beyond about 65504 in magnitude become infinite
+    - `bfloat16`: round to `bfloat16`, which has the range of `float32` but 8 bits of precision,
+      stored as the upper 16 bits of the `float32` values in a `uint16` array
+    - `int8`: affine quantization of the finite range of the values to 256 levels. infinite values are
+      clipped to the range, and `nan` is treated as 0 before clipping
+
+    # Returns:
+     - `tuple[np.ndarray, QuantizeParams]`
+        the quantized array, and the parameters needed by `dequantize_array`
+
+    # Raises:
+     - `ValueError` : if `arr` is not a float array, or the method is unknown
+    """
+    if arr.dtype.kind != "f":
+        raise ValueError(f"can only quantize float arrays, got {arr.dtype = }")
+    scale: float = 1.0
+    zero_point: int = 0
+    quantized: np.ndarray
+    if method == "float16":
+        quantized = arr.astype(np.float16)
+    elif method == "bfloat16":
+        bits: np.ndarray = np.ascontiguousarray(arr, dtype=np.float32).view(np.uint32)
+        # round to nearest, ties to even, on the 16 bits which are dropped
+        rounded: np.ndarray = (bits + (0x7FFF + ((bits >> 16) & 1))) >> 16
+        # rounding can carry a nan payload into the exponent, so write a canonical nan
+        quantized = np.where(np.isnan(arr), 0x7FC0, rounded).astype(np.uint16)
+    elif method == "int8":
+        finite: np.ndarray = arr[np.isfinite(arr)]
+        if finite.size > 0:
+            lo: float = float(finite.min())
+            hi: float = float(finite.max())
+            if hi > lo:
+                scale = (hi - lo) / 255
+            zero_point = int(round(-128 - lo / scale))
+        values: np.ndarray = np.nan_to_num(arr, nan=0.0, posinf=np.inf, neginf=-np.inf)
+        quantized = np.clip(np.round(values / scale) + zero_point, -128, 127).astype(
+            np.int8
+        )
+    else:
+        raise ValueError(f"unknown quantization method {method!r}")
+    return quantized, QuantizeParams(method=method, scale=scale, zero_point=zero_point)
+
+
+def dequantize_array(
+    arr: np.ndarray,
+    params: QuantizeParams,
+    dtype: "Union[str, np.dtype, type]" = "float32",
+) -> np.ndarray:
+    """approximately restore an array quantized by `quantize_array`, as `dtype`"""
+    method: str = params["method"]
+    if method == "bfloat16":
+        return (arr.astype(np.uint32) << 16).view(np.float32).astype(dtype, copy=False)
+    restored: np.ndarray = arr.astype(dtype)
+    if params["zero_point"] != 0:
+        restored -= params["zero_point"]
+    if params["scale"] != 1.0:
+        restored *= params["scale"]
+    return restored
+
+
+# target size in bytes of the uncompressed blocks of `array_chunked_meta`
+ARRAY_CHUNK_BYTES: int = 1 << 20
+
+
+def _chunked_header(
+    arr: "Union[np.ndarray, torch.Tensor]",
+    codec: str,
+    level: int,
+    chunk_bytes: int,
+) -> dict[str, Any]:
+    """everything but the data of an `array_chunked_meta` array, with rows per block for blocks of about `chunk_bytes`"""
+    if len(arr.shape) == 0:
+        raise ValueError("cannot split a zero-dimensional array into chunks")
+    # an empty slice, so that nothing is copied
+    empty_np, dtype_tag = array_to_numpy(arr[:0])
+    row_nbytes: int = empty_np.dtype.itemsize * int(np.prod(arr.shape[1:]))
+    header: dict[str, Any] = {
+        _FORMAT_KEY: f"{type(arr).__module__}.{type(arr).__name__}:array_chunked_meta",
+        "shape": list(arr.shape),
+        "dtype": str(empty_np.dtype),
+        "n_elements": array_n_elements(arr),
+        "codec": codec,
+        "level": level,
+        "chunk_rows": max(1, chunk_bytes // max(1, row_nbytes)),
+    }
+    if dtype_tag is not None:
+        header["dtype_tag"] = dtype_tag
+    return header
+
+
+def _iter_array_blocks(
+    arr: "Union[np.ndarray, torch.Tensor]",
+    chunk_rows: int,
+    compress: Callable[[bytes, int], bytes],
+    level: int,
+) -> Iterator[str]:
+    """compress and base64 encode `arr` a block of `chunk_rows` rows at a time
+
+    slices of memmaps and CPU tensors are views, so only one block is in memory at once
+    """
+    for start in range(0, arr.shape[0], chunk_rows):
+        block, _ = array_to_numpy(arr[start : start + chunk_rows])
+        yield base64.b64encode(compress(_as_bytes(block), level)).decode()  # type: ignore[arg-type]
+
+
+def dump_array_chunked(
+    arr: "Union[np.ndarray, torch.Tensor]",
+    fp: TextIO,
+    codec: ArrayCodec = "zlib",
+    level: Optional[int] = None,
+    chunk_bytes: int = ARRAY_CHUNK_BYTES,
+) -> None:
+    """write `arr` to `fp` as json in `array_chunked_meta` mode, one block at a time
+
+    the output is the same as `json.dumps` of `serialize_array(..., array_mode="array_chunked_meta")`,
+    but only one block is in memory at once, so this works for memmaps and tensors larger than memory
+
+    # Parameters:
+     - `arr : np.ndarray | torch.Tensor`
+        array to write, with at least one dimension
+     - `fp : TextIO`
+        file-like object to write the json text to
+     - `codec : ArrayCodec`
+        compression codec for each block
+        (defaults to `"zlib"`)
+     - `level : int | None`
+        compression level, or `None` for the codec's default
+        (defaults to `None`)
+     - `chunk_bytes : int`
+        approximate uncompressed size of each block, rounded to a whole number of rows
+        (defaults to `ARRAY_CHUNK_BYTES`)
+    """
+    compress, _, default_level = get_array_codec(codec)
+    if level is None:
+        level = default_level
+    header: dict[str, Any] = _chunked_header(arr, codec, level, chunk_bytes)
+    chunk_rows: int = header["chunk_rows"]
+    # leave the closing brace off the header, and append the blocks under "data"
+    fp.write(json.dumps(header)[:-1] + ', "data": [')
+    for i, block in enumerate(_iter_array_blocks(arr, chunk_rows, compress, level)):
+        fp.write(f', "{block}"' if i else f'"{block}"')
+    fp.write("]}")
+
+
 @overload
 def serialize_array(
     jser: "JsonSerializer",
@@ -144,8 +683,19 @@ def serialize_array(
     `array_mode: ArrayMode` can be one of:
     - `list`: serialize as a list of values, no metadata (equivalent to `arr.tolist()`)
     - `array_list_meta`: serialize dict with metadata, actual list under the key `data`
+    - `array_text_meta`: serialize dict with metadata, the values as a comma-separated string under the key `data`,
+      see `array_to_text`. floats are written with `jser.array_text_precision` significant digits
     - `array_hex_meta`: serialize dict with metadata, actual hex string under the key `data`
     - `array_b64_meta`: serialize dict with metadata, actual base64 string under the key `data`
+    - `array_b64z_meta`: like `array_b64_meta`, but the bytes are compressed with `jser.array_codec` at
+      `jser.array_codec_level` first. the codec and level are stored under the keys `codec` and `level`
+    - `array_chunked_meta`: like `array_b64z_meta`, but the rows are split into blocks of about `jser.array_chunk_bytes`
+      which are compressed separately, with the list of blocks under the key `data` and the rows per block under
+      `chunk_rows`. only one block is copied at a time. see `dump_array_chunked` and `load_array_rows`
+    - `array_blob_meta`: serialize dict with metadata, with the bytes written to `jser.array_blob` (an `ArrayBlobWriter`)
+      and their location (`file`, `offset`, `nbytes`) under the key `data`
+    - `array_summary_meta`: serialize dict with metadata, and the `ARRAY_SUMMARY_KEYS` statistics from
+      `muutils.tensor_info.array_info` (without the median, which needs a sort) under the key `summary`, but no data
 
     for `array_list_meta`, `array_hex_meta`, and `array_b64_meta`, the serialized object is:
     ```
@@ -157,6 +707,13 @@ def serialize_array(
     }
     ```
 
+    if `jser.array_quantize` is set, float arrays are quantized (see `quantize_array`) in all modes except
+    `list`, `zero_dim`, and `array_chunked_meta`, with the original dtype under `orig_dtype` and the
+    parameters under `quantize`. `load_array` restores them
+
+    torch tensors are viewed as numpy arrays without copying where possible. for torch dtypes numpy lacks,
+    such as `bfloat16`, the original dtype is written under the key `dtype_tag`, see `array_to_numpy`
+
     # Parameters:
      - `arr : Any` array to serialize
      - `array_mode : ArrayMode` mode in which to serialize the array
@@ -174,11 +731,47 @@ def serialize_array(
         array_mode = jser.array_mode
 
     arr_type: str = f"{type(arr).__module__}.{type(arr).__name__}"
-    arr_np: np.ndarray = arr if isinstance(arr, np.ndarray) else np.array(arr)  # pyright: ignore[reportUnnecessaryIsInstance]
+
+    if array_mode == "array_chunked_meta" and len(arr.shape) > 0:
+        if getattr(jser, "array_quantize", None) is not None:
+            raise ValueError("array_quantize is not supported with array_chunked_meta")
+        # before converting to numpy, so that large tensors are only copied a block at a time
+        codec: str = getattr(jser, "array_codec", "zlib")
+        level: Optional[int] = getattr(jser, "array_codec_level", None)
+        compress, _, default_level = get_array_codec(codec)
+        if level is None:
+            level = default_level
+        chunked: dict[str, Any] = _chunked_header(
+            arr, codec, level, getattr(jser, "array_chunk_bytes", ARRAY_CHUNK_BYTES)
+        )
+        chunked["data"] = list(
+            _iter_array_blocks(arr, chunked["chunk_rows"], compress, level)
+        )
+        return chunked  # type: ignore[return-value]
+
+    # a view of CPU tensors, rather than a copy
+    arr_np: np.ndarray
+    dtype_tag: Optional[str]
+    arr_np, dtype_tag = array_to_numpy(arr, raw=array_mode not in _VALUE_ARRAY_MODES)
+
+    quantize_method: Optional[ArrayQuantize] = getattr(jser, "array_quantize", None)
+    quantize: Optional[QuantizeParams] = None
+    orig_dtype: str = str(arr_np.dtype)
+    if (
+        quantize_method is not None
+        and array_mode not in ("list", "array_summary_meta")
+        and len(arr.shape) > 0
+        and arr_np.dtype.kind == "f"
+    ):
+        arr_np, quantize = quantize_array(arr_np, quantize_method)
+
+    # when the output goes straight to a json backend which encodes numpy arrays natively
+    # (see `JsonSerializer.dumps`), skip building nested lists
+    native_arrays: bool = _NATIVE_ARRAYS.get()
 
     # Handle list mode first (no metadata needed)
     if array_mode == "list":
-        return arr_np.tolist()  # pyright: ignore[reportAny]
+        return arr_np if native_arrays else arr_np.tolist()  # type: ignore[return-value]  # pyright: ignore[reportAny, reportReturnType]
 
     # For all other modes, compute metadata once
     metadata: ArrayMetadata = arr_metadata(arr if len(arr.shape) == 0 else arr_np)
@@ -196,33 +789,85 @@ def serialize_array(
         )
 
     # Handle the metadata modes
+    result: SerializedArrayWithMeta
     if array_mode == "array_list_meta":
-        return SerializedArrayWithMeta(
+        result = SerializedArrayWithMeta(
             __muutils_format__=f"{arr_type}:array_list_meta",
-            data=arr_np.tolist(),  # pyright: ignore[reportAny]
+            data=arr_np if native_arrays else arr_np.tolist(),  # type: ignore[typeddict-item]  # pyright: ignore[reportAny]
+            shape=metadata["shape"],
+            dtype=metadata["dtype"],
+            n_elements=metadata["n_elements"],
+        )
+    elif array_mode == "array_text_meta":
+        result = SerializedArrayWithMeta(
+            __muutils_format__=f"{arr_type}:array_text_meta",
+            data=array_to_text(arr_np, getattr(jser, "array_text_precision", None)),
             shape=metadata["shape"],
             dtype=metadata["dtype"],
             n_elements=metadata["n_elements"],
         )
     elif array_mode == "array_hex_meta":
-        return SerializedArrayWithMeta(
+        result = SerializedArrayWithMeta(
             __muutils_format__=f"{arr_type}:array_hex_meta",
-            data=arr_np.tobytes().hex(),
+            data=_as_bytes(arr_np).data.hex(),
             shape=metadata["shape"],
             dtype=metadata["dtype"],
             n_elements=metadata["n_elements"],
         )
     elif array_mode == "array_b64_meta":
-        return SerializedArrayWithMeta(
+        result = SerializedArrayWithMeta(
             __muutils_format__=f"{arr_type}:array_b64_meta",
-            data=base64.b64encode(arr_np.tobytes()).decode(),
+            data=base64.b64encode(_as_bytes(arr_np)).decode(),  # type: ignore[arg-type]
             shape=metadata["shape"],
             dtype=metadata["dtype"],
             n_elements=metadata["n_elements"],
         )
+    elif array_mode == "array_b64z_meta":
+        codec = getattr(jser, "array_codec", "zlib")
+        level = getattr(jser, "array_codec_level", None)
+        compress, _, default_level = get_array_codec(codec)
+        if level is None:
+            level = default_level
+        result = SerializedArrayCompressed(
+            __muutils_format__=f"{arr_type}:array_b64z_meta",
+            data=base64.b64encode(compress(_as_bytes(arr_np), level)).decode(),  # type: ignore[arg-type]
+            shape=metadata["shape"],
+            dtype=metadata["dtype"],
+            n_elements=metadata["n_elements"],
+            codec=codec,
+            level=level,
+        )
+    elif array_mode == "array_blob_meta":
+        blob: Optional[ArrayBlobWriter] = getattr(jser, "array_blob", None)
+        if blob is None:
+            raise ValueError(
+                "array_mode 'array_blob_meta' requires an `ArrayBlobWriter`, pass one as `JsonSerializer(array_blob=...)`"
+            )
+        result = SerializedArrayWithMeta(
+            __muutils_format__=f"{arr_type}:array_blob_meta",
+            data=blob.write(arr_np),
+            shape=metadata["shape"],
+            dtype=metadata["dtype"],
+            n_elements=metadata["n_elements"],
+        )
+    elif array_mode == "array_summary_meta":
+        result = SerializedArraySummary(  # type: ignore[assignment]
+            __muutils_format__=f"{arr_type}:array_summary_meta",
+            shape=metadata["shape"],
+            dtype=metadata["dtype"],
+            n_elements=metadata["n_elements"],
+            summary=array_summary_stats(arr_np),
+        )
     else:
         raise KeyError(f"invalid array_mode: {array_mode}")
 
+    if dtype_tag is not None:
+        result["dtype_tag"] = dtype_tag  # type: ignore[typeddict-unknown-key]
+    if quantize is not None:
+        result["orig_dtype"] = orig_dtype  # type: ignore[typeddict-unknown-key]
+        result["quantize"] = quantize  # type: ignore[typeddict-unknown-key]
+    return result
+
 
 @overload
 def infer_array_mode(
@@ -246,6 +891,11 @@ def infer_array_mode(
             if not isinstance(arr_data, Iterable):
                 raise ValueError(f"invalid list format: {type(arr_data) = }\t{arr}")
             return_mode = "array_list_meta"
+        elif fmt.endswith(":array_text_meta"):
+            arr_data = arr["data"]  # ty: ignore[invalid-argument-type]
+            if not isinstance(arr_data, str):
+                raise ValueError(f"invalid text format: {type(arr_data) = }\t{arr}")
+            return_mode = "array_text_meta"
         elif fmt.endswith(":array_hex_meta"):
             arr_data = arr["data"]  # ty: ignore[invalid-argument-type]
             if not isinstance(arr_data, str):
@@ -256,6 +906,23 @@ def infer_array_mode(
             if not isinstance(arr_data, str):
                 raise ValueError(f"invalid b64 format: {type(arr_data) = }\t{arr}")
             return_mode = "array_b64_meta"
+        elif fmt.endswith(":array_b64z_meta"):
+            arr_data = arr["data"]  # ty: ignore[invalid-argument-type]
+            if not isinstance(arr_data, str):
+                raise ValueError(f"invalid b64z format: {type(arr_data) = }\t{arr}")
+            return_mode = "array_b64z_meta"
+        elif fmt.endswith(":array_chunked_meta"):
+            arr_data = arr["data"]  # ty: ignore[invalid-argument-type]
+            if not isinstance(arr_data, list):
+                raise ValueError(f"invalid chunked format: {type(arr_data) = }\t{arr}")
+            return_mode = "array_chunked_meta"
+        elif fmt.endswith(":array_blob_meta"):
+            arr_data = arr["data"]  # ty: ignore[invalid-argument-type]
+            if not isinstance(arr_data, typing.Mapping) or "offset" not in arr_data:
+                raise ValueError(f"invalid blob format: {type(arr_data) = }\t{arr}")
+            return_mode = "array_blob_meta"
+        elif fmt.endswith(":array_summary_meta"):
+            return_mode = "array_summary_meta"
         elif fmt.endswith(":external"):
             return_mode = "external"
         elif fmt.endswith(":zero_dim"):
@@ -274,28 +941,43 @@ def infer_array_mode(
 def load_array(
     arr: SerializedArrayWithMeta,
     array_mode: Optional[ArrayModeWithMeta] = None,
+    blob_dir: Union[str, "os.PathLike[str]", None] = None,
+    dtype: "Union[str, np.dtype, type, None]" = None,
 ) -> np.ndarray: ...
 @overload
 def load_array(
     arr: NumericList,
     array_mode: Optional[Literal["list"]] = None,
+    blob_dir: Union[str, "os.PathLike[str]", None] = None,
+    dtype: "Union[str, np.dtype, type, None]" = None,
 ) -> np.ndarray: ...
 @overload
 def load_array(
     arr: np.ndarray,
     array_mode: None = None,
+    blob_dir: Union[str, "os.PathLike[str]", None] = None,
+    dtype: "Union[str, np.dtype, type, None]" = None,
 ) -> np.ndarray: ...
 def load_array(
     arr: Union[SerializedArrayWithMeta, np.ndarray, NumericList],
     array_mode: Optional[ArrayMode] = None,
+    blob_dir: Union[str, "os.PathLike[str]", None] = None,
+    dtype: "Union[str, np.dtype, type, None]" = None,
 ) -> np.ndarray:
-    """load a json-serialized array, infer the mode if not specified"""
+    """load a json-serialized array, infer the mode if not specified
+
+    arrays in `array_blob_meta` mode are returned as read-only `np.memmap`s of the sidecar file, without
+    copying. relative sidecar paths are resolved relative to `blob_dir` if given, otherwise the working directory
+
+    quantized arrays (see `quantize_array`) are restored to `dtype` if given, otherwise to their original dtype.
+    other arrays are converted to `dtype` if given
+    """
     # return arr if its already a numpy array
     if isinstance(arr, np.ndarray):
         assert array_mode is None, (
             "array_mode should not be specified when loading a numpy array, since that is a no-op"
         )
-        return arr
+        return arr if dtype is None else arr.astype(dtype, copy=False)
 
     # try to infer the array_mode
     array_mode_inferred: ArrayMode = infer_array_mode(arr)
@@ -306,7 +988,42 @@ def load_array(
             f"array_mode {array_mode} does not match inferred array_mode {array_mode_inferred}"
         )
 
-    # actually load the array
+    data: np.ndarray = _load_array_mode(arr, array_mode, blob_dir)
+
+    if isinstance(arr, typing.Mapping) and arr.get("quantize") is not None:
+        quantized: SerializedArrayQuantized = typing.cast(SerializedArrayQuantized, arr)
+        return dequantize_array(
+            data,
+            quantized["quantize"],
+            dtype if dtype is not None else quantized["orig_dtype"],
+        )
+    if dtype is not None:
+        return data.astype(dtype, copy=False)
+    return data
+
+
+def array_summary_stats(arr: np.ndarray, hist_bins: int = 5) -> dict[str, Any]:
+    """the `ARRAY_SUMMARY_KEYS` statistics of `arr` from `muutils.tensor_info.array_info`, as json-serializable values"""
+    from muutils.tensor_info import array_info
+
+    info: dict[str, Any] = array_info(arr, hist_bins=hist_bins, median=False)
+    summary: dict[str, Any] = dict()
+    for key in ARRAY_SUMMARY_KEYS:
+        value: Any = info[key]
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        elif isinstance(value, np.generic):
+            value = value.item()
+        summary[key] = value
+    return summary
+
+
+def _load_array_mode(
+    arr: Union[SerializedArrayWithMeta, NumericList],
+    array_mode: ArrayMode,
+    blob_dir: Union[str, "os.PathLike[str]", None],
+) -> np.ndarray:
+    """load the data of a json-serialized array as stored, in the given mode"""
     if array_mode == "array_list_meta":
         assert isinstance(arr, typing.Mapping), (
             f"invalid list format: {type(arr) = }\n{arr = }"
@@ -330,11 +1047,58 @@ def load_array(
         data = np.frombuffer(base64.b64decode(arr["data"]), dtype=arr["dtype"])  # type: ignore
         return data.reshape(arr["shape"])  # type: ignore
 
+    elif array_mode == "array_text_meta":
+        assert isinstance(arr, typing.Mapping), (
+            f"invalid text format: {type(arr) = }\n{arr = }"
+        )
+        return array_from_text(arr["data"], arr["dtype"], arr["shape"])  # type: ignore[arg-type]
+
+    elif array_mode == "array_b64z_meta":
+        assert isinstance(arr, typing.Mapping), (
+            f"invalid b64z format: {type(arr) = }\n{arr = }"
+        )
+        _, decompress, _ = get_array_codec(arr["codec"])  # type: ignore[typeddict-item]
+        data = np.frombuffer(
+            decompress(base64.b64decode(arr["data"])),  # type: ignore[arg-type]
+            dtype=arr["dtype"],  # type: ignore[arg-type]
+        )
+        return data.reshape(arr["shape"])  # type: ignore
+
+    elif array_mode == "array_chunked_meta":
+        assert isinstance(arr, typing.Mapping), (
+            f"invalid chunked format: {type(arr) = }\n{arr = }"
+        )
+        return _load_array_blocks(arr, 0, len(arr["data"]))  # type: ignore[arg-type]
+
+    elif array_mode == "array_blob_meta":
+        assert isinstance(arr, typing.Mapping), (
+            f"invalid blob format: {type(arr) = }\n{arr = }"
+        )
+        blob_ref: ArrayBlobRef = arr["data"]  # type: ignore[assignment]
+        file: str = blob_ref["file"]
+        if blob_dir is not None:
+            file = os.path.join(blob_dir, file)
+        shape: tuple[int, ...] = tuple(arr["shape"])  # type: ignore[arg-type]
+        if blob_ref["nbytes"] == 0:
+            # `np.memmap` can't map zero bytes
+            return np.empty(shape, dtype=arr["dtype"])  # type: ignore[arg-type]
+        return np.memmap(
+            file,
+            dtype=arr["dtype"],  # type: ignore[arg-type]
+            mode="r",
+            offset=blob_ref["offset"],
+            shape=shape,
+        )
+
     elif array_mode == "list":
         assert isinstance(arr, typing.Sequence), (
             f"invalid list format: {type(arr) = }\n{arr = }"
         )
         return np.array(arr)  # type: ignore
+    elif array_mode == "array_summary_meta":
+        raise ValueError(
+            "arrays serialized with 'array_summary_meta' only store statistics, the data can't be loaded"
+        )
     elif array_mode == "external":
         assert isinstance(arr, typing.Mapping)
         if "data" not in arr:
@@ -351,3 +1115,57 @@ def load_array(
         return data
     else:
         raise ValueError(f"invalid array_mode: {array_mode}")  # pyright: ignore[reportUnreachable]
+
+
+def _load_array_blocks(
+    arr: SerializedArrayChunked, first: int, stop: int
+) -> np.ndarray:
+    """decode blocks `first` up to `stop` of an `array_chunked_meta` array into one array of rows"""
+    _, decompress, _ = get_array_codec(arr["codec"])
+    shape: list[int] = list(arr["shape"])
+    chunk_rows: int = arr["chunk_rows"]
+    start_row: int = first * chunk_rows
+    n_rows: int = max(0, min(shape[0], stop * chunk_rows) - start_row)
+    out: np.ndarray = np.empty([n_rows] + shape[1:], dtype=arr["dtype"])
+    # write each block straight into the output, rather than concatenating
+    out_flat: np.ndarray = out.reshape(-1)
+    offset: int = 0
+    blocks: list[str] = typing.cast("list[str]", arr["data"])
+    for block in blocks[first:stop]:
+        values: np.ndarray = np.frombuffer(
+            decompress(base64.b64decode(block)),
+            dtype=out.dtype,
+        )
+        out_flat[offset : offset + values.size] = values
+        offset += values.size
+    if offset != out_flat.size:
+        raise ValueError(f"expected {out_flat.size} values, but decoded {offset}")
+    return out
+
+
+def load_array_rows(
+    arr: Union[SerializedArrayWithMeta, np.ndarray, NumericList],
+    rows: slice,
+) -> np.ndarray:
+    """load only `rows` (a slice along the first axis) of a json-serialized array
+
+    for `array_chunked_meta` arrays, only the blocks containing the requested rows are decoded.
+    for other modes this is the same as `load_array(arr)[rows]`
+    """
+    if infer_array_mode(arr) != "array_chunked_meta":  # type: ignore[arg-type]
+        return load_array(arr)[rows]
+    chunked: SerializedArrayChunked = arr  # type: ignore[assignment]
+    chunk_rows: int = chunked["chunk_rows"]
+    indices: range = range(*rows.indices(chunked["shape"][0]))
+    if len(indices) == 0:
+        return np.empty([0] + list(chunked["shape"][1:]), dtype=chunked["dtype"])
+    lo: int = min(indices[0], indices[-1])
+    hi: int = max(indices[0], indices[-1])
+    first: int = lo // chunk_rows
+    decoded: np.ndarray = _load_array_blocks(chunked, first, hi // chunk_rows + 1)
+    base: int = first * chunk_rows
+    return decoded[
+        slice(indices.start - base, indices.stop - base, indices.step)
+        if indices.stop - base >= 0
+        else slice(indices.start - base, None, indices.step)
+    ]
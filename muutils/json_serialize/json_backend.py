@@ -0,0 +1,192 @@
+"""pluggable json encoding backends: stdlib `json`, [`orjson`](https://github.com/ijl/orjson), or [`msgspec`](https://github.com/jcrist/msgspec)
+
+writers across muutils (`jsonl_write`, the loggers, `SerializableDataclass.__hash__`, etc.) encode
+via `json_dumps` and `json_loads` from this module, so switching the backend speeds all of them up
+without changing call sites. the backend is selected once, either by setting the environment variable
+`MUUTILS_JSON_BACKEND` to one of `JsonBackendName` before importing muutils, or by calling `set_json_backend`.
+a `JsonSerializer` can also use a specific backend via its `json_backend` argument.
+
+- `stdlib` is the default, and always available
+- `orjson` is fastest, and encodes numpy arrays natively. `JsonSerializer.dumps` with the `array_list_meta`
+  or `list` array modes then skips converting arrays to nested lists
+- `msgspec` is also much faster than stdlib
+- `auto` picks the first of `orjson`, `msgspec`, `stdlib` which is installed
+
+note that `orjson` and `msgspec` produce compact output (no spaces after separators) and write
+`NaN` and `inf` as `null`, whereas stdlib writes them as the (non-standard) `NaN` and `Infinity`.
+if a requested backend is not installed, a warning is emitted and stdlib is used instead.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import os
+import warnings
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Literal, Optional, Union
+
+JsonBackendName = Literal["stdlib", "orjson", "msgspec", "auto"]
+
+JSON_BACKEND_ENV_VAR: str = "MUUTILS_JSON_BACKEND"
+
+# when set, `serialize_array` leaves numpy arrays in place for the list modes instead of calling
+# `.tolist()`, since the output is going straight to a backend which encodes them natively.
+# set only by `JsonSerializer.dumps`
+_NATIVE_ARRAYS: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "_NATIVE_ARRAYS", default=False
+)
+
+
+@dataclass(frozen=True)
+class JsonBackend:
+    """a json encoding backend
+
+    # Parameters:
+     - `name : str` name of the backend
+     - `dumps : Callable[[Any], str]` encode a `JSONitem` to a json string
+     - `loads : Callable[[Union[str, bytes]], Any]` decode a json string
+     - `native_numpy : bool` whether `dumps` encodes numpy arrays directly
+    """
+
+    name: str
+    dumps: Callable[[Any], str]
+    loads: Callable[[Union[str, bytes]], Any]
+    native_numpy: bool = False
+
+
+def _tolist_default(obj: Any) -> Any:  # pyright: ignore[reportAny]
+    """fallback for objects the backend can't encode: arrays and numpy scalars via `.tolist()`"""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()  # pyright: ignore[reportAny]
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")  # pyright: ignore[reportAny]
+
+
+def _fallback_dumps(obj: Any) -> str:  # pyright: ignore[reportAny]
+    """stdlib encoding for when a faster backend fails, also handling arrays left in place for that backend"""
+    return json.dumps(obj, default=_tolist_default)
+
+
+def _make_stdlib_backend() -> JsonBackend:
+    return JsonBackend(
+        name="stdlib",
+        dumps=json.dumps,
+        loads=json.loads,
+        native_numpy=False,
+    )
+
+
+def _make_orjson_backend() -> JsonBackend:
+    import orjson  # type: ignore[import-not-found]  # pyright: ignore[reportMissingImports]
+
+    option: int = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+
+    def orjson_dumps(obj: Any) -> str:  # pyright: ignore[reportAny]
+        try:
+            return orjson.dumps(obj, default=_tolist_default, option=option).decode()  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        except TypeError:
+            # `orjson.JSONEncodeError` is a `TypeError`. raised for things like ints wider than 64 bits
+            return _fallback_dumps(obj)
+
+    return JsonBackend(
+        name="orjson",
+        dumps=orjson_dumps,
+        loads=orjson.loads,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+        native_numpy=True,
+    )
+
+
+def _make_msgspec_backend() -> JsonBackend:
+    import msgspec  # type: ignore[import-not-found]  # pyright: ignore[reportMissingImports]
+
+    encoder = msgspec.json.Encoder(enc_hook=_tolist_default)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+    decoder = msgspec.json.Decoder()  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+
+    def msgspec_dumps(obj: Any) -> str:  # pyright: ignore[reportAny]
+        try:
+            return encoder.encode(obj).decode()  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        except (TypeError, OverflowError):
+            return _fallback_dumps(obj)
+
+    return JsonBackend(
+        name="msgspec",
+        dumps=msgspec_dumps,
+        loads=decoder.decode,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+        native_numpy=False,
+    )
+
+
+_BACKEND_FACTORIES: Dict[str, Callable[[], JsonBackend]] = {
+    "stdlib": _make_stdlib_backend,
+    "orjson": _make_orjson_backend,
+    "msgspec": _make_msgspec_backend,
+}
+
+# backends are only constructed (and their packages imported) on first use
+_BACKENDS: Dict[str, JsonBackend] = dict()
+
+
+def get_json_backend(name: Optional[JsonBackendName] = None) -> JsonBackend:
+    """get a json backend by name, or the currently selected one if `name` is `None`
+
+    falls back to stdlib with a warning if the requested backend is not installed
+
+    # Raises:
+     - `ValueError` : if `name` is not a valid `JsonBackendName`
+    """
+    if name is None:
+        return _CURRENT_BACKEND
+
+    if name == "auto":
+        for candidate in ("orjson", "msgspec"):
+            try:
+                return _get_backend_exact(candidate)
+            except ImportError:
+                continue
+        return _get_backend_exact("stdlib")
+
+    if name not in _BACKEND_FACTORIES:
+        raise ValueError(
+            f"unknown json backend {name = }, expected one of {list(_BACKEND_FACTORIES) + ['auto']}"
+        )
+
+    try:
+        return _get_backend_exact(name)
+    except ImportError as e:
+        warnings.warn(
+            f"json backend {name = } requested but could not be imported, falling back to stdlib json:\n{e}",
+            ImportWarning,
+        )
+        return _get_backend_exact("stdlib")
+
+
+def _get_backend_exact(name: str) -> JsonBackend:
+    if name not in _BACKENDS:
+        _BACKENDS[name] = _BACKEND_FACTORIES[name]()
+    return _BACKENDS[name]
+
+
+def set_json_backend(name: JsonBackendName) -> JsonBackend:
+    """select the backend used by `json_dumps` and `json_loads`, returning it"""
+    global _CURRENT_BACKEND
+    _CURRENT_BACKEND = get_json_backend(name)
+    return _CURRENT_BACKEND
+
+
+def json_dumps(obj: Any) -> str:  # pyright: ignore[reportAny]
+    """encode a `JSONitem` to a json string with the selected backend"""
+    return _CURRENT_BACKEND.dumps(obj)
+
+
+def json_loads(s: Union[str, bytes]) -> Any:  # pyright: ignore[reportAny]
+    """decode a json string with the selected backend"""
+    return _CURRENT_BACKEND.loads(s)
+
+
+_CURRENT_BACKEND: JsonBackend = _make_stdlib_backend()
+try:
+    set_json_backend(
+        os.environ.get(JSON_BACKEND_ENV_VAR, "stdlib")  # type: ignore[arg-type]
+    )
+except ValueError as e:
+    warnings.warn(f"invalid {JSON_BACKEND_ENV_VAR}, using stdlib json: {e}")
@@ -0,0 +1,483 @@
+"""loading of objects serialized by `json_serialize`, the inverse of `muutils.json_serialize.json_serialize`
+
+- `LoaderHandler` defines how to load items with a specific `__muutils_format__`
+- `JsonLoader` holds a registry of loader handlers, keyed by format
+- `json_load` loads with the default configuration
+
+a loader handler is looked up by the "format key" of an item's `__muutils_format__` value (see `format_key`),
+so each node costs a single dict lookup no matter how many handlers are registered.
+`DEFAULT_LOADER_HANDLERS` reconstruct everything `DEFAULT_HANDLERS` write with a format:
+sets, frozensets, numpy arrays, torch tensors, pandas DataFrames, and serializable dataclasses
+(including lists of them written by `SerializableDataclass.serialize_many`, which load as lists).
+arrays serialized with `array_summary_meta` have no data, and are loaded as plain dicts.
+anything without a format key (or with an unknown one) is loaded as plain dicts and lists.
+
+with `lazy=True`, dicts and lists are wrapped in read-only `LazyLoadedDict` and `LazyLoadedList`
+views, and items inside them are only loaded when first accessed
+
+an item with a format which is reached more than once in one call to `load` (as after `resolve_refs`) is only
+loaded once, so shared objects stay shared. shared numpy arrays are made read-only. with `resolve_refs=True`,
+the `$ref`s written by `JsonSerializer(shared_refs=True)` or `JsonSerializer(array_dedup=True)` are resolved first
+
+"""
+
+from __future__ import annotations
+
+import contextvars
+import warnings
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from muutils.errormode import ErrorMode
+from muutils.json_serialize.json_serialize import ObjectPath
+from muutils.json_serialize.serializable_dataclass import (
+    _COLUMNAR_FORMAT_SUFFIX,  # pyright: ignore[reportPrivateUsage]
+    _SERIALIZABLE_DATACLASS_FORMATS,  # pyright: ignore[reportPrivateUsage]
+)
+from muutils.json_serialize.types import _FORMAT_KEY  # pyright: ignore[reportPrivateUsage]
+from muutils.json_serialize.util import JSONitem, MonoTuple
+from muutils.json_serialize.util import resolve_refs as _resolve_refs
+
+if TYPE_CHECKING:
+    from muutils.json_serialize.array import SerializedArrayWithMeta
+
+# pyright: reportAny=false, reportExplicitAny=false
+
+
+def format_key(fmt: str) -> str:
+    """the key under which the loader handler for a `__muutils_format__` value is registered
+
+    this is the part before the first `:`, so `"numpy.ndarray:array_list_meta"` maps to `"numpy.ndarray"`.
+    formats of the form `"Name(Kind)"` map to `"(Kind)"`, so `"MyClass(SerializableDataclass)"`
+    maps to `"(SerializableDataclass)"`
+    """
+    key: str = fmt.split(":", 1)[0]
+    if key.endswith(")") and "(" in key:
+        key = key[key.index("(") :]
+    return key
+
+
+@dataclass
+class LoaderHandler:
+    """a handler for loading items with a specific format
+
+    # Parameters:
+     - `key : str` format key this handler is registered under, see `format_key`
+     - `load_func : Callable[[JsonLoader, dict, ObjectPath], Any]` takes a `JsonLoader`, the serialized
+       dict (whose children are not yet loaded), and the current path, returns the loaded object
+     - `uid : str` unique identifier for the handler
+     - `desc : str` description of the handler
+    """
+
+    key: str
+    load_func: Callable[["JsonLoader", "dict[str, Any]", ObjectPath], Any]
+    uid: str
+    desc: str
+
+
+# id of each item with a format loaded so far in the current call to `JsonLoader.load` -> (item, loaded object).
+# the item is kept so its id can't be reused
+_SharedItems = Dict[int, Tuple[Any, Any]]
+
+_SHARED_ITEMS: contextvars.ContextVar[Optional[_SharedItems]] = contextvars.ContextVar(
+    "_SHARED_ITEMS", default=None
+)
+
+
+def _as_hashable(x: Any) -> Any:
+    """turn lists back into tuples, since set elements which were written as lists must have been hashable"""
+    if isinstance(x, list):
+        return tuple(_as_hashable(y) for y in x)
+    return x
+
+
+def _load_set(loader: "JsonLoader", item: dict[str, Any], path: ObjectPath) -> Any:
+    data: list[Any] = [
+        _as_hashable(loader.load(x, tuple(path) + (i,), lazy=False))
+        for i, x in enumerate(item["data"])
+    ]
+    return set(data) if item[_FORMAT_KEY] == "set" else frozenset(data)
+
+
+def _is_array_summary(item: dict[str, Any]) -> bool:
+    """arrays serialized in `array_summary_meta` mode have no data, so are kept as dicts"""
+    return str(item[_FORMAT_KEY]).endswith(":array_summary_meta")
+
+
+def _load_numpy(loader: "JsonLoader", item: dict[str, Any], path: ObjectPath) -> Any:
+    from muutils.json_serialize.array import load_array
+
+    if _is_array_summary(item):
+        return item
+    return load_array(cast("SerializedArrayWithMeta", item))
+
+
+def _load_torch(loader: "JsonLoader", item: dict[str, Any], path: ObjectPath) -> Any:
+    import torch
+
+    from muutils.json_serialize.array import load_array
+
+    if _is_array_summary(item):
+        return item
+    arr: Any = load_array(cast("SerializedArrayWithMeta", item))
+    if not arr.flags.writeable:
+        # `torch.from_numpy` warns about read-only arrays, such as those from `np.frombuffer`
+        arr = arr.copy()
+    # zero-dimensional tensors record a torch dtype such as "torch.float32", which numpy doesn't use,
+    # and dtypes numpy lacks, such as "torch.bfloat16", are recorded under "dtype_tag"
+    dtype_name: str = str(item.get("dtype_tag", item.get("dtype", "")))
+    torch_dtype: Any = None
+    if dtype_name.startswith("torch."):
+        torch_dtype = getattr(torch, dtype_name[len("torch.") :], None)
+        if not isinstance(torch_dtype, torch.dtype):
+            torch_dtype = None
+    if (
+        torch_dtype is not None
+        and arr.dtype.kind == "u"
+        and arr.dtype.itemsize == torch.empty((), dtype=torch_dtype).element_size()
+    ):
+        # raw bytes stored as unsigned ints of the same size, torch only has signed views for all sizes
+        return torch.from_numpy(arr.view(f"int{arr.dtype.itemsize * 8}")).view(
+            torch_dtype
+        )
+    tensor: Any = torch.from_numpy(arr)
+    if torch_dtype is not None:
+        tensor = tensor.to(torch_dtype)
+    return tensor
+
+
+def _load_pandas(loader: "JsonLoader", item: dict[str, Any], path: ObjectPath) -> Any:
+    import pandas as pd  # type: ignore[import-untyped]
+
+    return pd.DataFrame.from_records(item["data"], columns=item["columns"])
+
+
+def _load_serializable_dataclass(
+    loader: "JsonLoader", item: dict[str, Any], path: ObjectPath
+) -> Any:
+    fmt: str = item[_FORMAT_KEY]
+    columnar: bool = fmt.endswith(_COLUMNAR_FORMAT_SUFFIX)
+    if columnar:
+        fmt = fmt[: -len(_COLUMNAR_FORMAT_SUFFIX)]
+    cls: Optional[type] = _SERIALIZABLE_DATACLASS_FORMATS.get(fmt)
+    if cls is None:
+        raise KeyError(
+            f"no serializable dataclass registered for format {fmt!r}, is the module defining it imported?"
+        )
+    if columnar:
+        return cls.load_many(item)  # type: ignore[attr-defined]
+    return cls.load(item)  # type: ignore[attr-defined]
+
+
+DEFAULT_LOADER_HANDLERS: MonoTuple[LoaderHandler] = (
+    LoaderHandler(
+        key="set",
+        load_func=_load_set,
+        uid="set",
+        desc="sets, from dicts with format key",
+    ),
+    LoaderHandler(
+        key="frozenset",
+        load_func=_load_set,
+        uid="frozenset",
+        desc="frozensets, from dicts with format key",
+    ),
+    LoaderHandler(
+        key="numpy.ndarray",
+        load_func=_load_numpy,
+        uid="numpy.ndarray",
+        desc="numpy arrays, via `load_array`",
+    ),
+    LoaderHandler(
+        key="torch.Tensor",
+        load_func=_load_torch,
+        uid="torch.Tensor",
+        desc="pytorch tensors, via `load_array`",
+    ),
+    LoaderHandler(
+        key="pandas.DataFrame",
+        load_func=_load_pandas,
+        uid="pandas.DataFrame",
+        desc="pandas DataFrames, from records",
+    ),
+    LoaderHandler(
+        key="(SerializableDataclass)",
+        load_func=_load_serializable_dataclass,
+        uid="SerializableDataclass",
+        desc="serializable dataclasses, looked up by class name and loaded with `.load()`, or `.load_many()` for the columnar format",
+    ),
+)
+
+
+class JsonLoader:
+    """Json loading class (holds configs), the inverse of `JsonSerializer`
+
+    # Parameters:
+    - `handlers_pre : MonoTuple[LoaderHandler]`
+    handlers to register, taking priority over the default handlers with the same key
+    (defaults to `tuple()`)
+    - `handlers_default : MonoTuple[LoaderHandler]`
+    default handlers to register
+    (defaults to `DEFAULT_LOADER_HANDLERS`)
+    - `error_mode : ErrorMode`
+    what to do when a handler fails to load an item. if "ignore" or "warn", the item is loaded as a plain dict instead
+    (defaults to `"except"`)
+    - `lazy : bool`
+    default for `load`: whether to return `LazyLoadedDict` and `LazyLoadedList` views which only load items when accessed
+    (defaults to `False`)
+    - `resolve_refs : bool`
+    whether `load` first replaces `{"$ref": ...}` references with the items they point to,
+    see `muutils.json_serialize.util.resolve_refs`. this modifies the data passed to `load` in place
+    (defaults to `False`)
+
+    # Raises:
+    - `ValueError`: on init, if `args` is not empty
+    - `SerializationException`: on `load()`, if a handler fails and `error_mode` is `ErrorMode.EXCEPT`
+    """
+
+    def __init__(
+        self,
+        *args: None,
+        handlers_pre: MonoTuple[LoaderHandler] = (),
+        handlers_default: MonoTuple[LoaderHandler] = DEFAULT_LOADER_HANDLERS,
+        error_mode: ErrorMode = ErrorMode.EXCEPT,
+        lazy: bool = False,
+        resolve_refs: bool = False,
+    ):
+        if len(args) > 0:
+            raise ValueError(f"JsonLoader takes no positional arguments!\n{args = }")
+
+        self.error_mode: ErrorMode = ErrorMode.from_any(error_mode)
+        self.lazy: bool = lazy
+        self.resolve_refs: bool = resolve_refs
+        self.registry: dict[str, LoaderHandler] = dict()
+        for handler in tuple(handlers_default) + tuple(handlers_pre):
+            self.register(handler)
+
+    def register(self, handler: LoaderHandler) -> None:
+        """register `handler` under its key, replacing any existing handler for that key"""
+        self.registry[handler.key] = handler
+
+    def get_handler(self, item: Any) -> Optional[LoaderHandler]:
+        """the handler for `item`, or `None` if it is not a dict with a registered format"""
+        if type(item) is not dict:
+            return None
+        fmt: Any = item.get(_FORMAT_KEY)
+        if not isinstance(fmt, str):
+            return None
+        return self.registry.get(format_key(fmt))
+
+    def load(
+        self,
+        item: JSONitem,
+        path: ObjectPath = (),
+        lazy: Optional[bool] = None,
+    ) -> Any:
+        """load `item`, reconstructing any objects with a registered format
+
+        # Parameters:
+         - `item : JSONitem`
+            the serialized data, as read from json
+         - `path : ObjectPath`
+            path to the item, used in error messages
+            (defaults to `()`)
+         - `lazy : bool | None`
+            whether to wrap dicts and lists in views which load their items on access. if `None`, uses `self.lazy`
+            (defaults to `None`)
+        """
+        if lazy is None:
+            lazy = self.lazy
+        if _SHARED_ITEMS.get() is not None:
+            # called by a handler, within an outer `load`
+            return self._load(item, path, lazy)
+
+        if self.resolve_refs and isinstance(item, (dict, list)):
+            item = _resolve_refs(item)
+        return self._load_shared(item, path, lazy, dict())
+
+    def _load_shared(
+        self, item: JSONitem, path: ObjectPath, lazy: bool, shared: _SharedItems
+    ) -> Any:
+        """`_load` with `shared` as the record of items loaded so far"""
+        token: contextvars.Token[Optional[_SharedItems]] = _SHARED_ITEMS.set(shared)
+        try:
+            return self._load(item, path, lazy)
+        finally:
+            _SHARED_ITEMS.reset(token)
+
+    def _load(self, item: JSONitem, path: ObjectPath, lazy: bool) -> Any:
+        if isinstance(item, dict):
+            handler: Optional[LoaderHandler] = self.get_handler(item)
+            if handler is not None:
+                shared: Optional[_SharedItems] = _SHARED_ITEMS.get()
+                if shared is not None:
+                    seen: Optional[tuple[Any, Any]] = shared.get(id(item))
+                    if seen is not None:
+                        if str(type(seen[1])) == "<class 'numpy.ndarray'>":
+                            seen[1].flags.writeable = False
+                        return seen[1]
+                try:
+                    loaded: Any = handler.load_func(self, item, path)
+                except Exception as e:
+                    self._handle_error(e, item, path, handler)
+                else:
+                    if shared is not None:
+                        shared[id(item)] = (item, loaded)
+                    return loaded
+            if lazy:
+                return LazyLoadedDict(self, item, path, _SHARED_ITEMS.get())
+            return {
+                k: self._load(v, tuple(path) + (k,), lazy=False)
+                for k, v in item.items()
+            }
+        elif isinstance(item, list):
+            if lazy:
+                return LazyLoadedList(self, item, path, _SHARED_ITEMS.get())
+            return [
+                self._load(x, tuple(path) + (i,), lazy=False)
+                for i, x in enumerate(item)
+            ]
+        return item
+
+    def _handle_error(
+        self,
+        e: Exception,
+        item: dict[str, Any],
+        path: ObjectPath,
+        handler: LoaderHandler,
+    ) -> None:
+        """raise or warn according to `error_mode`. if this returns, the item is loaded as a plain dict"""
+        from muutils.json_serialize.util import SerializationException
+
+        if self.error_mode == ErrorMode.EXCEPT:
+            item_str: str = repr(item)
+            if len(item_str) > 1000:
+                item_str = item_str[:1000] + "..."
+            raise SerializationException(
+                f"error loading at {path = } with handler: '{handler.uid}'\nfrom: {e}\nitem: {item_str}"
+            ) from e
+        elif self.error_mode == ErrorMode.WARN:
+            warnings.warn(
+                f"error loading at {path = } with handler '{handler.uid}', will load as plain dict\nexception = {e}"
+            )
+
+
+class LazyLoadedDict(Mapping[str, Any]):
+    """read-only view of a serialized dict, which loads each value the first time it is accessed
+
+    returned by `JsonLoader.load` with `lazy=True`. `dict(x)` loads everything into a plain dict
+    (whose nested dicts and lists are still lazy)
+    """
+
+    def __init__(
+        self,
+        loader: JsonLoader,
+        data: dict[str, Any],
+        path: ObjectPath,
+        shared: Optional[_SharedItems] = None,
+    ):
+        self._loader: JsonLoader = loader
+        self._data: dict[str, Any] = data
+        self._path: ObjectPath = tuple(path)
+        # items loaded so far by the `load` call this view came from, so that shared items stay shared
+        self._shared: _SharedItems = shared if shared is not None else dict()
+        self._loaded: dict[str, Any] = dict()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._loaded[key]
+        except KeyError:
+            pass
+        value: Any = self._loader._load_shared(
+            self._data[key], tuple(self._path) + (key,), True, self._shared
+        )
+        self._loaded[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(keys={list(self._data)!r}, loaded={list(self._loaded)!r})"
+
+
+class LazyLoadedList(Sequence[Any]):
+    """read-only view of a serialized list, which loads each element the first time it is accessed
+
+    returned by `JsonLoader.load` with `lazy=True`. `list(x)` loads everything into a plain list
+    (whose nested dicts and lists are still lazy)
+    """
+
+    def __init__(
+        self,
+        loader: JsonLoader,
+        data: list[Any],
+        path: ObjectPath,
+        shared: Optional[_SharedItems] = None,
+    ):
+        self._loader: JsonLoader = loader
+        self._data: list[Any] = data
+        self._path: ObjectPath = tuple(path)
+        # items loaded so far by the `load` call this view came from, so that shared items stay shared
+        self._shared: _SharedItems = shared if shared is not None else dict()
+        self._loaded: dict[int, Any] = dict()
+
+    def _load_index(self, index: int) -> Any:
+        if index < 0:
+            index += len(self._data)
+        try:
+            return self._loaded[index]
+        except KeyError:
+            pass
+        value: Any = self._loader._load_shared(
+            self._data[index], tuple(self._path) + (index,), True, self._shared
+        )
+        self._loaded[index] = value
+        return value
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self._load_index(i) for i in range(len(self._data))[index]]
+        if not -len(self._data) <= index < len(self._data):
+            raise IndexError(f"list index out of range: {index}")
+        return self._load_index(index)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    # compares by value like a list, so is not hashable
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(len={len(self._data)}, loaded={len(self._loaded)})"
+
+
+GLOBAL_JSON_LOADER: JsonLoader = JsonLoader()
+
+
+def json_load(item: JSONitem, path: ObjectPath = ()) -> Any:
+    """load an object serialized by `json_serialize`, with the default config"""
+    return GLOBAL_JSON_LOADER.load(item, path=path)
@@ -5,38 +5,82 @@ notably:
 - `SerializerHandler` defines how to serialize a specific type of object
 - `JsonSerializer` handles configuration for which handlers to use
 - `json_serialize` provides the default configuration if you don't care -- call it on any object!
+- `JsonSerializer.iter_encode` and `JsonSerializer.dump` stream json text without building the whole serialized tree
+- `JsonSerializer(memo_size=...)` reuses the serialized form of immutable objects across calls
+- `JsonSerializer(profile=True)` records which handlers the time is spent in, see `JsonSerializer.profile_report`
+- `JsonSerializer(shared_refs=True)` writes repeated objects as `{"$ref": ...}` references, which `muutils.json_serialize.util.resolve_refs` turns back into shared objects
+- `JsonSerializer(array_dedup=True)` writes arrays with the same contents as an earlier one as such references
 
 """
 
 from __future__ import annotations
 
+import contextvars
+import functools
 import inspect
+import json
+import multiprocessing
+import time
 import warnings
+import weakref
+from collections import OrderedDict, deque
 from dataclasses import dataclass, is_dataclass
-from pathlib import Path
+from pathlib import Path, PurePath
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Iterable,
+    Iterator,
+    Literal,
     Mapping,
+    Optional,
     Set,
+    TextIO,
     Union,
     cast,
     overload,
 )
 
 from muutils.errormode import ErrorMode
+from muutils.misc.freezing import FrozenDict, FrozenList
+from muutils.json_serialize.json_backend import (
+    _NATIVE_ARRAYS,  # pyright: ignore[reportPrivateUsage]
+    JsonBackend,
+    JsonBackendName,
+    get_json_backend,
+)
 
 if TYPE_CHECKING:
     # always need array.py for type checking
-    from muutils.json_serialize.array import ArrayMode, serialize_array
+    from muutils.json_serialize.array import (
+        ArrayBlobWriter,
+        ArrayCodec,
+        ArrayMode,
+        ArrayQuantize,
+        array_content_key,
+        get_array_codec,
+        serialize_array,
+    )
 else:
     try:
-        from muutils.json_serialize.array import ArrayMode, serialize_array
+        from muutils.json_serialize.array import (
+            ArrayBlobWriter,
+            ArrayCodec,
+            ArrayMode,
+            ArrayQuantize,
+            array_content_key,
+            get_array_codec,
+            serialize_array,
+        )
     except ImportError as e:
         # TYPING: obviously, these types are all wrong if we can't import array.py
         ArrayMode = str  # type: ignore[misc]
+        ArrayCodec = str  # type: ignore[misc]
+        ArrayQuantize = str  # type: ignore[misc]
+        ArrayBlobWriter = Any  # type: ignore[misc]
+        array_content_key = lambda *args, **kwargs: None  # type: ignore[assignment, invalid-assignment] # noqa: E731
+        get_array_codec = lambda *args, **kwargs: None  # type: ignore[assignment, invalid-assignment] # noqa: E731
         serialize_array = lambda *args, **kwargs: None  # type: ignore[assignment, invalid-assignment] # noqa: E731
         warnings.warn(
             f"muutils.json_serialize.array could not be imported probably because missing numpy, array serialization will not work: \n{e}",
@@ -45,6 +89,7 @@ else:
 
 from muutils.json_serialize.types import (
     _FORMAT_KEY,
+    _REF_KEY,
     Hashableitem,
 )  # pyright: ignore[reportPrivateUsage]
 
@@ -71,15 +116,71 @@ SERIALIZER_SPECIAL_KEYS: MonoTuple[str] = (
     "__annotations__",
 )
 
+
+def _cache_source_lookup(
+    func: Callable[[Any], str],
+) -> Callable[[Any], str]:
+    """cache the result of `func`, which looks up source code or files of an object via `inspect`
+
+    for modules, classes, and functions the result is cached per object. for any other object
+    except methods, frames, tracebacks, and code objects (whose results differ per object and are not cached),
+    `inspect` raises a `TypeError` based only on the type, so that failure is cached per type.
+    objects with `__wrapped__` are unwrapped by `inspect`, so their results are never cached.
+    `func` is wrapped with `try_catch`, so failures are its `"TypeError: ..."` results.
+    caches are weak, so they don't keep the objects or types alive
+    """
+    # kept separate, since a class is both an object with source and the type of its instances
+    cache_by_object: weakref.WeakKeyDictionary[Any, str] = weakref.WeakKeyDictionary()
+    cache_by_type: weakref.WeakKeyDictionary[Any, str] = weakref.WeakKeyDictionary()
+
+    @functools.wraps(func)
+    def cached(obj: Any) -> str:  # pyright: ignore[reportAny]
+        key: Any
+        cache: weakref.WeakKeyDictionary[Any, str]
+        if hasattr(obj, "__wrapped__"):
+            return func(obj)
+        if inspect.ismodule(obj) or inspect.isclass(obj) or inspect.isfunction(obj):  # pyright: ignore[reportAny]
+            key, cache = obj, cache_by_object
+        elif (
+            inspect.ismethod(obj)  # pyright: ignore[reportAny]
+            or inspect.isframe(obj)  # pyright: ignore[reportAny]
+            or inspect.istraceback(obj)  # pyright: ignore[reportAny]
+            or inspect.iscode(obj)  # pyright: ignore[reportAny]
+        ):
+            return func(obj)
+        else:
+            key, cache = type(obj), cache_by_type  # pyright: ignore[reportAny]
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # not weakly referenceable
+            return func(obj)
+        result: str = func(obj)
+        if cache is cache_by_object or result.startswith("TypeError: "):
+            cache[key] = result
+        return result
+
+    return cached
+
+
 SERIALIZER_SPECIAL_FUNCS: dict[str, Callable[..., str | list[str]]] = {
     "str": str,
     "dir": dir,
     "type": try_catch(lambda x: str(type(x).__name__)),  # pyright: ignore[reportUnknownArgumentType, reportUnknownLambdaType]
     "repr": try_catch(lambda x: repr(x)),  # pyright: ignore[reportUnknownArgumentType, reportUnknownLambdaType]
-    "code": try_catch(lambda x: inspect.getsource(x)),  # pyright: ignore[reportUnknownArgumentType, reportUnknownLambdaType]
-    "sourcefile": try_catch(lambda x: str(inspect.getsourcefile(x))),  # pyright: ignore[reportUnknownArgumentType, reportUnknownLambdaType]
+    "code": _cache_source_lookup(try_catch(lambda x: inspect.getsource(x))),  # pyright: ignore[reportUnknownArgumentType, reportUnknownLambdaType]
+    "sourcefile": _cache_source_lookup(
+        try_catch(lambda x: str(inspect.getsourcefile(x)))  # pyright: ignore[reportUnknownArgumentType, reportUnknownLambdaType]
+    ),
 }
 
+# keys of `SERIALIZER_SPECIAL_FUNCS` used by the fallback handler when `fallback_mode="light"`
+SERIALIZER_SPECIAL_FUNCS_LIGHT: MonoTuple[str] = ("type", "repr")
+
+FallbackMode = Literal["full", "light"]
+
 SERIALIZE_DIRECT_AS_STR: Set[str] = {
     "<class 'torch.device'>",
     "<class 'torch.dtype'>",
@@ -96,6 +197,10 @@ class SerializerHandler:
         - `check : Callable[[JsonSerializer, Any], bool]` takes a JsonSerializer and an object, returns whether to use this handler
         - `serialize : Callable[[JsonSerializer, Any, ObjectPath], JSONitem]` takes a JsonSerializer, an object, and the current path, returns the serialized object
         - `desc : str` description of the handler (optional)
+    - `cache_by_type : bool` whether the result of `check` depends only on `type(obj)`.
+      if `True`, `JsonSerializer` will remember the outcome of `check` per type and skip calling it again.
+      leave as `False` for handlers whose `check` depends on the value of the object or the path
+      (defaults to `False`)
     """
 
     # (self_config, object) -> whether to use this handler
@@ -106,6 +211,8 @@ class SerializerHandler:
     uid: str
     # description of this serializer
     desc: str
+    # whether `check` depends only on `type(obj)`, allowing per-type caching of the dispatch
+    cache_by_type: bool = False
 
     def serialize(self) -> JSONdict:
         """serialize the handler info"""
@@ -125,6 +232,7 @@ class SerializerHandler:
             "source_pckg": getattr(self.serialize_func, "source_pckg", None),
             "__module__": getattr(self.serialize_func, "__module__", None),
             "desc": str(self.desc),
+            "cache_by_type": bool(self.cache_by_type),
         }
 
 
@@ -136,6 +244,7 @@ BASE_HANDLERS: MonoTuple[SerializerHandler] = (
         serialize_func=lambda self, obj, path: obj,
         uid="base types",
         desc="base types (bool, int, float, str, None)",
+        cache_by_type=True,
     ),
     SerializerHandler(
         check=lambda self, obj, path: isinstance(obj, Mapping),
@@ -144,6 +253,7 @@ BASE_HANDLERS: MonoTuple[SerializerHandler] = (
         },
         uid="dictionaries",
         desc="dictionaries",
+        cache_by_type=True,
     ),
     SerializerHandler(
         check=lambda self, obj, path: isinstance_namedtuple(obj),
@@ -153,6 +263,7 @@ BASE_HANDLERS: MonoTuple[SerializerHandler] = (
         },
         uid="namedtuple -> dict",
         desc="namedtuples as dicts",
+        cache_by_type=True,
     ),
     SerializerHandler(
         check=lambda self, obj, path: isinstance(obj, (list, tuple)),
@@ -161,6 +272,7 @@ BASE_HANDLERS: MonoTuple[SerializerHandler] = (
         ],
         uid="(list, tuple) -> list",
         desc="lists and tuples as lists",
+        cache_by_type=True,
     ),
 )
 
@@ -176,6 +288,18 @@ def _serialize_override_serialize_func(
     return obj.serialize()
 
 
+def _serialize_fallback(self: "JsonSerializer", obj: Any, path: ObjectPath) -> JSONitem:
+    """serialize an object no other handler matched, according to `self.fallback_mode`"""
+    if self.fallback_mode == "light":
+        return {
+            k: SERIALIZER_SPECIAL_FUNCS[k](obj) for k in SERIALIZER_SPECIAL_FUNCS_LIGHT
+        }
+    return {
+        **{k: str(getattr(obj, k, None)) for k in SERIALIZER_SPECIAL_KEYS},  # type: ignore[typeddict-item]
+        **{k: f(obj) for k, f in SERIALIZER_SPECIAL_FUNCS.items()},
+    }
+
+
 DEFAULT_HANDLERS: MonoTuple[SerializerHandler] = tuple(BASE_HANDLERS) + (
     SerializerHandler(
         # TODO: allow for custom serialization handler name
@@ -187,25 +311,29 @@ DEFAULT_HANDLERS: MonoTuple[SerializerHandler] = tuple(BASE_HANDLERS) + (
         desc="objects with .serialize method",
     ),
     SerializerHandler(
-        check=lambda self, obj, path: is_dataclass(obj),
+        # dataclass classes are also `is_dataclass`, but their type is `type`
+        check=lambda self, obj, path: is_dataclass(obj) and not isinstance(obj, type),
         serialize_func=lambda self, obj, path: {
             k: self.json_serialize(getattr(obj, k), tuple(path) + (k,))
             for k in obj.__dataclass_fields__
         },
         uid="dataclass -> dict",
         desc="dataclasses as dicts",
+        cache_by_type=True,
     ),
     SerializerHandler(
         check=lambda self, obj, path: isinstance(obj, Path),
         serialize_func=lambda self, obj, path: obj.as_posix(),
         uid="path -> str",
         desc="Path objects as posix strings",
+        cache_by_type=True,
     ),
     SerializerHandler(
         check=lambda self, obj, path: str(type(obj)) in SERIALIZE_DIRECT_AS_STR,
         serialize_func=lambda self, obj, path: str(obj),
         uid="obj -> str(obj)",
         desc="directly serialize objects in `SERIALIZE_DIRECT_AS_STR` to strings",
+        cache_by_type=True,
     ),
     SerializerHandler(
         check=lambda self, obj, path: str(type(obj)) == "<class 'numpy.ndarray'>",
@@ -214,23 +342,24 @@ DEFAULT_HANDLERS: MonoTuple[SerializerHandler] = tuple(BASE_HANDLERS) + (
         ),
         uid="numpy.ndarray",
         desc="numpy arrays",
+        cache_by_type=True,
     ),
     SerializerHandler(
         check=lambda self, obj, path: str(type(obj)) == "<class 'torch.Tensor'>",
         serialize_func=lambda self, obj, path: cast(
             JSONitem,
-            serialize_array(
-                self,
-                obj.detach().cpu(),
-                path=path,  # pyright: ignore[reportAny]
-            ),
+            # `serialize_array` detaches and views CPU tensors as numpy arrays without copying
+            serialize_array(self, obj, path=path),  # pyright: ignore[reportAny]
         ),
         uid="torch.Tensor",
         desc="pytorch tensors",
+        cache_by_type=True,
     ),
     SerializerHandler(
         check=lambda self, obj, path: (
-            str(type(obj)) == "<class 'pandas.core.frame.DataFrame'>"
+            # the repr of the type changed in pandas 3
+            str(type(obj))
+            in ("<class 'pandas.core.frame.DataFrame'>", "<class 'pandas.DataFrame'>")
         ),
         # TYPING: type checkers have no idea that obj is a DataFrame here
         serialize_func=lambda self, obj, path: {  # pyright: ignore[reportArgumentType, reportAny]
@@ -241,6 +370,7 @@ DEFAULT_HANDLERS: MonoTuple[SerializerHandler] = tuple(BASE_HANDLERS) + (
         },
         uid="pandas.DataFrame",
         desc="pandas DataFrames",
+        cache_by_type=True,
     ),
     SerializerHandler(
         check=lambda self, obj, path: isinstance(obj, (set, frozenset)),
@@ -252,6 +382,7 @@ DEFAULT_HANDLERS: MonoTuple[SerializerHandler] = tuple(BASE_HANDLERS) + (
         },
         uid="set -> dict[_FORMAT_KEY: 'set', data: list(...)]",
         desc="sets as dicts with format key",
+        cache_by_type=True,
     ),
     SerializerHandler(
         check=lambda self, obj, path: (
@@ -262,19 +393,335 @@ DEFAULT_HANDLERS: MonoTuple[SerializerHandler] = tuple(BASE_HANDLERS) + (
         ],
         uid="Iterable -> list",
         desc="Iterables (not lists/tuples/strings) as lists",
+        cache_by_type=True,
     ),
     SerializerHandler(
         check=lambda self, obj, path: True,
-        serialize_func=lambda self, obj, path: {
-            **{k: str(getattr(obj, k, None)) for k in SERIALIZER_SPECIAL_KEYS},  # type: ignore[typeddict-item]
-            **{k: f(obj) for k, f in SERIALIZER_SPECIAL_FUNCS.items()},
-        },
+        serialize_func=_serialize_fallback,
         uid="fallback",
         desc="fallback handler -- serialize object attributes and special functions as strings",
+        cache_by_type=True,
     ),
 )
 
 
+# encoder used by `JsonSerializer.iter_encode` for leaves, matches `json.dumps` defaults
+_JSON_ENCODER: json.JSONEncoder = json.JSONEncoder()
+
+# approximate number of characters in each chunk yielded by `JsonSerializer.iter_encode`
+ITER_ENCODE_CHUNK_SIZE: int = 64 * 1024
+
+# handlers which `JsonSerializer.json_serialize` handles natively on its explicit stack,
+# instead of calling their `serialize_func` (which would recurse). the output is identical.
+# keyed by `id(handler)`, so copies or replacements of these handlers fall back to `serialize_func`
+_NATIVE_HANDLER_KINDS: dict[int, str] = {
+    id(handler): kind
+    for handler in DEFAULT_HANDLERS
+    for uid, kind in (
+        ("base types", "leaf"),
+        ("dictionaries", "mapping"),
+        ("namedtuple -> dict", "namedtuple"),
+        ("(list, tuple) -> list", "list"),
+        ("dataclass -> dict", "dataclass"),
+        ("set -> dict[_FORMAT_KEY: 'set', data: list(...)]", "set"),
+        ("Iterable -> list", "list"),
+    )
+    if handler.uid == uid
+}
+
+# inverse of `_NATIVE_HANDLER_KINDS` for the default handlers (the "list" kind maps to "(list, tuple) -> list")
+_HANDLER_BY_KIND: dict[str, SerializerHandler] = {
+    _NATIVE_HANDLER_KINDS[id(handler)]: handler
+    for handler in reversed(DEFAULT_HANDLERS)
+    if id(handler) in _NATIVE_HANDLER_KINDS
+}
+
+_STR_TYPE_SET: frozenset[type] = frozenset({str})
+
+NativeFastPath = Optional[Literal["copy", "reference"]]
+
+# a path which is only materialized into an `ObjectPath` when needed:
+# either `None` (the base path) or a `(parent, key)` pair
+_LazyPath = Union[None, "tuple[_LazyPath, Union[str, int]]"]
+
+
+# types which are never written as a `$ref` when `shared_refs` is enabled
+_UNTRACKED_TYPES: frozenset[type] = frozenset({bool, int, float, str, type(None)})
+
+
+# `str(type(obj))` of the types deduplicated by content when `array_dedup` is enabled
+_ARRAY_TYPE_STRS: frozenset[str] = frozenset(
+    {"<class 'numpy.ndarray'>", "<class 'torch.Tensor'>"}
+)
+
+
+class _PendingRoot:
+    """the root of the output of a `json_serialize` call nested in a handler, during a `shared_refs`
+    or `array_dedup` serialization. where the output ends up is only known once the handler returns,
+    at which point `_RefTable.resolve` finds it in the handler's output"""
+
+    __slots__ = ("output", "location", "resolved")
+
+    def __init__(self) -> None:
+        self.output: JSONitem = None
+        self.location: _RefLocation = None
+        self.resolved: bool = False
+
+
+# a location in the output, like `_LazyPath` but with output keys. the root is either the root
+# of the output (`None`) or that of a nested call (`_PendingRoot`)
+_RefLocation = Union[None, _PendingRoot, "tuple[_RefLocation, Union[str, int]]"]
+
+
+class _RefTable:
+    """what has been written so far in a `shared_refs` or `array_dedup` serialization, and where
+
+    shared with `json_serialize` calls nested in handlers (such as `SerializableDataclass.serialize`)
+    through `_ACTIVE_REFS`, so their contents are tracked according to the settings of the outer serializer
+    """
+
+    __slots__ = (
+        "shared_refs",
+        "array_dedup",
+        "by_id",
+        "by_content",
+        "location",
+        "pending",
+    )
+
+    def __init__(self, shared_refs: bool, array_dedup: bool) -> None:
+        self.shared_refs: bool = shared_refs
+        self.array_dedup: bool = array_dedup
+        # id -> (object, location). the object is kept so its id can't be reused by another object
+        self.by_id: dict[int, tuple[Any, _RefLocation]] = dict()
+        # array content key -> [(flat bytes, location)], more than one only on hash collisions
+        self.by_content: dict[Any, list[tuple[Any, _RefLocation]]] = dict()
+        # location of the object about to be passed to `_serialize_node`
+        self.location: _RefLocation = None
+        # roots of nested calls made by the handler currently running
+        self.pending: list[_PendingRoot] = []
+
+    def resolve(self, output: JSONitem, location: _RefLocation) -> None:
+        """find the outputs of the pending nested calls in `output`, a handler output written at `location`
+
+        nested calls whose output is not found (because the handler transformed it) stay unresolved,
+        and are never the target of a `$ref`
+        """
+        by_output: dict[int, _PendingRoot] = {
+            id(root.output): root for root in self.pending
+        }
+        self.pending.clear()
+        # breadth first, since nested outputs are usually close to the top of the handler output
+        queue: deque[tuple[JSONitem, _RefLocation]] = deque([(output, location)])
+        while queue and by_output:
+            value, value_location = queue.popleft()
+            root: Optional[_PendingRoot] = by_output.pop(id(value), None)
+            if root is not None:
+                root.location = value_location
+                root.resolved = True
+            elif isinstance(value, dict):
+                queue.extend((v, (value_location, k)) for k, v in value.items())
+            elif isinstance(value, list):
+                queue.extend((v, (value_location, i)) for i, v in enumerate(value))
+
+
+# the `_RefTable` of the `shared_refs` or `array_dedup` serialization in progress, if any
+_ACTIVE_REFS: contextvars.ContextVar[Optional[_RefTable]] = contextvars.ContextVar(
+    "_ACTIVE_REFS", default=None
+)
+
+
+def _ref_pointer(location: _RefLocation) -> Optional[str]:
+    """turn a location in the output into a `$ref` string: `"#"` followed by a json pointer (RFC 6901).
+    `None` if it is inside the output of a nested call which was not found"""
+    keys: list[str] = []
+    while location is not None:
+        if isinstance(location, _PendingRoot):
+            if not location.resolved:
+                return None
+            location = location.location
+            continue
+        location, key = location
+        keys.append(str(key).replace("~", "~0").replace("/", "~1"))
+    keys.reverse()
+    return "".join(["#"] + ["/" + k for k in keys])
+
+
+def _materialize_path(base_path: ObjectPath, node: _LazyPath) -> ObjectPath:
+    """turn a lazy `(parent, key)` linked path into a tuple, prefixed by `base_path`"""
+    keys: list[Union[str, int]] = []
+    while node is not None:
+        node, key = node
+        keys.append(key)
+    keys.reverse()
+    return tuple(base_path) + tuple(keys)
+
+
+def _count_json_values(item: JSONitem) -> int:
+    """number of json values in `item`, counting containers and everything inside them"""
+    count: int = 0
+    stack: list[Any] = [item]
+    while stack:
+        current: Any = stack.pop()
+        count += 1
+        if isinstance(current, dict):
+            stack.extend(current.values())  # pyright: ignore[reportUnknownArgumentType, reportUnknownMemberType]
+        elif isinstance(current, (list, tuple)):
+            stack.extend(current)  # pyright: ignore[reportUnknownArgumentType]
+    return count
+
+
+class _SerializeFrame:
+    """a container in the process of being serialized by `JsonSerializer.json_serialize`"""
+
+    __slots__ = (
+        "obj",
+        "handler",
+        "kind",
+        "node",
+        "children",
+        "out",
+        "out_is_dict",
+        "out_key",
+        "ref_base",
+    )
+
+    def __init__(
+        self,
+        obj: Any,  # pyright: ignore[reportAny]
+        handler: SerializerHandler,
+        kind: str,
+        node: _LazyPath,
+    ) -> None:
+        self.obj: Any = obj
+        self.handler: SerializerHandler = handler
+        self.kind: str = kind
+        self.node: _LazyPath = node
+        # iterator over `(key, value)` pairs of the children, and the output being built
+        self.children: Iterator[tuple[Any, Any]]
+        self.out: Union[dict[str, JSONitem], list[JSONitem]]
+        if kind == "mapping":
+            self.children = iter(obj.items())  # pyright: ignore[reportAny]
+            self.out = dict()
+        elif kind == "namedtuple":
+            self.children = iter(obj._asdict().items())  # pyright: ignore[reportAny]
+            self.out = dict()
+        elif kind == "dataclass":
+            self.children = ((k, getattr(obj, k)) for k in obj.__dataclass_fields__)  # pyright: ignore[reportAny]
+            self.out = dict()
+        else:
+            self.children = enumerate(obj)  # pyright: ignore[reportAny]
+            self.out = list()
+        self.out_is_dict: bool = isinstance(self.out, dict)
+        # key of this frame's output in the parent frame's `out`, if it is a dict
+        self.out_key: Optional[str] = None
+        # location in the output of the container holding the children, only used with `shared_refs`
+        self.ref_base: _RefLocation = None
+
+    def set_ref_location(self, location: _RefLocation) -> None:
+        """set the location of this frame's output, for writing `$ref`s to its children"""
+        # sets are written as `{_FORMAT_KEY: ..., "data": [...]}`
+        self.ref_base = (location, "data") if self.kind == "set" else location
+        if self.kind == "mapping":
+            # a `$ref` to a key which is overwritten by a later key with the same `str()` would be lost
+            self.children = _merged_str_key_items(self.obj)  # pyright: ignore[reportAny]
+
+
+def _merged_str_key_items(
+    obj: Mapping[Any, Any],
+) -> Iterator[tuple[Any, Any]]:
+    """items of `obj`, merging keys which are equal after `str()` like `json_serialize` does
+
+    the last value is kept, at the position of the first key. used by `iter_encode`,
+    which can't overwrite a key once it has been written, and with `shared_refs`,
+    which can't refer to a key that is overwritten later
+    """
+    if all(type(k) is str for k in obj):  # pyright: ignore[reportAny]
+        yield from obj.items()
+        return
+    merged: dict[str, tuple[Any, Any]] = dict()
+    for key, value in obj.items():  # pyright: ignore[reportAny]
+        merged[str(key)] = (key, value)  # pyright: ignore[reportAny]
+    yield from merged.values()
+
+
+def _is_immutable_type(obj_type: type) -> bool:
+    """whether instances of `obj_type` are treated as immutable by the `JsonSerializer` memo
+
+    frozen dataclasses (including frozen `SerializableDataclass`es), paths, and `FrozenDict`/`FrozenList`.
+    tuples are checked per instance, see `_is_memoizable`
+    """
+    params: Any = getattr(obj_type, "__dataclass_params__", None)
+    if params is not None and getattr(params, "frozen", False):  # pyright: ignore[reportAny]
+        return True
+    return issubclass(obj_type, (PurePath, FrozenDict, FrozenList))
+
+
+class _SerializationMemo:
+    """bounded LRU cache from object identity to serialized output, used by `JsonSerializer`
+
+    objects which support weak references are held weakly, and their entry is dropped when they are
+    garbage collected. other objects (tuples, paths) are held strongly until evicted, so that their `id`
+    cannot be reused by a different object while they are in the cache
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        # `id(obj)` -> (weak or strong reference to `obj`, serialized output)
+        self._entries: OrderedDict[int, tuple[Any, JSONitem]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, obj: Any) -> Optional[tuple[JSONitem]]:  # pyright: ignore[reportAny]
+        """the output for `obj` wrapped in a 1-tuple, or `None` if it is not cached. counts hits and misses"""
+        entry: Optional[tuple[Any, JSONitem]] = self._entries.get(id(obj))  # pyright: ignore[reportAny]
+        if entry is not None:
+            holder: Any = entry[0]  # pyright: ignore[reportAny]
+            if isinstance(holder, weakref.ref):
+                holder = holder()  # pyright: ignore[reportUnknownVariableType]
+            if holder is obj:
+                self.hits += 1
+                self._entries.move_to_end(id(obj))  # pyright: ignore[reportAny]
+                return (entry[1],)
+        self.misses += 1
+        return None
+
+    def put(self, obj: Any, output: JSONitem) -> None:  # pyright: ignore[reportAny]
+        """cache `output` as the serialized form of `obj`, evicting the least recently used entry if full"""
+        key: int = id(obj)  # pyright: ignore[reportAny]
+        holder: Any
+        try:
+            holder = weakref.ref(obj, self._make_finalizer(key))  # pyright: ignore[reportAny]
+        except TypeError:
+            holder = obj  # pyright: ignore[reportAny]
+        self._entries[key] = (holder, output)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _make_finalizer(self, key: int) -> Callable[[weakref.ref[Any]], None]:
+        # only hold the memo weakly, so entries don't keep the serializer alive
+        memo_ref: weakref.ref[_SerializationMemo] = weakref.ref(self)
+
+        def finalize(dead: weakref.ref[Any]) -> None:
+            memo: Optional[_SerializationMemo] = memo_ref()
+            if memo is not None:
+                entry: Optional[tuple[Any, JSONitem]] = memo._entries.get(key)
+                if entry is not None and entry[0] is dead:
+                    del memo._entries[key]
+
+        return finalize
+
+    def clear(self) -> None:
+        """drop all entries and reset the counters"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
 class JsonSerializer:
     """Json serialization class (holds configs)
 
@@ -294,6 +741,75 @@ class JsonSerializer:
     - `write_only_format : bool`
     changes _FORMAT_KEY keys in output to "__write_format__" (when you want to serialize something in a way that zanj won't try to recover the object when loading)
     (defaults to `False`)
+    - `native_fast_path : NativeFastPath`
+    what to do with plain `dict`s with `str` keys and plain `list`s whose values are all `bool`, `int`, `float`, `str`, or `None`.
+    these are already valid json, so with `"copy"` they are shallow-copied in one go and with `"reference"` they are returned as-is
+    (the output then shares these containers with the input), instead of serializing each value through the handlers.
+    `None` disables this. only applies when no handler overrides how these types are serialized
+    (defaults to `"copy"`)
+    - `json_backend : JsonBackendName | None`
+    backend used by `dumps` to encode to a json string, see `muutils.json_serialize.json_backend`.
+    if `None`, uses whichever backend is selected globally at the time `dumps` is called
+    (defaults to `None`)
+    - `shared_refs : bool`
+    if `True`, an object which appears more than once (including one which contains itself) is only serialized
+    the first time it is encountered, and every later occurrence is written as `{"$ref": "#/path/to/first"}`,
+    where the path is a json pointer into the output. `muutils.json_serialize.util.resolve_refs` undoes this after loading.
+    objects are compared by identity, and `bool`, `int`, `float`, `str`, and `None` are never replaced.
+    if `False`, shared objects are serialized every time and cycles are an error
+    (defaults to `False`)
+    - `array_dedup : bool`
+    if `True`, the bytes of each numpy array and torch tensor (other than zero-dimensional ones) are hashed with a fast
+    non-cryptographic hash, and an array with the same type, dtype, shape, and bytes as one already written is
+    written as a `{"$ref": ...}` to it, the same as with `shared_refs`, instead of being encoded again.
+    `JsonLoader(resolve_refs=True)` loads these as a single shared, read-only array.
+    hashes are confirmed by comparing the bytes, and the bytes of every array are kept until the call returns.
+    can't be used with `memo_size`
+    (defaults to `False`)
+    - `memo_size : int`
+    if greater than 0, the serialized forms of up to this many immutable objects are cached by identity and
+    reused (least recently used first out) when the same object is serialized again, in this or any later call.
+    immutable objects are frozen dataclasses (such as `serializable_dataclass(frozen=True)`), tuples of
+    `bool`, `int`, `float`, `str`, or `None`, `pathlib` paths, and `FrozenDict`/`FrozenList` from `muutils.misc.freezing`.
+    cached outputs are shared between calls, so they must not be modified, and the contents of frozen
+    dataclasses are assumed not to change. see `memo_info` for hit and miss counts. can't be used with `shared_refs`
+    (defaults to `0`)
+    - `profile : bool`
+    if `True`, record the number of calls, cumulative time, and number of json values produced for each handler,
+    keyed by `SerializerHandler.uid`. see `profile_stats` and `profile_report`. this slows serialization down,
+    but when `False` there is no overhead at all
+    (defaults to `False`)
+    - `fallback_mode : FallbackMode`
+    what the `"fallback"` handler writes for objects no other handler matches. `"full"` writes the special keys
+    and the results of all `SERIALIZER_SPECIAL_FUNCS` (including `dir` and the source code), while `"light"` only
+    writes the type name and repr, which is much cheaper when serializing many opaque objects
+    (defaults to `"full"`)
+    - `array_blob : ArrayBlobWriter | None`
+    sidecar file that arrays are written to when `array_mode="array_blob_meta"`, see `muutils.json_serialize.array.ArrayBlobWriter`.
+    not kept when the serializer is pickled
+    (defaults to `None`)
+    - `array_codec : ArrayCodec`
+    compression codec used when `array_mode` is `"array_b64z_meta"` or `"array_chunked_meta"`. if the package for the codec is not
+    installed, warns on init and uses `"zlib"` instead
+    (defaults to `"zlib"`)
+    - `array_codec_level : int | None`
+    compression level for `array_codec`, or `None` for the codec's default
+    (defaults to `None`)
+    - `array_chunk_bytes : int`
+    approximate uncompressed size of each block when `array_mode="array_chunked_meta"`
+    (defaults to `1 << 20`, 1 MiB)
+    - `array_quantize : ArrayQuantize | None`
+    if set, float arrays are lossily stored as `"float16"`, `"bfloat16"`, or affine-quantized `"int8"`,
+    see `muutils.json_serialize.array.quantize_array`. `load_array` restores them to their original dtype.
+    not supported with `array_mode="array_chunked_meta"`
+    (defaults to `None`)
+    - `array_text_precision : int | None`
+    significant digits for floats when `array_mode="array_text_meta"`, or `None` to write enough digits to
+    round-trip exactly
+    (defaults to `None`)
+
+    handlers with `cache_by_type=True` only have their `check` called once per type, after which
+    the matching handler is looked up from a per-serializer cache keyed on `type(obj)`
 
     # Raises:
     - `ValueError`: on init, if `args` is not empty
@@ -309,6 +825,19 @@ class JsonSerializer:
         handlers_pre: MonoTuple[SerializerHandler] = (),
         handlers_default: MonoTuple[SerializerHandler] = DEFAULT_HANDLERS,
         write_only_format: bool = False,
+        native_fast_path: NativeFastPath = "copy",
+        json_backend: Optional[JsonBackendName] = None,
+        shared_refs: bool = False,
+        array_dedup: bool = False,
+        memo_size: int = 0,
+        profile: bool = False,
+        fallback_mode: FallbackMode = "full",
+        array_blob: Optional[ArrayBlobWriter] = None,
+        array_codec: ArrayCodec = "zlib",
+        array_codec_level: Optional[int] = None,
+        array_chunk_bytes: int = 1 << 20,
+        array_text_precision: Optional[int] = None,
+        array_quantize: Optional[ArrayQuantize] = None,
     ):
         if len(args) > 0:
             raise ValueError(
@@ -318,11 +847,247 @@ class JsonSerializer:
         self.array_mode: "ArrayMode" = array_mode
         self.error_mode: ErrorMode = ErrorMode.from_any(error_mode)
         self.write_only_format: bool = write_only_format
-        # join up the handlers
-        self.handlers: MonoTuple[SerializerHandler] = tuple(handlers_pre) + tuple(
-            handlers_default
+        if native_fast_path not in ("copy", "reference", None):
+            raise ValueError(f"invalid {native_fast_path = }")
+        self.native_fast_path: NativeFastPath = native_fast_path
+        # resolve now, so that a missing backend warns on init rather than on every `dumps`
+        self.json_backend: Optional[JsonBackend] = (
+            get_json_backend(json_backend) if json_backend is not None else None
+        )
+        self.shared_refs: bool = shared_refs
+        self.array_dedup: bool = array_dedup
+        if memo_size < 0:
+            raise ValueError(f"memo_size must be non-negative, got {memo_size = }")
+        if memo_size > 0 and (shared_refs or array_dedup):
+            # memoized outputs could contain references relative to a different root
+            raise ValueError(
+                "memo_size cannot be used together with shared_refs or array_dedup"
+            )
+        self.memo_size: int = memo_size
+        if fallback_mode not in ("full", "light"):
+            raise ValueError(f"invalid {fallback_mode = }")
+        self.fallback_mode: FallbackMode = fallback_mode
+        self.array_blob: Optional[ArrayBlobWriter] = array_blob
+        # check now, so that a missing codec warns on init rather than on every array
+        try:
+            get_array_codec(array_codec)
+        except ImportError as e:
+            warnings.warn(
+                f"array codec {array_codec!r} is not available, falling back to zlib: {e}",
+                ImportWarning,
+            )
+            array_codec, array_codec_level = "zlib", None
+        self.array_codec: ArrayCodec = array_codec
+        self.array_codec_level: Optional[int] = array_codec_level
+        if array_chunk_bytes < 1:
+            raise ValueError(
+                f"array_chunk_bytes must be positive, got {array_chunk_bytes = }"
+            )
+        self.array_chunk_bytes: int = array_chunk_bytes
+        self.array_text_precision: Optional[int] = array_text_precision
+        if array_quantize not in (None, "float16", "bfloat16", "int8"):
+            raise ValueError(f"invalid {array_quantize = }")
+        self.array_quantize: Optional[ArrayQuantize] = array_quantize
+        self.profile: bool = profile
+        # handler uid -> {"calls", "time_s", "elements"}, only when profiling
+        self._profile_stats: Optional[dict[str, dict[str, float]]] = None
+        if profile:
+            self._profile_stats = dict()
+            # shadow the method on the instance, so that nothing is checked when not profiling
+            self._serialize_node = self._serialize_node_profiled  # type: ignore[method-assign]
+        # join up the handlers (this also resets the dispatch cache)
+        self.handlers = tuple(handlers_pre) + tuple(handlers_default)
+
+    @property
+    def handlers(self) -> MonoTuple[SerializerHandler]:
+        """handlers to check, in order. setting this resets the dispatch cache"""
+        return self._handlers
+
+    @handlers.setter
+    def handlers(self, value: MonoTuple[SerializerHandler]) -> None:
+        self._handlers: MonoTuple[SerializerHandler] = tuple(value)
+        # maps `type(obj)` to the handlers which still need to be tried for that type
+        self._dispatch_cache: dict[type, MonoTuple[SerializerHandler]] = dict()
+        # types which are known to be returned as-is by the "base types" handler
+        self._leaf_types: set[type] = set()
+        # json types which can be part of a `native_fast_path` container, computed on first use
+        self._native_value_types: frozenset[type] | None = None
+        # cached outputs depend on the handlers, so start a new memo
+        self._memo: Optional[_SerializationMemo] = (
+            _SerializationMemo(self.memo_size) if self.memo_size > 0 else None
+        )
+        # whether instances of a type are immutable, see `_is_memoizable`
+        self._immutable_types: dict[type, bool] = dict()
+
+    def _is_memoizable(
+        self,
+        obj: Any,  # pyright: ignore[reportAny]
+    ) -> bool:
+        """whether the serialized form of `obj` can be cached by the memo"""
+        obj_type: type = type(obj)  # pyright: ignore[reportAny]
+        if obj_type is tuple:
+            return all(type(x) in _UNTRACKED_TYPES for x in obj)  # pyright: ignore[reportAny]
+        immutable: Optional[bool] = self._immutable_types.get(obj_type)
+        if immutable is None:
+            immutable = _is_immutable_type(obj_type)
+            self._immutable_types[obj_type] = immutable
+        return immutable
+
+    def _serialize_node_profiled(
+        self,
+        obj: Any,  # pyright: ignore[reportAny]
+        base_path: ObjectPath,
+        node: _LazyPath,
+    ) -> Union[JSONitem, _SerializeFrame]:
+        """`_serialize_node`, recording the time taken and json values produced under the uid of the handler used"""
+        uid: str = self._profile_handler_uid(obj, base_path, node)
+        start: float = time.perf_counter()
+        result: Union[JSONitem, _SerializeFrame] = JsonSerializer._serialize_node(
+            self, obj, base_path, node
+        )
+        elapsed: float = time.perf_counter() - start
+
+        stats: Optional[dict[str, float]] = self._profile_stats.get(uid)  # type: ignore[union-attr]  # pyright: ignore[reportOptionalMemberAccess]
+        if stats is None:
+            stats = dict(calls=0, time_s=0.0, elements=0)
+            self._profile_stats[uid] = stats  # type: ignore[index]  # pyright: ignore[reportOptionalSubscript]
+        stats["calls"] += 1
+        stats["time_s"] += elapsed
+        # a container on the stack is one value, its children are counted by their own handlers
+        stats["elements"] += (
+            1 if isinstance(result, _SerializeFrame) else _count_json_values(result)
+        )
+        return result
+
+    def _profile_handler_uid(
+        self,
+        obj: Any,  # pyright: ignore[reportAny]
+        base_path: ObjectPath,
+        node: _LazyPath,
+    ) -> str:
+        """uid of the handler `_serialize_node` will use for `obj`, for profiling"""
+        path: ObjectPath = _materialize_path(base_path, node)
+        try:
+            for handler in self._dispatch(obj, path):
+                if handler.cache_by_type or handler.check(self, obj, path):
+                    return handler.uid
+        except Exception:
+            pass
+        return "no handler matched"
+
+    def profile_stats(self) -> dict[str, dict[str, float]]:
+        """per-handler call counts, cumulative time in seconds, and json values produced, keyed by handler uid
+
+        the time of a handler includes any nested `json_serialize` calls it makes, but not the children of
+        containers which are traversed by `json_serialize` itself. empty unless `profile=True`
+        """
+        if self._profile_stats is None:
+            return dict()
+        return {uid: dict(stats) for uid, stats in self._profile_stats.items()}
+
+    def profile_report(self) -> str:
+        """a table of `profile_stats`, slowest handlers first"""
+        stats: dict[str, dict[str, float]] = self.profile_stats()
+        uid_width: int = max([len("handler")] + [len(uid) for uid in stats])
+        lines: list[str] = [
+            f"{'handler':<{uid_width}}  {'calls':>10}  {'time (s)':>10}  {'per call (us)':>13}  {'elements':>10}"
+        ]
+        for uid, s in sorted(stats.items(), key=lambda item: -item[1]["time_s"]):
+            per_call_us: float = s["time_s"] / s["calls"] * 1e6 if s["calls"] else 0.0
+            lines.append(
+                f"{uid:<{uid_width}}  {int(s['calls']):>10}  {s['time_s']:>10.4f}  {per_call_us:>13.2f}  {int(s['elements']):>10}"
+            )
+        return "\n".join(lines)
+
+    def reset_profile(self) -> None:
+        """clear the recorded `profile_stats`"""
+        if self._profile_stats is not None:
+            self._profile_stats.clear()
+
+    def memo_info(self) -> dict[str, int]:
+        """hits, misses, current size, and maximum size of the memo of immutable objects (see `memo_size`)"""
+        if self._memo is None:
+            return dict(hits=0, misses=0, size=0, maxsize=0)
+        return dict(
+            hits=self._memo.hits,
+            misses=self._memo.misses,
+            size=len(self._memo),
+            maxsize=self._memo.maxsize,
         )
 
+    def clear_memo(self) -> None:
+        """empty the memo of immutable objects and reset its counters"""
+        if self._memo is not None:
+            self._memo.clear()
+
+    def _get_native_value_types(self) -> frozenset[type]:
+        """json types which can appear in a container returned by the `native_fast_path`
+
+        empty if plain `dict`s and `list`s are not handled by the default container handlers
+        """
+        if self._native_value_types is None:
+            if self._dispatch({}, ()) == (
+                _HANDLER_BY_KIND["mapping"],
+            ) and self._dispatch([], ()) == (_HANDLER_BY_KIND["list"],):
+                self._native_value_types = frozenset(
+                    type(sample)  # pyright: ignore[reportAny]
+                    for sample in ("", 0, 0.0, False, None)
+                    if self._dispatch(sample, ()) == (_HANDLER_BY_KIND["leaf"],)
+                )
+            else:
+                self._native_value_types = frozenset()
+        return self._native_value_types
+
+    def _native_container(
+        self,
+        obj: Any,  # pyright: ignore[reportAny]
+    ) -> Union[dict[str, JSONitem], list[JSONitem], None]:
+        """return `obj` (or a copy) if it is a plain `dict` or `list` which is already valid json, otherwise `None`"""
+        obj_type: type = type(obj)  # pyright: ignore[reportAny]
+        if obj_type is dict:
+            if (
+                _STR_TYPE_SET.issuperset(map(type, obj))  # pyright: ignore[reportAny]
+                and self._get_native_value_types().issuperset(map(type, obj.values()))  # pyright: ignore[reportAny]
+                and not (self.write_only_format and _FORMAT_KEY in obj)
+            ):
+                return obj if self.native_fast_path == "reference" else obj.copy()  # pyright: ignore[reportAny]
+        elif obj_type is list:
+            if self._get_native_value_types().issuperset(map(type, obj)):  # pyright: ignore[reportAny]
+                return obj if self.native_fast_path == "reference" else obj.copy()  # pyright: ignore[reportAny]
+        return None
+
+    def _dispatch(
+        self,
+        obj: Any,  # pyright: ignore[reportAny]
+        path: ObjectPath,
+    ) -> MonoTuple[SerializerHandler]:
+        """get the candidate handlers for `obj`, using the per-type dispatch cache
+
+        the returned handlers are all those with `cache_by_type=False` (which must still
+        have their `check` called), followed by the first handler with `cache_by_type=True`
+        whose `check` passed (if any), which is known to match without calling `check` again
+        """
+        obj_type: type = type(obj)  # pyright: ignore[reportAny]
+        candidates: MonoTuple[SerializerHandler] | None = self._dispatch_cache.get(
+            obj_type
+        )
+        if candidates is None:
+            candidates_list: list[SerializerHandler] = []
+            for handler in self._handlers:
+                if not handler.cache_by_type:
+                    candidates_list.append(handler)
+                elif handler.check(self, obj, path):
+                    candidates_list.append(handler)
+                    break
+            candidates = tuple(candidates_list)
+            self._dispatch_cache[obj_type] = candidates
+            if (
+                len(candidates) == 1
+                and _NATIVE_HANDLER_KINDS.get(id(candidates[0])) == "leaf"
+            ):
+                self._leaf_types.add(obj_type)
+        return candidates
+
     @overload
     def json_serialize(
         self, obj: Mapping[str, Any], path: ObjectPath = ()
@@ -342,35 +1107,662 @@ class JsonSerializer:
         obj: Any,  # pyright: ignore[reportAny]
         path: ObjectPath = (),
     ) -> JSONitem:
-        handler = None
+        """serialize `obj` into a `JSONitem` using the configured handlers
+
+        containers handled by the default handlers are traversed on an explicit stack rather than
+        by recursion, so arbitrarily deep objects can be serialized. paths are only built when
+        passed to a handler or included in an error. circular references through these containers
+        are treated as a serialization error, handled according to `error_mode`, unless `shared_refs` is set.
+        calls made by handlers during a `shared_refs` or `array_dedup` serialization (such as by
+        `SerializableDataclass.serialize`) take part in it, with the settings of the outer serializer
+        """
+        active: Optional[_RefTable] = _ACTIVE_REFS.get()
+        if active is not None:
+            # nested in a handler, so references are tracked in the outer table
+            root: _PendingRoot = _PendingRoot()
+            output: JSONitem = self._json_serialize_stack(
+                obj, tuple(path), active, root
+            )
+            if isinstance(output, (dict, list)):
+                root.output = output
+                active.pending.append(root)
+            return output
+        if not (self.shared_refs or self.array_dedup):
+            return self._json_serialize_stack(obj, tuple(path), None, None)
+
+        refs: _RefTable = _RefTable(self.shared_refs, self.array_dedup)
+        token: contextvars.Token[Optional[_RefTable]] = _ACTIVE_REFS.set(refs)
+        try:
+            return self._json_serialize_stack(obj, tuple(path), refs, None)
+        finally:
+            _ACTIVE_REFS.reset(token)
+
+    def _json_serialize_stack(
+        self,
+        obj: Any,  # pyright: ignore[reportAny]
+        base_path: ObjectPath,
+        refs: Optional[_RefTable],
+        root_location: _RefLocation,
+    ) -> JSONitem:
+        """the explicit-stack loop of `json_serialize`. `refs` is the memo for `shared_refs` and `array_dedup`, or `None`,
+        and `root_location` the location of the output in that of the outermost call"""
+        if refs is not None:
+            # only a nested call can find its root already written
+            ref: Optional[JSONdict] = self._track_ref(obj, root_location, refs)
+            if ref is not None:
+                return ref
+            refs.location = root_location
+        root: Union[JSONitem, _SerializeFrame] = self._serialize_node(
+            obj, base_path, None
+        )
+        if not isinstance(root, _SerializeFrame):
+            return root
+        if refs is not None:
+            root.set_ref_location(root_location)
+
+        stack: list[_SerializeFrame] = [root]
+        # ids of the containers currently on the stack, for detecting cycles
+        active_ids: set[int] = {id(obj)}  # pyright: ignore[reportAny]
+        # when profiling, leaves go through `_serialize_node` so they are counted
+        leaf_types: set[type] = self._leaf_types if not self.profile else set()
+        while True:
+            frame: _SerializeFrame = stack[-1]
+            output: JSONitem
+            try:
+                key, value = next(frame.children)  # pyright: ignore[reportAny]
+                out_key: Optional[str] = str(key) if frame.out_is_dict else None  # pyright: ignore[reportAny]
+            except StopIteration:
+                output = self._finalize_frame(frame)
+            except Exception as e:
+                # iterating over the container failed, so the container itself failed
+                output = self._handle_error(
+                    e,
+                    frame.obj,
+                    _materialize_path(base_path, frame.node),
+                    frame.handler,
+                )
+            else:
+                # most values are leaves, which we can skip dispatching entirely
+                if type(value) in leaf_types:  # pyright: ignore[reportAny]
+                    if out_key is None:
+                        frame.out.append(value)  # type: ignore[union-attr]  # pyright: ignore[reportAttributeAccessIssue]
+                    else:
+                        frame.out[out_key] = value  # type: ignore[index, call-overload]  # pyright: ignore[reportArgumentType, reportCallIssue]
+                    continue
+                child_node: _LazyPath = (frame.node, key)
+                child: Union[JSONitem, _SerializeFrame, None] = None
+                if refs is not None:
+                    ref_location: _RefLocation = (
+                        frame.ref_base,
+                        key if out_key is None else out_key,  # pyright: ignore[reportAny]
+                    )
+                    child = self._track_ref(value, ref_location, refs)
+                    refs.location = ref_location
+                if child is None:
+                    child = self._serialize_node(value, base_path, child_node)
+                if isinstance(child, _SerializeFrame):
+                    if id(value) not in active_ids:  # pyright: ignore[reportAny]
+                        if refs is not None:
+                            child.set_ref_location(ref_location)  # pyright: ignore[reportPossiblyUnbound]
+                        child.out_key = out_key
+                        stack.append(child)
+                        active_ids.add(id(value))  # pyright: ignore[reportAny]
+                        continue
+                    child = self._handle_error(
+                        ValueError(
+                            f"circular reference detected, object with {type(value) = } is its own ancestor"  # pyright: ignore[reportAny]
+                        ),
+                        value,
+                        _materialize_path(base_path, child_node),
+                        child.handler,
+                    )
+                if out_key is None:
+                    frame.out.append(child)  # type: ignore[union-attr]  # pyright: ignore[reportAttributeAccessIssue]
+                else:
+                    frame.out[out_key] = child  # type: ignore[index, call-overload]  # pyright: ignore[reportArgumentType, reportCallIssue]
+                continue
+
+            # the frame on top of the stack is done, give its output to the parent
+            stack.pop()
+            active_ids.discard(id(frame.obj))  # pyright: ignore[reportAny]
+            if not stack:
+                return output
+            parent: _SerializeFrame = stack[-1]
+            if frame.out_key is None:
+                parent.out.append(output)  # type: ignore[union-attr]  # pyright: ignore[reportAttributeAccessIssue]
+            else:
+                parent.out[frame.out_key] = output  # type: ignore[index, call-overload]  # pyright: ignore[reportArgumentType, reportCallIssue]
+
+    def _serialize_node(
+        self,
+        obj: Any,  # pyright: ignore[reportAny]
+        base_path: ObjectPath,
+        node: _LazyPath,
+    ) -> Union[JSONitem, _SerializeFrame]:
+        """serialize a single object, or return a new frame if it is a natively handled container"""
+        handler: SerializerHandler | None = None
+        path: ObjectPath | None = None
+        memo: Optional[_SerializationMemo] = self._memo
+        if memo is not None:
+            if self._is_memoizable(obj):
+                cached: Optional[tuple[JSONitem]] = memo.get(obj)
+                if cached is not None:
+                    return cached[0]
+            else:
+                memo = None
         try:
-            for handler in self.handlers:
-                if handler.check(self, obj, path):
-                    output: JSONitem = handler.serialize_func(self, obj, path)
-                    if self.write_only_format:
-                        if isinstance(output, dict) and _FORMAT_KEY in output:
-                            # TYPING: JSONitem has no idea that _FORMAT_KEY is str
-                            new_fmt: str = output.pop(_FORMAT_KEY)  # type: ignore  # pyright: ignore[reportAssignmentType]
-                            output["__write_format__"] = new_fmt  # type: ignore
-                    return output
+            candidates: MonoTuple[SerializerHandler] | None = self._dispatch_cache.get(
+                type(obj)  # pyright: ignore[reportAny]
+            )
+            if candidates is None:
+                path = _materialize_path(base_path, node)
+                candidates = self._dispatch(obj, path)
+
+            for handler in candidates:
+                if not handler.cache_by_type:
+                    if path is None:
+                        path = _materialize_path(base_path, node)
+                    if not handler.check(self, obj, path):
+                        continue
+
+                kind: str | None = _NATIVE_HANDLER_KINDS.get(id(handler))
+                if kind == "leaf":
+                    return obj  # pyright: ignore[reportAny]
+                elif kind is not None:
+                    if self.native_fast_path is not None:
+                        native: Union[dict[str, JSONitem], list[JSONitem], None] = (
+                            self._native_container(obj)
+                        )
+                        if native is not None:
+                            return native
+                    return _SerializeFrame(obj, handler, kind, node)
+
+                if path is None:
+                    path = _materialize_path(base_path, node)
+                refs: Optional[_RefTable] = _ACTIVE_REFS.get()
+                # nested calls made by the handler move `refs.location`
+                location: _RefLocation = refs.location if refs is not None else None
+                output: JSONitem = handler.serialize_func(self, obj, path)
+                if refs is not None and refs.pending:
+                    refs.resolve(output, location)
+                if self.write_only_format:
+                    if isinstance(output, dict) and _FORMAT_KEY in output:
+                        # TYPING: JSONitem has no idea that _FORMAT_KEY is str
+                        new_fmt: str = output.pop(_FORMAT_KEY)  # type: ignore  # pyright: ignore[reportAssignmentType]
+                        output["__write_format__"] = new_fmt  # type: ignore
+                # outputs from `dumps` may hold raw arrays, which `json_serialize` must not return
+                if memo is not None and not _NATIVE_ARRAYS.get():
+                    memo.put(obj, output)
+                return output
 
             raise ValueError(f"no handler found for object with {type(obj) = }")  # pyright: ignore[reportAny]
 
         except Exception as e:
-            if self.error_mode == ErrorMode.EXCEPT:
-                obj_str: str = repr(obj)  # pyright: ignore[reportAny]
-                if len(obj_str) > 1000:
-                    obj_str = obj_str[:1000] + "..."
-                handler_uid = handler.uid if handler else "no handler matched"
+            if path is None:
+                path = _materialize_path(base_path, node)
+            return self._handle_error(e, obj, path, handler)
+
+    def _track_ref(
+        self,
+        obj: Any,  # pyright: ignore[reportAny]
+        location: _RefLocation,
+        refs: _RefTable,
+    ) -> Optional[JSONdict]:
+        """for `shared_refs` and `array_dedup`: a `$ref` to the first occurrence of `obj` (or, for arrays,
+        of its contents) if it was already seen, otherwise record that it is being written at `location`
+        and return `None`. occurrences inside nested outputs which were not found can't be referred to"""
+        obj_type: type = type(obj)  # pyright: ignore[reportAny]
+        if obj_type in _UNTRACKED_TYPES:
+            return None
+        is_array: bool = refs.array_dedup and str(obj_type) in _ARRAY_TYPE_STRS
+        if not (refs.shared_refs or is_array):
+            return None
+        pointer: Optional[str]
+        seen: Optional[tuple[Any, _RefLocation]] = refs.by_id.get(id(obj))  # pyright: ignore[reportAny]
+        if seen is not None:
+            pointer = _ref_pointer(seen[1])
+            if pointer is not None:
+                return {_REF_KEY: pointer}
+        refs.by_id[id(obj)] = (obj, location)  # pyright: ignore[reportAny]
+        if is_array and obj.ndim > 0:  # pyright: ignore[reportAny]
+            try:
+                key, data = array_content_key(obj)  # pyright: ignore[reportAny]
+            except Exception:
+                # let the array handler report whatever is wrong with it
+                return None
+            same_key: list[tuple[Any, _RefLocation]] = refs.by_content.setdefault(
+                key, []
+            )
+            for prev_data, prev_location in same_key:  # pyright: ignore[reportAny]
+                # the key includes the shape and dtype, so the byte views are the same length
+                if (prev_data == data).all():  # pyright: ignore[reportAny]
+                    pointer = _ref_pointer(prev_location)
+                    if pointer is not None:
+                        return {_REF_KEY: pointer}
+            same_key.append((data, location))
+        return None
+
+    def _finalize_frame(self, frame: _SerializeFrame) -> JSONitem:
+        """build the output of a frame once all of its children are serialized"""
+        output: JSONitem = frame.out
+        if frame.kind == "set":
+            output = {
+                _FORMAT_KEY: "set" if isinstance(frame.obj, set) else "frozenset",
+                "data": frame.out,
+            }
+        if self.write_only_format:
+            if isinstance(output, dict) and _FORMAT_KEY in output:
+                # TYPING: JSONitem has no idea that _FORMAT_KEY is str
+                new_fmt: str = output.pop(_FORMAT_KEY)  # type: ignore  # pyright: ignore[reportAssignmentType]
+                output["__write_format__"] = new_fmt  # type: ignore
+        if (
+            self._memo is not None
+            and self._is_memoizable(frame.obj)
+            and not _NATIVE_ARRAYS.get()
+        ):
+            self._memo.put(frame.obj, output)
+        return output
+
+    def _handle_error(
+        self,
+        e: Exception,
+        obj: Any,  # pyright: ignore[reportAny]
+        path: ObjectPath,
+        handler: SerializerHandler | None,
+    ) -> JSONitem:
+        """raise, warn, or ignore an error according to `error_mode`, returning `repr(obj)` if not raising"""
+        if self.error_mode == ErrorMode.EXCEPT:
+            obj_str: str = repr(obj)  # pyright: ignore[reportAny]
+            if len(obj_str) > 1000:
+                obj_str = obj_str[:1000] + "..."
+            handler_uid = handler.uid if handler else "no handler matched"
+            raise SerializationException(
+                f"error serializing at {path = } with last handler: '{handler_uid}'\nfrom: {e}\nobj: {obj_str}"
+            ) from e
+        elif self.error_mode == ErrorMode.WARN:
+            warnings.warn(
+                f"error serializing at {path = }, will return as string\n{obj = }\nexception = {e}"
+            )
+
+        return repr(obj)  # pyright: ignore[reportAny]
+
+    def iter_encode(
+        self,
+        obj: Any,  # pyright: ignore[reportAny]
+        path: ObjectPath = (),
+        chunk_size: int = ITER_ENCODE_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        """serialize `obj` and encode it as json text, yielding the text in chunks
+
+        walks `obj` with the same handlers as `json_serialize`, but writes containers handled by the
+        default handlers directly as text instead of building the intermediate tree, so peak memory
+        does not scale with the size of the object. `"".join(self.iter_encode(obj))` is the same as
+        `json.dumps(self.json_serialize(obj))`.
+
+        # Parameters:
+         - `obj : Any`
+            object to serialize
+         - `path : ObjectPath`
+            path to the object, passed to handlers
+            (defaults to `()`)
+         - `chunk_size : int`
+            approximate number of characters in each yielded chunk
+            (defaults to `ITER_ENCODE_CHUNK_SIZE`)
+
+        # Raises:
+         - `SerializationException` : as in `json_serialize`, and additionally if iterating over a
+            container fails partway through, regardless of `error_mode`, since part of the container
+            has already been written
+        """
+        active: Optional[_RefTable] = _ACTIVE_REFS.get()
+        if active is None and not (self.shared_refs or self.array_dedup):
+            yield from self._iter_encode_stack(obj, tuple(path), chunk_size, None)
+            return
+
+        # a `$ref` can't point into text streamed by a nested call, so nothing is tracked in one
+        refs: _RefTable = (
+            _RefTable(self.shared_refs, self.array_dedup)
+            if active is None
+            else _RefTable(False, False)
+        )
+        # only mark references as active while the inner generator is running, not between chunks
+        chunks: Iterator[str] = self._iter_encode_stack(
+            obj, tuple(path), chunk_size, refs
+        )
+        while True:
+            token: contextvars.Token[Optional[_RefTable]] = _ACTIVE_REFS.set(refs)
+            try:
+                chunk: Optional[str] = next(chunks, None)
+            finally:
+                _ACTIVE_REFS.reset(token)
+            if chunk is None:
+                return
+            yield chunk
+
+    def _iter_encode_stack(
+        self,
+        obj: Any,  # pyright: ignore[reportAny]
+        base_path: ObjectPath,
+        chunk_size: int,
+        refs: Optional[_RefTable],
+    ) -> Iterator[str]:
+        """the explicit-stack loop of `iter_encode`. `refs` is the memo for `shared_refs` and `array_dedup`, or `None`"""
+        encode: Callable[[Any], str] = _JSON_ENCODER.encode
+
+        if refs is not None:
+            self._track_ref(obj, None, refs)
+            refs.location = None
+        root: Union[JSONitem, _SerializeFrame] = self._serialize_node(
+            obj, base_path, None
+        )
+        if not isinstance(root, _SerializeFrame):
+            yield encode(root)
+            return
+        if root.kind == "mapping":
+            root.children = _merged_str_key_items(root.obj)  # pyright: ignore[reportAny]
+        if refs is not None:
+            root.set_ref_location(None)
+
+        buffer: list[str] = [self._frame_open(root)]
+        buffer_len: int = 0
+        stack: list[_SerializeFrame] = [root]
+        # parallel to `stack`: whether no children have been written yet, and the
+        # value under `_FORMAT_KEY` held back when `write_only_format` is set
+        is_first: list[bool] = [True]
+        held_format: list[Optional[tuple[JSONitem]]] = [None]
+        active_ids: set[int] = {id(obj)}  # pyright: ignore[reportAny]
+        # when profiling, leaves go through `_serialize_node` so they are counted
+        leaf_types: set[type] = self._leaf_types if not self.profile else set()
+        while stack:
+            if buffer_len >= chunk_size:
+                yield "".join(buffer)
+                buffer.clear()
+                buffer_len = 0
+
+            frame: _SerializeFrame = stack[-1]
+            piece: str
+            try:
+                key, value = next(frame.children)  # pyright: ignore[reportAny]
+                out_key: Optional[str] = str(key) if frame.out_is_dict else None  # pyright: ignore[reportAny]
+            except StopIteration:
+                piece = self._frame_close(frame, is_first[-1], held_format[-1])
+                stack.pop()
+                is_first.pop()
+                held_format.pop()
+                active_ids.discard(id(frame.obj))  # pyright: ignore[reportAny]
+                buffer.append(piece)
+                buffer_len += len(piece)
+                continue
+            except Exception as e:
+                # part of this container was already written, so we can't fall back to its repr
                 raise SerializationException(
-                    f"error serializing at {path = } with last handler: '{handler_uid}'\nfrom: {e}\nobj: {obj_str}"
+                    f"error serializing at path = {_materialize_path(base_path, frame.node)} with last handler: '{frame.handler.uid}'\n"
+                    + f"from: {e}\n(cannot recover since output was already streamed)"
                 ) from e
-            elif self.error_mode == ErrorMode.WARN:
-                warnings.warn(
-                    f"error serializing at {path = }, will return as string\n{obj = }\nexception = {e}"
+
+            child_node: _LazyPath = (frame.node, key)
+            if (
+                out_key == _FORMAT_KEY
+                and self.write_only_format
+                and frame.kind != "set"
+            ):
+                # moved to the end under "__write_format__", like in `json_serialize`
+                held_format[-1] = (
+                    self.json_serialize(
+                        value, _materialize_path(base_path, child_node)
+                    ),
+                )
+                continue
+
+            prefix: str = "" if is_first[-1] else ", "
+            is_first[-1] = False
+            if out_key is not None:
+                prefix += encode(out_key) + ": "
+
+            if type(value) in leaf_types:  # pyright: ignore[reportAny]
+                piece = prefix + encode(value)
+            else:
+                child: Union[JSONitem, _SerializeFrame, None] = None
+                if refs is not None:
+                    ref_location: _RefLocation = (
+                        frame.ref_base,
+                        key if out_key is None else out_key,  # pyright: ignore[reportAny]
+                    )
+                    child = self._track_ref(value, ref_location, refs)
+                    refs.location = ref_location
+                if child is None:
+                    child = self._serialize_node(value, base_path, child_node)
+                if isinstance(child, _SerializeFrame):
+                    if id(value) not in active_ids:  # pyright: ignore[reportAny]
+                        if child.kind == "mapping":
+                            child.children = _merged_str_key_items(value)  # pyright: ignore[reportAny]
+                        if refs is not None:
+                            child.set_ref_location(ref_location)  # pyright: ignore[reportPossiblyUnbound]
+                        stack.append(child)
+                        is_first.append(True)
+                        held_format.append(None)
+                        active_ids.add(id(value))  # pyright: ignore[reportAny]
+                        piece = prefix + self._frame_open(child)
+                        buffer.append(piece)
+                        buffer_len += len(piece)
+                        continue
+                    child = self._handle_error(
+                        ValueError(
+                            f"circular reference detected, object with {type(value) = } is its own ancestor"  # pyright: ignore[reportAny]
+                        ),
+                        value,
+                        _materialize_path(base_path, child_node),
+                        child.handler,
+                    )
+                piece = prefix + encode(child)
+
+            buffer.append(piece)
+            buffer_len += len(piece)
+
+        if buffer:
+            yield "".join(buffer)
+
+    def _frame_open(self, frame: _SerializeFrame) -> str:
+        """opening text of a frame, for `iter_encode`"""
+        if frame.kind == "set":
+            if self.write_only_format:
+                return '{"data": ['
+            fmt: str = "set" if isinstance(frame.obj, set) else "frozenset"
+            return f'{{"{_FORMAT_KEY}": "{fmt}", "data": ['
+        return "{" if frame.out_is_dict else "["
+
+    def _frame_close(
+        self,
+        frame: _SerializeFrame,
+        is_first: bool,
+        held_format: Optional[tuple[JSONitem]],
+    ) -> str:
+        """closing text of a frame, for `iter_encode`"""
+        if frame.kind == "set":
+            if self.write_only_format:
+                fmt: str = "set" if isinstance(frame.obj, set) else "frozenset"
+                return f'], "__write_format__": "{fmt}"}}'
+            return "]}"
+        if not frame.out_is_dict:
+            return "]"
+        if held_format is not None:
+            sep: str = "" if is_first else ", "
+            return f'{sep}"__write_format__": {_JSON_ENCODER.encode(held_format[0])}}}'
+        return "}"
+
+    def dumps(
+        self,
+        obj: Any,  # pyright: ignore[reportAny]
+        path: ObjectPath = (),
+    ) -> str:
+        """serialize `obj` and encode it to a json string using the json backend
+
+        if the backend encodes numpy arrays natively, arrays serialized in the `list` or
+        `array_list_meta` modes are handed to it directly instead of being converted to nested lists
+        """
+        backend: JsonBackend = (
+            self.json_backend if self.json_backend is not None else get_json_backend()
+        )
+        if not backend.native_numpy:
+            return backend.dumps(self.json_serialize(obj, path=path))
+
+        token: contextvars.Token[bool] = _NATIVE_ARRAYS.set(True)
+        try:
+            serialized: JSONitem = self.json_serialize(obj, path=path)
+        finally:
+            _NATIVE_ARRAYS.reset(token)
+        return backend.dumps(serialized)
+
+    def json_serialize_many(
+        self,
+        items: Iterable[Any],
+        parallel: Union[bool, int] = False,
+        chunksize: Optional[int] = None,
+        use_multiprocess: bool = False,
+        path: ObjectPath = (),
+    ) -> list[JSONitem]:
+        """serialize each of `items`, possibly sharding them across a process pool
+
+        the output is the same as `[self.json_serialize(x, path=(*path, i)) for i, x in enumerate(items)]`,
+        in the same order. the items are split into chunks which are serialized by workers via
+        `muutils.parallel.run_maybe_parallel`. where processes are started by forking, the workers inherit
+        the items and only the outputs are pickled. otherwise each chunk (along with this serializer) is
+        pickled and sent to a worker, so fewer, larger chunks keep the pickling overhead low, and custom
+        handlers must be picklable unless `use_multiprocess` is set
+
+        # Parameters:
+         - `items : Iterable[Any]`
+            objects to serialize. must be picklable if running in parallel
+         - `parallel : bool | int`
+            whether to run in parallel, and how many processes to use. see `run_maybe_parallel`
+            (defaults to `False`)
+         - `chunksize : int | None`
+            number of items sent to a worker at once. if `None`, splits the items into about 4 chunks per process
+            (defaults to `None`)
+         - `use_multiprocess : bool`
+            use the `multiprocess` package (which pickles with `dill`) instead of `multiprocessing`, for handlers
+            which can't be pickled normally
+            (defaults to `False`)
+         - `path : ObjectPath`
+            path to the collection, the path of each item is this plus its index
+            (defaults to `()`)
+
+        # Raises:
+         - `ValueError` : if `shared_refs` or `array_dedup` is set, since references can't span items serialized separately.
+            use `json_serialize` on the whole collection instead
+         - `ValueError` : if `parallel` or `chunksize` is invalid, or if `parallel` is used with `array_blob`,
+            since workers can't write to the same sidecar file
+        """
+        if self.shared_refs or self.array_dedup:
+            raise ValueError(
+                "json_serialize_many does not support shared_refs or array_dedup, use json_serialize on the whole collection instead"
+            )
+        items_list: list[Any] = list(items)
+        base_path: ObjectPath = tuple(path)
+        if not parallel:
+            return [
+                self.json_serialize(item, tuple(base_path) + (i,))  # pyright: ignore[reportAny]
+                for i, item in enumerate(items_list)  # pyright: ignore[reportAny]
+            ]
+        if self.array_blob is not None:
+            raise ValueError("json_serialize_many can't use array_blob with parallel")
+
+        from muutils.parallel import run_maybe_parallel
+
+        if chunksize is None:
+            num_processes: int = (
+                multiprocessing.cpu_count() if parallel is True else int(parallel)
+            )
+            chunksize = max(1, -(-len(items_list) // (num_processes * 4)))
+        elif chunksize < 1:
+            raise ValueError(f"chunksize must be at least 1, got {chunksize = }")
+
+        starts: range = range(0, len(items_list), chunksize)
+        chunk_outputs: list[list[JSONitem]]
+        # without fixing the start method if it was not set yet, the first supported one is the default
+        start_method: str = (
+            multiprocessing.get_start_method(allow_none=True)
+            or multiprocessing.get_all_start_methods()[0]
+        )
+        if not use_multiprocess and start_method == "fork":
+            # forked workers inherit the items, so only the chunk bounds need to be pickled
+            global _FORKED_SERIALIZE_MANY
+            _FORKED_SERIALIZE_MANY = (self, base_path, items_list)
+            try:
+                chunk_outputs = run_maybe_parallel(
+                    func=_json_serialize_forked_chunk,
+                    iterable=[(start, start + chunksize) for start in starts],
+                    parallel=parallel,
+                    chunksize=1,
+                    keep_ordered=True,
+                    pbar="none",
                 )
+            finally:
+                _FORKED_SERIALIZE_MANY = None
+        else:
+            chunk_outputs = run_maybe_parallel(
+                func=_json_serialize_chunk,
+                iterable=[
+                    (self, base_path, start, items_list[start : start + chunksize])
+                    for start in starts
+                ],
+                parallel=parallel,
+                chunksize=1,
+                keep_ordered=True,
+                use_multiprocess=use_multiprocess,
+                pbar="none",
+            )
+        return [output for chunk in chunk_outputs for output in chunk]
 
-            return repr(obj)  # pyright: ignore[reportAny]
+    def __reduce__(
+        self,
+    ) -> tuple[Callable[[dict[str, Any]], JsonSerializer], tuple[dict[str, Any]]]:
+        """pickle by config, so serializers can be sent to worker processes
+
+        the default handlers are lambdas which can't be pickled, so handlers from `DEFAULT_HANDLERS`
+        are stored by index. the dispatch cache, memo, and `array_blob` are not kept
+        """
+        default_handler_ids: dict[int, int] = {
+            id(handler): i for i, handler in enumerate(DEFAULT_HANDLERS)
+        }
+        config: dict[str, Any] = dict(
+            array_mode=self.array_mode,
+            error_mode=self.error_mode,
+            handlers=[
+                default_handler_ids.get(id(handler), handler)
+                for handler in self._handlers
+            ],
+            write_only_format=self.write_only_format,
+            native_fast_path=self.native_fast_path,
+            json_backend=(
+                self.json_backend.name if self.json_backend is not None else None
+            ),
+            shared_refs=self.shared_refs,
+            array_dedup=self.array_dedup,
+            memo_size=self.memo_size,
+            profile=self.profile,
+            fallback_mode=self.fallback_mode,
+            array_codec=self.array_codec,
+            array_codec_level=self.array_codec_level,
+            array_chunk_bytes=self.array_chunk_bytes,
+            array_text_precision=self.array_text_precision,
+            array_quantize=self.array_quantize,
+        )
+        return (_unpickle_json_serializer, (config,))
+
+    def dump(
+        self,
+        obj: Any,  # pyright: ignore[reportAny]
+        fp: TextIO,
+        path: ObjectPath = (),
+        chunk_size: int = ITER_ENCODE_CHUNK_SIZE,
+    ) -> None:
+        """serialize `obj` and write it as json to the file-like `fp`, without building the whole output in memory
+
+        see `iter_encode`
+        """
+        for chunk in self.iter_encode(obj, path=path, chunk_size=chunk_size):
+            fp.write(chunk)
 
     def hashify(
         self,
@@ -385,6 +1777,40 @@ class JsonSerializer:
         return _recursive_hashify(data, force=force)
 
 
+def _unpickle_json_serializer(config: dict[str, Any]) -> JsonSerializer:
+    """rebuild a `JsonSerializer` pickled by `JsonSerializer.__reduce__`"""
+    handlers: list[SerializerHandler] = [
+        DEFAULT_HANDLERS[handler] if isinstance(handler, int) else handler
+        for handler in config.pop("handlers")  # pyright: ignore[reportAny]
+    ]
+    return JsonSerializer(handlers_default=tuple(handlers), **config)  # pyright: ignore[reportAny]
+
+
+def _json_serialize_chunk(
+    task: tuple[JsonSerializer, ObjectPath, int, list[Any]],
+) -> list[JSONitem]:
+    """serialize a chunk of items for `JsonSerializer.json_serialize_many`, runs in a worker process"""
+    jser, base_path, start, chunk = task
+    return [
+        jser.json_serialize(item, tuple(base_path) + (start + i,))  # pyright: ignore[reportAny]
+        for i, item in enumerate(chunk)  # pyright: ignore[reportAny]
+    ]
+
+
+# the serializer, base path, and items of the `json_serialize_many` call in progress, for forked workers
+_FORKED_SERIALIZE_MANY: Optional[tuple[JsonSerializer, ObjectPath, list[Any]]] = None
+
+
+def _json_serialize_forked_chunk(bounds: tuple[int, int]) -> list[JSONitem]:
+    """serialize `items[start:stop]` for `JsonSerializer.json_serialize_many`, runs in a forked worker process"""
+    assert _FORKED_SERIALIZE_MANY is not None, (
+        "worker was not forked from json_serialize_many"
+    )
+    jser, base_path, items = _FORKED_SERIALIZE_MANY
+    start, stop = bounds
+    return _json_serialize_chunk((jser, base_path, start, items[start:stop]))
+
+
 GLOBAL_JSON_SERIALIZER: JsonSerializer = JsonSerializer()
 
 
@@ -401,3 +1827,8 @@ def json_serialize(obj: Any, path: ObjectPath = ()) -> JSONitem: ...
 def json_serialize(obj: Any, path: ObjectPath = ()) -> JSONitem:  # pyright: ignore[reportAny]
     """serialize object to json-serializable object with default config"""
     return GLOBAL_JSON_SERIALIZER.json_serialize(obj, path=path)
+
+
+def json_serialize_dumps(obj: Any, path: ObjectPath = ()) -> str:  # pyright: ignore[reportAny]
+    """serialize object with default config and encode it to a json string with the selected json backend"""
+    return GLOBAL_JSON_SERIALIZER.dumps(obj, path=path)
@@ -52,10 +52,13 @@ which gives us:
 from __future__ import annotations
 
 import abc
+import copy
 import dataclasses
 import functools
-import json
+import inspect
+import operator
 import sys
+import types
 import typing
 import warnings
 from typing import Any, Optional, Type, TypeVar, overload, TYPE_CHECKING
@@ -66,13 +69,18 @@ from muutils.json_serialize.serializable_field import (
     SerializableField,
     serializable_field,
 )
+from muutils.json_serialize.json_backend import json_dumps, json_loads
 from muutils.json_serialize.types import _FORMAT_KEY
 from muutils.json_serialize.util import (
     JSONdict,
     array_safe_eq,
     dc_eq,
+    dc_hash,
 )
 
+if TYPE_CHECKING:
+    from muutils.json_serialize.array import ArrayMode
+
 # pylint: disable=bad-mcs-classmethod-argument, too-many-arguments, protected-access
 
 # For type checkers: always use typing_extensions which they can resolve
@@ -112,6 +120,9 @@ class ZanjMissingWarning(UserWarning):
 _zanj_loading_needs_import: bool = True
 "flag to keep track of if we have successfully imported ZANJ"
 
+_SERIALIZABLE_DATACLASS_FORMATS: dict[str, type] = dict()
+"maps the `_FORMAT_KEY` value of each registered serializable dataclass to the class. if names clash, the most recently defined class wins"
+
 
 def zanj_register_loader_serializable_dataclass(
     cls: typing.Type[T_SerializeableDataclass],
@@ -146,7 +157,11 @@ def zanj_register_loader_serializable_dataclass(
             and _FORMAT_KEY in json_item
             and json_item[_FORMAT_KEY].startswith(_format)
         ),
-        load=lambda json_item, path=None, z=None: cls.load(json_item),  # type: ignore
+        load=lambda json_item, path=None, z=None: (  # type: ignore
+            cls.load_many(json_item)
+            if json_item[_FORMAT_KEY].endswith(_COLUMNAR_FORMAT_SUFFIX)
+            else cls.load(json_item)
+        ),
         uid=_format,
         source_pckg=cls.__module__,
         desc=f"{_format} loader via muutils.json_serialize.serializable_dataclass",
@@ -213,6 +228,12 @@ def SerializableDataclass__validate_field_type(
         f"Field '{_field.name = }' on class {self.__class__ = } is not a SerializableField, but a {type(_field) = }"
     )
 
+    # lazy fields which are not loaded yet are checked when they are loaded
+    if _field.lazy:
+        lazy_field: Any = getattr(self.__class__, _field.name, None)
+        if isinstance(lazy_field, _LazyField) and lazy_field.pending(self) is not None:
+            return True
+
     # get field type hints
     try:
         field_type_hint: Any = get_cls_type_hints(self.__class__)[_field.name]
@@ -378,6 +399,104 @@ class SerializableDataclass(abc.ABC):
         "takes in an appropriately structured dict and returns an instance of the class, implemented by using `@serializable_dataclass` decorator"
         raise NotImplementedError(f"decorate {cls = } with `@serializable_dataclass`")
 
+    @classmethod
+    def serialize_many(
+        cls,
+        items: typing.Sequence[Self],
+        array_mode: "ArrayMode" = "array_b64_meta",
+    ) -> dict[str, Any]:
+        """serialize a sequence of instances of exactly this class in a columnar format, the inverse of `load_many`
+
+        instead of one dict per instance, each repeating the format and every field name, this returns
+        ```
+        {
+            _FORMAT_KEY: "MyClass(SerializableDataclass):columnar",
+            "n": len(items),
+            "fields": [<the keys of `item.serialize()`>],
+            "columns": [<for each key, the list of serialized values>],
+        }
+        ```
+        columns of only `int`s (which fit in an int64), only `float`s, or only `bool`s are stored as
+        numpy arrays with `serialize_array` in `array_mode`, if numpy is installed
+
+        the columns are read a field at a time, and only values of other than plain types go through the
+        `serialization_fn` or `.serialize()` one by one. if `serialize` was replaced, it is called for each item
+
+        # Raises:
+         - `TypeError`: if an item is not an instance of exactly this class
+         - `ValueError`: if `array_mode` is `"array_summary_meta"`, which does not store the data
+        """
+        if array_mode == "array_summary_meta":
+            raise ValueError(
+                f"columns can't be stored without data, got {array_mode = }"
+            )
+        for item_type in set(map(operator.attrgetter("__class__"), items)) - {cls}:
+            raise TypeError(
+                f"all items must be instances of exactly {cls.__name__}, got {item_type = }"
+            )
+        named_columns: Optional[tuple[list[str], list[Any]]] = (
+            _serialize_columns(cls, items, array_mode)
+            if _uses_generated_method(cls, "serialize")
+            else None
+        )
+        if named_columns is None:
+            # `serialize` was replaced, so the columns are read from its output for each item
+            names: list[str] = [
+                f.name
+                for f in dataclasses.fields(cls)  # type: ignore[arg-type]
+                if getattr(f, "serialize", True)
+            ] + list(getattr(cls, "_properties_to_serialize", []))
+            rows: list[dict[str, Any]] = [item.serialize() for item in items]
+            if rows:
+                names = [k for k in rows[0] if k != _FORMAT_KEY]
+            named_columns = (
+                names,
+                [
+                    _column_to_array([row[name] for row in rows], name, array_mode)
+                    for name in names
+                ],
+            )
+        return {
+            _FORMAT_KEY: f"{cls.__name__}(SerializableDataclass){_COLUMNAR_FORMAT_SUFFIX}",
+            "n": len(items),
+            "fields": named_columns[0],
+            "columns": named_columns[1],
+        }
+
+    @classmethod
+    def load_many(cls, data: dict[str, Any]) -> list[Self]:
+        """load the instances serialized with `serialize_many`
+
+        each array column is loaded with a single call to `load_array`, and each field is loaded for its whole column.
+        the instances are then constructed directly, and the types are checked once for each column. if a check
+        fails, or `load` was replaced, each instance is loaded from its row with `load` instead, so custom loading
+        and type mismatches behave as for `serialize` and `load`
+
+        # Raises:
+         - `ValueError`: if `data` is not in the columnar format, or its columns don't all have `n` values
+        """
+        fmt: Any = data.get(_FORMAT_KEY)
+        if not (isinstance(fmt, str) and fmt.endswith(_COLUMNAR_FORMAT_SUFFIX)):
+            raise ValueError(
+                f"expected the columnar format written by `serialize_many`, got {_FORMAT_KEY} = {fmt!r}"
+            )
+        names: list[str] = list(data["fields"])
+        columns: list[list[Any]] = [_column_from_array(c) for c in data["columns"]]
+        n: int = int(data["n"])
+        if len(columns) != len(names) or any(len(c) != n for c in columns):
+            raise ValueError(
+                f"expected {len(names)} columns of {n} values, got lengths {[len(c) for c in columns]}"
+            )
+        if _uses_generated_method(cls, "load"):
+            loaded: Optional[list[Any]] = _load_columns(cls, names, columns, n)
+            if loaded is not None:
+                return loaded
+        rows: typing.Iterable[typing.Tuple[Any, ...]] = (
+            zip(*columns) if columns else [()] * n
+        )
+        # not bound once, since the first call to `load` can replace it with a generated version
+        return [cls.load(dict(zip(names, row))) for row in rows]
+
     def validate_fields_types(
         self, on_typecheck_error: ErrorMode = _DEFAULT_ON_TYPECHECK_ERROR
     ) -> bool:
@@ -396,12 +515,36 @@ class SerializableDataclass(abc.ABC):
             self, field, on_typecheck_error=on_typecheck_error
         )
 
+    # no slots of its own, so it can be mixed in with `Exception`, `int` or `tuple`.
+    # `_hash_cache` is kept in the `__dict__`, or in a slot of `slots=True` classes
+    __slots__ = ()
+
     def __eq__(self, other: Any) -> bool:
         return dc_eq(self, other)
 
     def __hash__(self) -> int:
-        "hashes the json-serialized representation of the class"
-        return hash(json.dumps(self.serialize()))
+        "structural hash of the fields, consistent with `dc_eq`. see `dc_hash`"
+        return dc_hash(self)
+
+    def __getstate__(self) -> dict[str, Any]:
+        "state for pickling: the instance `__dict__` and any slots, without the cached hash"
+        state: dict[str, Any] = {
+            # lazy fields which are not loaded yet hold the whole serialized instance
+            name: getattr(self, name) if value.__class__ is _LazyValue else value
+            for name, value in getattr(self, "__dict__", {}).items()
+            if name not in _UNPICKLED_SLOTS
+        }
+        for klass in self.__class__.__mro__:
+            slots: str | typing.Iterable[str] = klass.__dict__.get("__slots__", ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name not in _UNPICKLED_SLOTS and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # frozen dataclasses block `setattr`
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
     def diff(
         self, other: "SerializableDataclass", of_serialized: bool = False
@@ -509,12 +652,308 @@ class SerializableDataclass(abc.ABC):
                     setattr(self, field_name, nested_dict[field_name])
 
     def __copy__(self) -> "SerializableDataclass":
-        "deep copy by serializing and loading the instance to json"
-        return self.__class__.load(json.loads(json.dumps(self.serialize())))
+        "deep copy, the same as `copy.deepcopy`"
+        return self.__deepcopy__(dict())
 
     def __deepcopy__(self, memo: dict) -> "SerializableDataclass":
-        "deep copy by serializing and loading the instance to json"
-        return self.__class__.load(json.loads(json.dumps(self.serialize())))
+        """deep copy by copying each attribute, see `_deepcopy_attribute`, keeping objects shared within the instance shared
+
+        if that fails (for example, for attributes which can't be deep copied), falls back to
+        serializing and loading the instance to json
+        """
+        try:
+            return _deepcopy_structural(self, memo)
+        except Exception:
+            memo.pop(id(self), None)
+            return self.__class__.load(json_loads(json_dumps(self.serialize())))
+
+
+def _add_slots(cls: type, extra_slots: typing.Tuple[str, ...] = ()) -> type:
+    """a copy of the dataclass `cls` with `__slots__` for its fields and `extra_slots`, as `dataclasses.dataclass(slots=True)` makes
+
+    the class has to be created again, since `__slots__` only has an effect when the class is created.
+    this is used instead of `dataclasses.dataclass(slots=True)`, which is only on python >= 3.10 and can't add `_hash_cache`
+    """
+    cls_dict: dict[str, Any] = dict(cls.__dict__)
+    if "__slots__" in cls_dict:
+        raise TypeError(f"{cls.__name__} already specifies __slots__")
+    field_names: typing.Tuple[str, ...] = tuple(f.name for f in dataclasses.fields(cls))  # type: ignore[arg-type]
+    # slots of the base classes, such as `_hash_cache`, can't be declared again
+    inherited: set[str] = set()
+    for base in cls.__mro__[1:-1]:
+        base_slots: str | typing.Iterable[str] = base.__dict__.get("__slots__", ())
+        inherited.update((base_slots,) if isinstance(base_slots, str) else base_slots)
+    cls_dict["__slots__"] = tuple(
+        name for name in field_names + extra_slots if name not in inherited
+    )
+    for name in field_names:
+        # the defaults are kept by the generated `__init__`, and would conflict with the slot descriptors
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    new_cls: type = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+def _update_class_cells(old_cls: type, new_cls: type) -> None:
+    """point the `__class__` cells of the methods of `new_cls` (used by zero-argument `super()`) from `old_cls` to `new_cls`"""
+    for value in new_cls.__dict__.values():
+        if isinstance(value, (classmethod, staticmethod)):
+            funcs: typing.Tuple[Any, ...] = (value.__func__,)
+        elif isinstance(value, property):
+            funcs = (value.fget, value.fset, value.fdel)
+        else:
+            funcs = (value,)
+        for func in funcs:
+            for cell in getattr(func, "__closure__", None) or ():
+                try:
+                    if cell.cell_contents is old_cls:
+                        cell.cell_contents = new_cls
+                except ValueError:
+                    # empty cell
+                    pass
+
+
+class _LazyValue:
+    """the serialized data of an instance, stored in a field with `lazy=True` until the field is first accessed"""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: typing.Mapping[str, Any]) -> None:
+        self.data: typing.Mapping[str, Any] = data
+
+
+class _LazyField:
+    """descriptor for a field with `lazy=True`, set on the class by `serializable_dataclass`
+
+    `load` stores a `_LazyValue` in the field. the first time the field is accessed, it is loaded from
+    the `_LazyValue` as `load` would have, stored, and its type is checked. values are stored in the slot
+    of the field if the class has one, otherwise in the instance `__dict__`
+    """
+
+    def __init__(
+        self,
+        cls: type,
+        field: SerializableField,
+        slot: Any,
+        on_typecheck_error: ErrorMode,
+        on_typecheck_mismatch: ErrorMode,
+    ) -> None:
+        self.cls: type = cls
+        self.field: SerializableField = field
+        self.name: str = field.name
+        self.slot: Any = slot
+        self.on_typecheck_error: ErrorMode = on_typecheck_error
+        self.on_typecheck_mismatch: ErrorMode = on_typecheck_mismatch
+
+    def _get_stored(self, obj: Any) -> Any:
+        if self.slot is not None:
+            return self.slot.__get__(obj, obj.__class__)
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(
+                f"{obj.__class__.__name__!r} object has no attribute {self.name!r}"
+            ) from None
+
+    def _set_stored(self, obj: Any, value: Any) -> None:
+        if self.slot is not None:
+            self.slot.__set__(obj, value)
+        else:
+            obj.__dict__[self.name] = value
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        value: Any = self._get_stored(obj)
+        if value.__class__ is _LazyValue:
+            lazy: _LazyValue = value
+            value = self._load(lazy.data)
+            # stored before the check, which reads the field
+            self._set_stored(obj, value)
+            try:
+                self._check(obj)
+            except Exception:
+                # so the next access checks the value again, instead of returning it
+                self._set_stored(obj, lazy)
+                raise
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        self._set_stored(obj, value)
+
+    def pending(self, obj: Any) -> Optional[_LazyValue]:
+        """the `_LazyValue` in the field of `obj` if it is not loaded yet, otherwise `None`"""
+        try:
+            value: Any = self._get_stored(obj)
+        except AttributeError:
+            return None
+        return value if value.__class__ is _LazyValue else None
+
+    def _load(self, data: typing.Mapping[str, Any]) -> Any:
+        """load the value of the field from the serialized instance, as `load` does for other fields"""
+        field: SerializableField = self.field
+        if field.deserialize_fn:
+            return field.deserialize_fn(data[self.name])
+        if field.loading_fn:
+            return field.loading_fn(data)
+        value: Any = data[self.name]
+        field_type_hint: Any = get_cls_type_hints(self.cls).get(self.name, None)  # type: ignore[arg-type]
+        if (
+            field_type_hint is not None
+            and hasattr(field_type_hint, "load")
+            and callable(field_type_hint.load)
+        ):
+            if not isinstance(value, dict):
+                _raise_field_loading_error(field_type_hint, value)
+            return field_type_hint.load(value)
+        return value
+
+    def _check(self, obj: Any) -> None:
+        """check the type of the newly loaded field, handling a mismatch according to `on_typecheck_mismatch`"""
+        if self.on_typecheck_mismatch == ErrorMode.IGNORE:
+            return
+        if not obj.validate_field_type(self.field, self.on_typecheck_error):
+            value: Any = self._get_stored(obj)
+            field_type_hint: Any = get_cls_type_hints(self.cls).get(self.name)  # type: ignore[arg-type]
+            self.on_typecheck_mismatch.process(
+                f"Type mismatch in fields of {obj.__class__.__name__}:\n"
+                + f"{self.name}:\texpected {field_type_hint = }, but got value {value = }, {type(value) = }",
+                except_cls=FieldTypeMismatchError,
+            )
+
+
+def _field_slot(cls: type, name: str) -> Any:
+    """the slot descriptor for attribute `name` of `cls` or its bases, or `None` if it has no slot"""
+    for klass in cls.__mro__:
+        attr: Any = klass.__dict__.get(name)
+        if isinstance(attr, _LazyField):
+            return attr.slot
+        if isinstance(attr, types.MemberDescriptorType):
+            return attr
+    return None
+
+
+# appended to the `_FORMAT_KEY` value of the output of `SerializableDataclass.serialize_many`
+_COLUMNAR_FORMAT_SUFFIX: str = ":columnar"
+
+# element types of the columns which `_column_to_array` stores as numpy arrays, and their dtypes
+_COLUMN_ARRAY_DTYPES: dict[type, str] = {int: "int64", float: "float64", bool: "bool"}
+
+
+def _column_to_array(
+    column: list[Any],
+    name: str,
+    array_mode: "ArrayMode",
+    col_types: Optional[set[type]] = None,
+) -> Any:
+    """a column of `serialize_many`, serialized with `serialize_array` if all its values are ints, floats, or bools
+
+    `col_types` is the set of the types of the values, if already known
+    """
+    if not column:
+        return column
+    if col_types is None:
+        col_types = set(map(type, column))
+    if len(col_types) != 1:
+        return column
+    dtype: Optional[str] = _COLUMN_ARRAY_DTYPES.get(next(iter(col_types)))
+    if dtype is None:
+        return column
+    try:
+        import numpy as np
+
+        from muutils.json_serialize.array import serialize_array
+        from muutils.json_serialize.json_serialize import JsonSerializer
+    except ImportError:
+        return column
+    try:
+        arr: Any = np.array(column, dtype=dtype)
+    except OverflowError:
+        # ints which don't fit in an int64
+        return column
+    return serialize_array(
+        JsonSerializer(array_mode=array_mode), arr, (name,), array_mode
+    )
+
+
+def _column_from_array(column: Any) -> list[Any]:
+    """the values of a column written by `_column_to_array`"""
+    if isinstance(column, list):
+        return column
+    from muutils.json_serialize.array import load_array
+
+    return load_array(column).tolist()
+
+
+# attributes left out of `SerializableDataclass.__getstate__` and structural copies.
+# the hash depends on `PYTHONHASHSEED` and on ids, so it is recomputed after unpickling
+_UNPICKLED_SLOTS: frozenset[str] = frozenset({"_hash_cache", "__dict__", "__weakref__"})
+
+
+def _cached_dc_hash(self: Any) -> int:
+    """`__hash__` of frozen serializable dataclasses: `dc_hash` computed on first use and kept in `_hash_cache`
+
+    assumes the contents of the fields are not modified in place after hashing, as for any hashable object
+    """
+    try:
+        return self._hash_cache
+    except AttributeError:
+        pass
+    value: int = dc_hash(self)
+    try:
+        object.__setattr__(self, "_hash_cache", value)
+    except AttributeError:
+        # slotted by hand, without a `__dict__` or a `_hash_cache` slot
+        pass
+    return value
+
+
+# exact types which `_deepcopy_attribute` returns as-is, like `copy.deepcopy` does
+_IMMUTABLE_COPY_TYPES: frozenset[type] = frozenset(
+    {bool, int, float, complex, str, bytes, type(None), range}
+)
+
+
+def _deepcopy_attribute(value: Any, memo: dict) -> Any:
+    """deep copy an attribute of a `SerializableDataclass`, using `ndarray.copy()` and `Tensor.clone()` for arrays"""
+    value_type: type = type(value)
+    if value_type in _IMMUTABLE_COPY_TYPES:
+        return value
+    copied: Any = memo.get(id(value), memo)
+    if copied is not memo:
+        return copied
+    type_name: str = value_type.__name__
+    module: str = value_type.__module__
+    if type_name == "ndarray" and module == "numpy" and not value.dtype.hasobject:
+        copied = value.copy()
+    elif type_name == "Tensor" and module == "torch":
+        copied = value.detach().clone()
+        if value.requires_grad:
+            copied.requires_grad_()
+    else:
+        return copy.deepcopy(value, memo)
+    memo[id(value)] = copied
+    return copied
+
+
+def _deepcopy_structural(
+    obj: T_SerializeableDataclass, memo: dict
+) -> T_SerializeableDataclass:
+    """a deep copy of `obj` made attribute by attribute, without calling `__init__` (or `__post_init__`)"""
+    cls: type[T_SerializeableDataclass] = obj.__class__
+    new: Any = cls.__new__(cls)
+    # before copying the attributes, in case they refer back to `obj`
+    memo[id(obj)] = new
+    state: Optional[dict[str, Any]] = getattr(obj, "__dict__", None)
+    names: typing.Iterable[str] = (
+        state.keys() if state is not None else [f.name for f in dataclasses.fields(obj)]  # type: ignore[arg-type]
+    )
+    for name in [name for name in names if name not in _UNPICKLED_SLOTS]:
+        # frozen dataclasses block `setattr`
+        object.__setattr__(new, name, _deepcopy_attribute(getattr(obj, name), memo))
+    return new
 
 
 # cache this so we don't have to keep getting it
@@ -582,6 +1021,472 @@ class FieldTypeMismatchError(FieldError, TypeError):
     pass
 
 
+# exact types which have no `serialize` method and are never `SerializableDataclass`es,
+# so the compiled `serialize` can store them without probing
+_PLAIN_FIELD_TYPES: frozenset[type] = frozenset(
+    {bool, int, float, str, type(None), list, dict, tuple}
+)
+
+
+def _serialize_field_value(value: Any) -> Any:
+    """serialize a field value which is not of a plain type, for fields without a `serialization_fn`"""
+    if isinstance(value, SerializableDataclass):
+        value = value.serialize()
+    if hasattr(value, "serialize") and callable(value.serialize):
+        value = value.serialize()
+    return value
+
+
+def _serialize_field_value_fn(value: Any, serialization_fn: Any) -> Any:
+    """serialize a field value which is not of a plain type, for fields with a `serialization_fn`"""
+    if isinstance(value, SerializableDataclass):
+        value = value.serialize()
+    if hasattr(value, "serialize") and callable(value.serialize):
+        return value.serialize()
+    return serialization_fn(value)
+
+
+def _raise_field_serialization_error(
+    self: Any, field: SerializableField, value: Any, e: Exception
+) -> typing.NoReturn:
+    raise FieldSerializationError(
+        "\n".join(
+            [
+                f"Error serializing field '{field.name}' on class {self.__class__.__module__}.{self.__class__.__name__}",
+                f"{field = }",
+                f"{value or '<unavailable>' = }",
+                f"{self = }",
+            ]
+        )
+    ) from e
+
+
+def _raise_missing_property(self: Any, prop: str) -> typing.NoReturn:
+    raise AttributeError(
+        f"Cannot serialize property '{prop}' on class {self.__class__.__module__}.{self.__class__.__name__}"
+        + f"but it is in {self._properties_to_serialize = }"
+        + f"\n{self = }"
+    )
+
+
+def _raise_field_loading_error(field_type_hint: Any, value: Any) -> typing.NoReturn:
+    raise FieldLoadingError(
+        f"Cannot load value into {field_type_hint}, expected {type(value) = } to be a dict\n{value = }"
+    )
+
+
+def _exec_function(cls: type, source: str, name: str, namespace: dict[str, Any]) -> Any:
+    """`exec` the definition of function `name` in `source` as a method of `cls`, with `namespace` as its globals"""
+    qualname: str = f"{cls.__qualname__}.{name}"
+    exec(compile(source, f"<serializable_dataclass {qualname}>", "exec"), namespace)
+    func: Any = namespace[name]
+    func.__qualname__ = qualname
+    func.__module__ = cls.__module__
+    return func
+
+
+def _compile_serialize(
+    cls: type, serialize_generic: typing.Callable[[Any], dict[str, Any]]
+) -> Optional[typing.Callable[[Any], dict[str, Any]]]:
+    """generate a `serialize` for `cls` with the fields, their `serialization_fn`s, and the properties baked in
+
+    instances of subclasses use `serialize_generic`. returns `None` if a field is not a `SerializableField`,
+    in which case `serialize_generic` should be used, which raises the appropriate error
+    """
+    fields: tuple[dataclasses.Field, ...] = dataclasses.fields(cls)  # type: ignore[arg-type]
+    if not all(isinstance(field, SerializableField) for field in fields):
+        return None
+    namespace: dict[str, Any] = dict(
+        _cls=cls,
+        _generic=serialize_generic,
+        _fmt=f"{cls.__name__}(SerializableDataclass)",
+        _plain=_PLAIN_FIELD_TYPES,
+        _ser=_serialize_field_value,
+        _ser_fn=_serialize_field_value_fn,
+        _raise_ser=_raise_field_serialization_error,
+        _raise_prop=_raise_missing_property,
+    )
+    lines: list[str] = [
+        "def serialize(self):",
+        "    if self.__class__ is not _cls:",
+        "        return _generic(self)",
+        f"    result = {{{_FORMAT_KEY!r}: _fmt}}",
+        "    value = None",
+    ]
+    for i, field in enumerate(fields):
+        if not field.serialize:  # type: ignore[attr-defined]
+            continue
+        namespace[f"_field_{i}"] = field
+        name: str = field.name
+        field_lines: list[str] = [
+            "try:",
+            f"    value = self.{name}",
+        ]
+        if field.serialization_fn:  # type: ignore[attr-defined]
+            namespace[f"_fn_{i}"] = field.serialization_fn  # type: ignore[attr-defined]
+            field_lines += [
+                "    if type(value) in _plain:",
+                f"        value = _fn_{i}(value)",
+                "    else:",
+                f"        value = _ser_fn(value, _fn_{i})",
+            ]
+        else:
+            field_lines += [
+                "    if type(value) not in _plain:",
+                "        value = _ser(value)",
+            ]
+        field_lines += [
+            f"    result[{name!r}] = value",
+            "except Exception as e:",
+            f"    _raise_ser(self, _field_{i}, value, e)",
+            "value = None",
+        ]
+        if field.lazy:  # type: ignore[attr-defined]
+            # write the serialized value back if the field was never loaded
+            namespace[f"_lazy_{i}"] = cls.__dict__[name]
+            lines += [
+                f"    pending = _lazy_{i}.pending(self)",
+                "    if pending is not None:",
+                f"        result[{name!r}] = pending.data[{name!r}]",
+                "    else:",
+            ]
+            lines += [f"        {line}" for line in field_lines]
+        else:
+            lines += [f"    {line}" for line in field_lines]
+    for prop in cls._properties_to_serialize:  # type: ignore[attr-defined]
+        if hasattr(cls, prop):
+            lines.append(f"    result[{prop!r}] = getattr(self, {prop!r})")
+        else:
+            lines.append(f"    _raise_prop(self, {prop!r})")
+    lines.append("    return result")
+    return _exec_function(cls, "\n".join(lines) + "\n", "serialize", namespace)
+
+
+def _check_loaded_types(
+    cls: type,
+    output: Any,
+    on_typecheck_error: ErrorMode,
+    on_typecheck_mismatch: ErrorMode,
+) -> None:
+    """validate the field types of a newly loaded `output`, handling mismatches according to `on_typecheck_mismatch`"""
+    fields_valid: dict[str, bool] = SerializableDataclass__validate_fields_types__dict(
+        output,
+        on_typecheck_error=on_typecheck_error,
+    )
+
+    # if there are any fields that are not valid, raise an error
+    if not all(fields_valid.values()):
+        cls_type_hints: dict[str, Any] = get_cls_type_hints(cls)  # type: ignore[arg-type]
+        msg: str = f"Type mismatch in fields of {cls.__name__}:\n" + "\n".join(
+            [
+                f"{k}:\texpected {cls_type_hints[k] = }, but got value {getattr(output, k) = }, {type(getattr(output, k)) = }"
+                for k, v in fields_valid.items()
+                if not v
+            ]
+        )
+
+        on_typecheck_mismatch.process(msg, except_cls=FieldTypeMismatchError)
+
+
+def _compile_load(
+    cls: type,
+    load_generic: typing.Callable[[type, Any], Any],
+    on_typecheck_error: ErrorMode,
+    on_typecheck_mismatch: ErrorMode,
+) -> typing.Callable[[type, Any], Any]:
+    """generate the function behind `load` for `cls`, with the loading plan of each field baked in
+
+    the plan depends on the type hints, so this is called on the first `load` rather than at decoration.
+    `load_generic` is used for subclasses. type validation only goes through the per-field
+    `validate_field_type` machinery, with its warnings and messages, if a quick check of all fields fails
+
+    # Raises:
+     - `TypeError` : if the type hints of `cls` can't be resolved, as `get_cls_type_hints` does
+    """
+    cls_type_hints: dict[str, Any] = get_cls_type_hints(cls)  # type: ignore[arg-type]
+    fields: tuple[SerializableField, ...] = dataclasses.fields(cls)  # type: ignore[arg-type, assignment]
+    namespace: dict[str, Any] = dict(
+        _cls=cls,
+        _generic=load_generic,
+        _Mapping=typing.Mapping,
+        _raise_load=_raise_field_loading_error,
+    )
+    lines: list[str] = [
+        "def load(cls, data):",
+        "    if cls is not _cls:",
+        "        return _generic(cls, data)",
+        # the `isinstance` checks against abcs are slow, and plain dicts pass both
+        "    if type(data) is not dict:",
+        "        if isinstance(data, cls):",
+        "            return data",
+        "        assert isinstance(data, _Mapping), (",
+        "            f'When loading {cls.__name__ = } expected a Mapping, but got {type(data) = }:\\n{data = }'",
+        "        )",
+        "    kwargs = {}",
+    ]
+    for i, field in enumerate(fields):
+        assert isinstance(field, SerializableField), (
+            f"Field '{field.name}' on class {cls.__name__} is not a SerializableField, but a {type(field)}. this state should be inaccessible, please report this bug!\nhttps://github.com/mivanit/muutils/issues/new"
+        )
+        if not field.init:
+            continue
+        name: str = field.name
+        hint: Any = cls_type_hints.get(name, None)
+        lines.append(f"    if {name!r} in data:")
+        if field.lazy:
+            namespace["_Lazy"] = _LazyValue
+            lines.append(f"        kwargs[{name!r}] = _Lazy(data)")
+        elif field.deserialize_fn:
+            namespace[f"_fn_{i}"] = field.deserialize_fn
+            lines.append(f"        kwargs[{name!r}] = _fn_{i}(data[{name!r}])")
+        elif field.loading_fn:
+            namespace[f"_fn_{i}"] = field.loading_fn
+            lines.append(f"        kwargs[{name!r}] = _fn_{i}(data)")
+        elif hint is not None and hasattr(hint, "load") and callable(hint.load):
+            namespace[f"_hint_{i}"] = hint
+            lines += [
+                f"        value = data[{name!r}]",
+                "        if not isinstance(value, dict):",
+                f"            _raise_load(_hint_{i}, value)",
+                f"        kwargs[{name!r}] = _hint_{i}.load(value)",
+            ]
+        else:
+            lines.append(f"        kwargs[{name!r}] = data[{name!r}]")
+    lines.append("    output = cls(**kwargs)")
+
+    if on_typecheck_mismatch != ErrorMode.IGNORE:
+        namespace.update(
+            _check=_check_loaded_types,
+            _on_typecheck_error=on_typecheck_error,
+            _on_typecheck_mismatch=on_typecheck_mismatch,
+        )
+        # lazy fields are checked when they are loaded
+        checked: list[SerializableField] = [
+            f for f in fields if f.assert_type and not f.lazy
+        ]
+        if (
+            cls.validate_field_type is SerializableDataclass.validate_field_type  # type: ignore[attr-defined]
+            and all(
+                f.init and f.serialize and f.name in cls_type_hints for f in checked
+            )
+        ):
+            # only do the full validation, with its warnings and messages, if a quick check fails
+            namespace["_validate_type"] = validate_type
+            conditions: list[str] = []
+            for field in checked:
+                i = fields.index(field)
+                field_hint: Any = cls_type_hints[field.name]
+                namespace[f"_type_{i}"] = field_hint
+                if field.custom_typecheck_fn is not None:
+                    namespace[f"_typecheck_{i}"] = field.custom_typecheck_fn
+                    conditions.append(f"_typecheck_{i}(_type_{i})")
+                elif field_hint is typing.Any:
+                    continue
+                elif (
+                    isinstance(field_hint, type)
+                    and typing.get_origin(field_hint) is None
+                ):
+                    # what `validate_type` does for plain classes
+                    conditions.append(f"isinstance(output.{field.name}, _type_{i})")
+                else:
+                    conditions.append(f"_validate_type(output.{field.name}, _type_{i})")
+            if conditions:
+                lines += [
+                    "    try:",
+                    f"        valid = {' and '.join(conditions)}",
+                    "    except Exception:",
+                    "        valid = False",
+                    "    if not valid:",
+                    "        _check(cls, output, _on_typecheck_error, _on_typecheck_mismatch)",
+                ]
+        else:
+            lines.append(
+                "    _check(cls, output, _on_typecheck_error, _on_typecheck_mismatch)"
+            )
+    lines.append("    return output")
+    return _exec_function(cls, "\n".join(lines) + "\n", "load", namespace)
+
+
+def _uses_generated_method(cls: type, name: str) -> bool:
+    """whether `cls.<name>` is the `serialize` or `load` set by `serializable_dataclass`, which `serialize_many` and `load_many` can do a column at a time"""
+    generated: Any = getattr(cls, "_generated_methods", {}).get(name)
+    return generated is not None and inspect.getattr_static(cls, name) is generated
+
+
+def _serialize_column(
+    cls: type,
+    field: SerializableField,
+    items: typing.Sequence[Any],
+    array_mode: "ArrayMode",
+) -> Any:
+    """the values `serialize` gives for `field` of each of `items`, stored with `_column_to_array`
+
+    columns of plain values are read and converted all at once, other values one at a time as in the compiled `serialize`
+    """
+    name: str = field.name
+    fn: Optional[typing.Callable[[Any], Any]] = field.serialization_fn
+    lazy: Optional[_LazyField] = getattr(cls, name) if field.lazy else None
+    if lazy is None:
+        try:
+            column: list[Any] = list(map(operator.attrgetter(name), items))
+            col_types: set[type] = set(map(type, column))
+            if col_types <= _PLAIN_FIELD_TYPES:
+                if fn is None:
+                    return _column_to_array(column, name, array_mode, col_types)
+                return _column_to_array(list(map(fn, column)), name, array_mode)
+        except Exception:
+            # the loop below raises with the item which failed
+            pass
+    result: list[Any] = []
+    value: Any = None
+    for item in items:
+        if lazy is not None:
+            # the serialized value, if the field was never loaded
+            pending: Optional[_LazyValue] = lazy.pending(item)
+            if pending is not None:
+                result.append(pending.data[name])
+                continue
+        try:
+            value = getattr(item, name)
+            if type(value) in _PLAIN_FIELD_TYPES:
+                result.append(value if fn is None else fn(value))
+            elif fn is None:
+                result.append(_serialize_field_value(value))
+            else:
+                result.append(_serialize_field_value_fn(value, fn))
+        except Exception as e:
+            _raise_field_serialization_error(item, field, value, e)
+        value = None
+    return _column_to_array(result, name, array_mode)
+
+
+def _serialize_columns(
+    cls: type, items: typing.Sequence[Any], array_mode: "ArrayMode"
+) -> Optional[tuple[list[str], list[Any]]]:
+    """the names and columns of `serialize_many`, with the values `serialize` gives for each field and property
+
+    returns `None` if a field is not a `SerializableField`, in which case `serialize` should be used, which raises the appropriate error
+    """
+    fields: tuple[SerializableField, ...] = dataclasses.fields(cls)  # type: ignore[arg-type, assignment]
+    if not all(isinstance(field, SerializableField) for field in fields):
+        return None
+    names: list[str] = []
+    columns: list[Any] = []
+    for field in fields:
+        if not field.serialize:
+            continue
+        names.append(field.name)
+        columns.append(_serialize_column(cls, field, items, array_mode))
+    for prop in cls._properties_to_serialize:  # type: ignore[attr-defined]
+        if items and not hasattr(cls, prop):
+            _raise_missing_property(items[0], prop)
+        names.append(prop)
+        columns.append(
+            _column_to_array(
+                list(map(operator.attrgetter(prop), items)), prop, array_mode
+            )
+        )
+    return names, columns
+
+
+def _column_types_valid(
+    field: SerializableField, field_hint: Any, values: list[Any]
+) -> bool:
+    """the quick type check of the compiled `load`, for the values of `field` in a whole column"""
+    try:
+        if field.custom_typecheck_fn is not None:
+            return bool(field.custom_typecheck_fn(field_hint))
+        if field_hint is typing.Any:
+            return True
+        if isinstance(field_hint, type) and typing.get_origin(field_hint) is None:
+            # what `validate_type` does for plain classes, once for each type in the column
+            return all(issubclass(t, field_hint) for t in set(map(type, values)))
+        return all(validate_type(value, field_hint) for value in values)
+    except Exception:
+        return False
+
+
+def _init_takes_positional(cls: type, names: list[str]) -> bool:
+    """whether the first parameters of `cls.__init__` are `names`, so the values can be passed positionally, which is faster than by keyword"""
+    try:
+        params: list[inspect.Parameter] = list(
+            inspect.signature(cls).parameters.values()
+        )
+    except (TypeError, ValueError):
+        return False
+    return [
+        p.name
+        for p in params[: len(names)]
+        if p.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+    ] == names
+
+
+def _load_columns(
+    cls: type, names: list[str], columns: list[list[Any]], n: int
+) -> Optional[list[Any]]:
+    """the `n` instances of `cls` in the columns of `load_many`, with each field loaded for the whole column
+
+    the types of the fields are checked once for each column, as by the quick check of the compiled `load`.
+    returns `None` if `load` should be used on each row instead: if a check fails, so that mismatches are handled
+    with its messages and error modes, or if the fields or `validate_field_type` need its full validation
+    """
+    fields: tuple[SerializableField, ...] = dataclasses.fields(cls)  # type: ignore[arg-type, assignment]
+    if not all(isinstance(field, SerializableField) for field in fields):
+        return None
+    cls_type_hints: dict[str, Any] = get_cls_type_hints(cls)
+    # lazy fields are checked when they are loaded
+    checked: list[SerializableField] = [
+        f for f in fields if f.assert_type and not f.lazy
+    ]
+    if (
+        cls.validate_field_type is not SerializableDataclass.validate_field_type  # type: ignore[attr-defined]
+        or not all(f.init and f.serialize and f.name in cls_type_hints for f in checked)
+    ):
+        return None
+    by_name: dict[str, list[Any]] = dict(zip(names, columns))
+    # the serialized instances, only built for fields which are loaded from the whole instance
+    rows: Optional[list[dict[str, Any]]] = None
+    kw_names: list[str] = []
+    kw_columns: list[list[Any]] = []
+    for field in fields:
+        if not field.init or field.name not in by_name:
+            continue
+        column: list[Any] = by_name[field.name]
+        hint: Any = cls_type_hints.get(field.name, None)
+        if field.lazy or (field.loading_fn and not field.deserialize_fn):
+            if rows is None:
+                rows = [dict(zip(names, row)) for row in zip(*columns)]
+            column = (
+                list(map(_LazyValue, rows))
+                if field.lazy
+                else list(map(field.loading_fn, rows))  # type: ignore[arg-type]
+            )
+        elif field.deserialize_fn:
+            column = list(map(field.deserialize_fn, column))
+        elif hint is not None and hasattr(hint, "load") and callable(hint.load):
+            for value in column:
+                if not isinstance(value, dict):
+                    _raise_field_loading_error(hint, value)
+            column = list(map(hint.load, column))
+        kw_names.append(field.name)
+        kw_columns.append(column)
+    outputs: list[Any]
+    if not kw_columns:
+        outputs = [cls() for _ in range(n)]
+    elif _init_takes_positional(cls, kw_names):
+        outputs = list(map(cls, *kw_columns))
+    else:
+        outputs = [cls(**dict(zip(kw_names, values))) for values in zip(*kw_columns)]
+    for field in checked:
+        if not _column_types_valid(
+            field,
+            cls_type_hints[field.name],
+            list(map(operator.attrgetter(field.name), outputs)),
+        ):
+            return None
+    return outputs
+
+
 @dataclass_transform(
     field_specifiers=(serializable_field, SerializableField),
 )
@@ -595,11 +1500,13 @@ def serializable_dataclass(
     order: bool = False,
     unsafe_hash: bool = False,
     frozen: bool = False,
+    slots: bool = False,
     properties_to_serialize: Optional[list[str]] = None,
     register_handler: bool = True,
     on_typecheck_error: ErrorMode = _DEFAULT_ON_TYPECHECK_ERROR,
     on_typecheck_mismatch: ErrorMode = _DEFAULT_ON_TYPECHECK_MISMATCH,
     methods_no_override: list[str] | None = None,
+    compile_methods: bool = True,
     **kwargs: Any,
 ) -> Any:
     """decorator to make a dataclass serializable. **must also make it inherit from `SerializableDataclass`!!**
@@ -643,19 +1550,24 @@ def serializable_dataclass(
        *(passed to dataclasses.dataclass)*
        (defaults to `False`)
     - `unsafe_hash : bool`
-       whether to add a `__hash__` method
+       whether to add a `__hash__` method. for serializable dataclasses, this is `dc_hash`
        *(passed to dataclasses.dataclass)*
        (defaults to `False`)
     - `frozen : bool`
-       whether to make the class frozen
+       whether to make the class frozen. the `dc_hash` of frozen instances is computed once and cached
        *(passed to dataclasses.dataclass)*
        (defaults to `False`)
+    - `slots : bool`
+       whether to give the class `__slots__` for its fields, so instances have no `__dict__` and take less memory.
+       like `dataclasses` does, this returns a new class, and zero-argument `super()` in its methods is updated to it.
+       frozen classes also get a `_hash_cache` slot for the cached hash
+       (defaults to `False`)
     - `properties_to_serialize : Optional[list[str]]`
        which properties to add to the serialized data dict
        **SerializableDataclass only**
        (defaults to `None`)
     - `register_handler : bool`
-        if true, register the class with ZANJ for loading
+        if true, register the class for loading with `JsonLoader` and ZANJ
         **SerializableDataclass only**
         (defaults to `True`)
     - `on_typecheck_error : ErrorMode`
@@ -666,10 +1578,17 @@ def serializable_dataclass(
         **SerializableDataclass only**
     - `methods_no_override : list[str]|None`
         list of methods that should not be overridden by the decorator
-        by default, `__eq__`, `serialize`, `load`, and `validate_fields_types` are overridden by this function,
+        by default, `__eq__`, `__hash__`, `serialize`, `load`, and `validate_fields_types` are overridden by this function,
         but you can disable this if you'd rather write your own. `dataclasses.dataclass` might still overwrite these, and those options take precedence
         **SerializableDataclass only**
         (defaults to `None`)
+    - `compile_methods : bool`
+        if true, `serialize` and `load` are generated for the class with `exec` (like `dataclasses` does for `__init__`),
+        with the fields, their serialization and loading functions, and the type hints baked in, instead of looping
+        over `dataclasses.fields` on every call. `load` is generated on its first call, once the type hints can be resolved.
+        the behavior is the same either way; subclasses which are not decorated themselves use the generic versions
+        **SerializableDataclass only**
+        (defaults to `True`)
     - `**kwargs`
         *(passed to dataclasses.dataclass)*
 
@@ -718,7 +1637,15 @@ def serializable_dataclass(
                 else:
                     del kwargs["kw_only"]
 
+        # like `dataclasses`, keep a `__hash__` defined in the class body
+        class_hash: Any = cls.__dict__.get("__hash__", dataclasses.MISSING)
+        has_explicit_hash: bool = not (
+            class_hash is dataclasses.MISSING
+            or (class_hash is None and "__eq__" in cls.__dict__)
+        )
+
         # call `dataclasses.dataclass` to set some stuff up
+        cls_original: type = cls
         cls = dataclasses.dataclass(  # type: ignore[call-overload]
             cls,
             init=init,
@@ -729,10 +1656,29 @@ def serializable_dataclass(
             frozen=frozen,
             **kwargs,
         )
+        if slots:
+            # frozen instances cache their hash in a slot
+            cls = _add_slots(cls, ("_hash_cache",) if frozen else ())
+            _update_class_cells(cls_original, cls)
 
         # copy these to the class
         cls._properties_to_serialize = _properties_to_serialize.copy()  # type: ignore[attr-defined]
 
+        # fields with `lazy=True` are loaded when first accessed
+        for lazy_field in dataclasses.fields(cls):  # type: ignore[arg-type]
+            if getattr(lazy_field, "lazy", False):
+                setattr(
+                    cls,
+                    lazy_field.name,
+                    _LazyField(
+                        cls,
+                        lazy_field,  # type: ignore[arg-type]
+                        _field_slot(cls, lazy_field.name),
+                        on_typecheck_error,
+                        on_typecheck_mismatch,
+                    ),
+                )
+
         # ======================================================================
         # define `serialize` func
         # done locally since it depends on args to the decorator
@@ -751,6 +1697,15 @@ def serializable_dataclass(
                         "this state should be inaccessible, please report this bug!"
                     )
 
+                # write the serialized value back if a lazy field was never loaded
+                if field.lazy:
+                    pending: Optional[_LazyValue] = cls.__dict__[field.name].pending(
+                        self
+                    )
+                    if pending is not None:
+                        result[field.name] = pending.data[field.name]
+                        continue
+
                 # try to save it
                 if field.serialize:
                     value: Any = None  # init before try in case getattr raises
@@ -837,7 +1792,10 @@ def serializable_dataclass(
                     field_type_hint: Any = cls_type_hints.get(field.name, None)
 
                     # we rely on the init of `SerializableField` to check that only one of `loading_fn` and `deserialize_fn` is set
-                    if field.deserialize_fn:
+                    if field.lazy:
+                        # loaded when first accessed, see `_LazyField`
+                        value = _LazyValue(data)
+                    elif field.deserialize_fn:
                         # if it has a deserialization function, use that
                         value = field.deserialize_fn(value)
                     elif field.loading_fn:
@@ -867,33 +1825,33 @@ def serializable_dataclass(
 
             # validate the types of the fields if needed
             if on_typecheck_mismatch != ErrorMode.IGNORE:
-                fields_valid: dict[str, bool] = (
-                    SerializableDataclass__validate_fields_types__dict(
-                        output,
-                        on_typecheck_error=on_typecheck_error,
-                    )
+                _check_loaded_types(
+                    cls, output, on_typecheck_error, on_typecheck_mismatch
                 )
 
-                # if there are any fields that are not valid, raise an error
-                if not all(fields_valid.values()):
-                    msg: str = (
-                        f"Type mismatch in fields of {cls.__name__}:\n"
-                        + "\n".join(
-                            [
-                                f"{k}:\texpected {cls_type_hints[k] = }, but got value {getattr(output, k) = }, {type(getattr(output, k)) = }"
-                                for k, v in fields_valid.items()
-                                if not v
-                            ]
-                        )
-                    )
-
-                    on_typecheck_mismatch.process(
-                        msg, except_cls=FieldTypeMismatchError
-                    )
-
             # return the new instance
             return output
 
+        # the generic `load` above, with the loop over the fields replaced by generated code on the first call
+        @classmethod  # type: ignore[misc]
+        def load_compiling(
+            cls_: type[T_SerializeableDataclass],
+            data: dict[str, Any] | T_SerializeableDataclass,
+        ) -> T_SerializeableDataclass:
+            if cls_ is not cls:
+                return load.__func__(cls_, data)  # type: ignore[attr-defined]
+            load_compiled: typing.Callable[[type, Any], Any] = _compile_load(
+                cls,
+                load.__func__,  # type: ignore[attr-defined]
+                on_typecheck_error,
+                on_typecheck_mismatch,
+            )
+            # replace this stub, unless `load` was changed after decorating
+            if cls.__dict__.get("load") is load_compiling:
+                cls.load = classmethod(load_compiled)  # type: ignore[attr-defined, method-assign, assignment]
+                cls._generated_methods["load"] = cls.__dict__["load"]  # type: ignore[attr-defined]
+            return load_compiled(cls, data)
+
         _methods_no_override: set[str]
         if methods_no_override is None:
             _methods_no_override = set()
@@ -902,6 +1860,7 @@ def serializable_dataclass(
 
         if _methods_no_override - {
             "__eq__",
+            "__hash__",
             "serialize",
             "load",
             "validate_fields_types",
@@ -913,10 +1872,19 @@ def serializable_dataclass(
         # mypy says "Type cannot be declared in assignment to non-self attribute" so thats why I've left the hints in the comments
         if "serialize" not in _methods_no_override:
             # type is `Callable[[T], dict]`
-            cls.serialize = serialize  # type: ignore[attr-defined, method-assign]
+            compiled_serialize: Optional[typing.Callable[[Any], dict[str, Any]]] = (
+                _compile_serialize(cls, serialize) if compile_methods else None
+            )
+            cls.serialize = compiled_serialize or serialize  # type: ignore[attr-defined, method-assign, assignment]
         if "load" not in _methods_no_override:
             # type is `Callable[[dict], T]`
-            cls.load = load  # type: ignore[attr-defined, method-assign, assignment]
+            cls.load = load_compiling if compile_methods else load  # type: ignore[attr-defined, method-assign, assignment]
+        # `serialize_many` and `load_many` only work a column at a time with these
+        cls._generated_methods = {  # type: ignore[attr-defined]
+            name: cls.__dict__[name]
+            for name in ("serialize", "load")
+            if name not in _methods_no_override
+        }
 
         if "validate_field_type" not in _methods_no_override:
             # type is `Callable[[T, ErrorMode], bool]`
@@ -926,8 +1894,19 @@ def serializable_dataclass(
             # type is `Callable[[T, T], bool]`
             cls.__eq__ = lambda self, other: dc_eq(self, other)  # type: ignore[assignment]
 
-        # Register the class with ZANJ
+        if "__hash__" not in _methods_no_override and not has_explicit_hash:
+            # the field tuple hash from `dataclasses` fails on lists and arrays. mutable
+            # classes with `eq=True` (and without `unsafe_hash`) stay unhashable
+            if frozen:
+                cls.__hash__ = _cached_dc_hash  # type: ignore[assignment]
+            elif unsafe_hash:
+                cls.__hash__ = dc_hash  # type: ignore[assignment]
+
+        # Register the class for `JsonLoader` and with ZANJ
         if register_handler:
+            _SERIALIZABLE_DATACLASS_FORMATS[
+                f"{cls.__name__}(SerializableDataclass)"
+            ] = cls
             zanj_register_loader_serializable_dataclass(cls)
 
         return cls
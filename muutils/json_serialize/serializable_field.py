@@ -41,6 +41,7 @@ class SerializableField(dataclasses.Field):
         "deserialize_fn",  # new alternative to loading_fn
         "assert_type",
         "custom_typecheck_fn",
+        "lazy",
     )
 
     def __init__(
@@ -63,10 +64,15 @@ class SerializableField(dataclasses.Field):
         deserialize_fn: Optional[Callable[[Any], Any]] = None,
         assert_type: bool = True,
         custom_typecheck_fn: Optional[Callable[[type], bool]] = None,
+        lazy: bool = False,
     ):
         # TODO: should we do this check, or assume the user knows what they are doing?
         if init and not serialize:
             raise ValueError("Cannot have init=True and serialize=False")
+        if lazy and not init:
+            raise ValueError(
+                "Cannot have lazy=True and init=False, lazy fields are loaded via `__init__`"
+            )
 
         # need to assemble kwargs in this hacky way so as not to upset type checking
         super_kwargs: dict[str, Any] = dict(
@@ -117,6 +123,7 @@ class SerializableField(dataclasses.Field):
 
         self.assert_type: bool = assert_type
         self.custom_typecheck_fn: Optional[Callable[[type], bool]] = custom_typecheck_fn
+        self.lazy: bool = lazy
 
     @classmethod
     def from_Field(cls, field: "dataclasses.Field[Any]") -> "SerializableField":
@@ -158,6 +165,7 @@ def serializable_field(  # only `default_factory` is provided
     deserialize_fn: Optional[Callable[[Any], Any]] = None,
     assert_type: bool = True,
     custom_typecheck_fn: Optional[Callable[[type], bool]] = None,
+    lazy: bool = False,
     **kwargs: Any,
 ) -> Sfield_T: ...
 @overload
@@ -177,6 +185,7 @@ def serializable_field(  # only `default` is provided
     deserialize_fn: Optional[Callable[[Any], Any]] = None,
     assert_type: bool = True,
     custom_typecheck_fn: Optional[Callable[[type], bool]] = None,
+    lazy: bool = False,
     **kwargs: Any,
 ) -> Sfield_T: ...
 @overload
@@ -196,6 +205,7 @@ def serializable_field(  # both `default` and `default_factory` are MISSING
     deserialize_fn: Optional[Callable[[Any], Any]] = None,
     assert_type: bool = True,
     custom_typecheck_fn: Optional[Callable[[type], bool]] = None,
+    lazy: bool = False,
     **kwargs: Any,
 ) -> Any: ...
 def serializable_field(  # general implementation
@@ -214,6 +224,7 @@ def serializable_field(  # general implementation
     deserialize_fn: Optional[Callable[[Any], Any]] = None,
     assert_type: bool = True,
     custom_typecheck_fn: Optional[Callable[[type], bool]] = None,
+    lazy: bool = False,
     **kwargs: Any,
 ) -> Any:
     """Create a new `SerializableField`
@@ -237,6 +248,7 @@ def serializable_field(  # general implementation
     deserialize_fn: Optional[Callable[[Any], Any]] = None,
     assert_type: bool = True,
     custom_typecheck_fn: Optional[Callable[[type], bool]] = None,
+    lazy: bool = False,
     ```
 
     # new Parameters:
@@ -246,6 +258,8 @@ def serializable_field(  # general implementation
     - `deserialize_fn`: new alternative to `loading_fn`. takes only the field's value, not the whole class. if both `loading_fn` and `deserialize_fn` are provided, an error will be raised.
     - `assert_type`: whether to assert the type of the field when loading. if `False`, will not check the type of the field.
     - `custom_typecheck_fn`: function taking the type of the field and returning whether the type itself is valid. if not provided, will use the default type checking.
+    - `lazy`: if `True`, `load` keeps the serialized data and only loads this field (with `deserialize_fn`, `loading_fn`, or the `load` of its type) and checks its type
+      the first time it is accessed, then keeps the loaded value. until then, `serialize` writes the serialized value as it was loaded. requires `init=True`
 
     # Gotchas:
     - `loading_fn` takes the dict of the **class**, not the field. if you wanted a `loading_fn` that does nothing, you'd write:
@@ -305,5 +319,6 @@ def serializable_field(  # general implementation
         deserialize_fn=deserialize_fn,
         assert_type=assert_type,
         custom_typecheck_fn=custom_typecheck_fn,
+        lazy=lazy,
         **kwargs,
     )
@@ -10,7 +10,7 @@ import typing
 import warnings
 from typing import Any, Callable, Iterable, TypeVar, Union
 
-from muutils.json_serialize.types import BaseType, Hashableitem
+from muutils.json_serialize.types import _REF_KEY, BaseType, Hashableitem
 
 if typing.TYPE_CHECKING:
     pass
@@ -209,6 +209,73 @@ def array_safe_eq(a: Any, b: Any) -> bool:  # pyright: ignore[reportAny]
         return NotImplemented  # type: ignore[return-value]
 
 
+# exact types whose own hash is used by `array_safe_hash` without further checks
+_HASH_AS_IS_TYPES: frozenset[type] = frozenset(
+    {bool, int, float, complex, str, bytes, type(None)}
+)
+
+
+def array_safe_hash(a: Any) -> int:  # pyright: ignore[reportAny]
+    """hash consistent with `array_safe_eq`: objects which are equal under it always hash equal
+
+    sequences and mappings are hashed from their items, and dataclasses with `dc_hash` if they are not hashable.
+    numpy arrays and torch tensors which compare equal can differ in shape, dtype, and bytes
+    (by broadcasting, or for `0.0 == -0.0`), so they only contribute their type.
+    other unhashable objects also only contribute their type
+    """
+    a_type: type = type(a)  # pyright: ignore[reportAny]
+    if a_type in _HASH_AS_IS_TYPES:
+        return hash(a)  # pyright: ignore[reportAny]
+    type_str: str = str(a_type)
+    if type_str in ("<class 'numpy.ndarray'>", "<class 'torch.Tensor'>"):
+        return hash(type_str)
+    if type_str == "<class 'pandas.core.frame.DataFrame'>":
+        return hash((type_str, a.shape))  # pyright: ignore[reportAny]
+    # equal containers have items of the same types, so they always take the same branch
+    if isinstance(a, typing.Sequence):
+        if _HASH_AS_IS_TYPES.issuperset(map(type, a)):  # pyright: ignore[reportUnknownArgumentType]
+            return hash(tuple(a))  # pyright: ignore[reportUnknownArgumentType]
+        return hash(tuple(map(array_safe_hash, a)))  # pyright: ignore[reportUnknownArgumentType]
+    if isinstance(a, (dict, typing.Mapping)):
+        # `array_safe_eq` compares items in order
+        if _HASH_AS_IS_TYPES.issuperset(
+            map(type, a.keys())  # pyright: ignore[reportUnknownArgumentType, reportUnknownMemberType]
+        ) and _HASH_AS_IS_TYPES.issuperset(
+            map(type, a.values())  # pyright: ignore[reportUnknownArgumentType, reportUnknownMemberType]
+        ):
+            return hash(tuple(a.items()))  # pyright: ignore[reportUnknownArgumentType, reportUnknownMemberType]
+        return hash(
+            tuple(
+                (array_safe_hash(k), array_safe_hash(v))
+                for k, v in a.items()  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
+            )
+        )
+    try:
+        return hash(a)  # pyright: ignore[reportAny]
+    except TypeError:
+        pass
+    if dataclasses.is_dataclass(a):
+        return dc_hash(a)
+    if isinstance(a, (set, frozenset)):
+        return hash(frozenset(a))  # pyright: ignore[reportUnknownArgumentType]
+    return hash(type_str)
+
+
+def dc_hash(dc: Any) -> int:  # pyright: ignore[reportAny]
+    """hash of a dataclass consistent with `dc_eq` (with its default arguments): equal dataclasses always hash equal
+
+    combines the class with `array_safe_hash` of each field with `compare=True`, without serializing anything
+    """
+    return hash(
+        (dc.__class__,)  # pyright: ignore[reportAny]
+        + tuple(
+            array_safe_hash(getattr(dc, fld.name))  # pyright: ignore[reportAny]
+            for fld in dataclasses.fields(dc)  # pyright: ignore[reportAny]
+            if fld.compare
+        )
+    )
+
+
 # TYPING: see what can be done about so many `Any`s here
 def dc_eq(
     dc1: Any,  # pyright: ignore[reportAny]
@@ -309,3 +376,69 @@ def dc_eq(
         for fld in dataclasses.fields(dc1)  # pyright: ignore[reportAny]
         if fld.compare
     )
+
+
+def _is_ref(obj: Any) -> bool:  # pyright: ignore[reportAny]
+    """whether `obj` is a `{"$ref": "#..."}` reference as written by `JsonSerializer(shared_refs=True)`"""
+    if not isinstance(obj, dict) or len(obj) != 1:  # pyright: ignore[reportUnknownArgumentType]
+        return False
+    pointer: Any = obj.get(_REF_KEY)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+    return isinstance(pointer, str) and pointer.startswith("#")
+
+
+def _follow_ref(root: JSONitem, pointer: str) -> JSONitem:
+    """get the item at `pointer` (`"#"` followed by a json pointer) in `root`"""
+    target: Any = root
+    if pointer == "#":
+        return target  # pyright: ignore[reportAny]
+    if not pointer.startswith("#/"):
+        raise ValueError(f"invalid {_REF_KEY} {pointer = }")
+    for token in pointer[2:].split("/"):
+        key: str = token.replace("~1", "/").replace("~0", "~")
+        try:
+            if isinstance(target, list):
+                target = target[int(key)]
+            else:
+                target = target[key]
+        except (KeyError, IndexError, ValueError, TypeError) as e:
+            raise KeyError(
+                f"could not resolve {_REF_KEY} {pointer = }, failed at {key = }"
+            ) from e
+    return target  # pyright: ignore[reportAny]
+
+
+def resolve_refs(data: JSONitem) -> JSONitem:
+    """replace the `{"$ref": "#/path/to/first"}` references written by `JsonSerializer(shared_refs=True)`
+    with the items they point to, so that shared objects are shared again and cycles are restored
+
+    `data` is modified in place and returned. a dict whose only key is `"$ref"` with a string value starting
+    with `"#"` is always treated as a reference
+
+    # Raises:
+    - `KeyError`: if a reference points to a location which does not exist in `data`
+    - `ValueError`: if `data` itself is a reference, or a reference is not a valid pointer
+    """
+    if _is_ref(data):
+        raise ValueError(f"the root of the data cannot be a reference: {data = }")
+    stack: list[Any] = [data]
+    # ids of containers already visited. resolved references can make the data cyclic
+    visited: set[int] = set()
+    while stack:
+        container: Any = stack.pop()
+        if id(container) in visited:  # pyright: ignore[reportAny]
+            continue
+        visited.add(id(container))  # pyright: ignore[reportAny]
+        items: typing.Iterable[tuple[Any, Any]]
+        if isinstance(container, dict):
+            items = list(container.items())  # pyright: ignore[reportUnknownArgumentType]
+        elif isinstance(container, list):
+            items = enumerate(container)  # pyright: ignore[reportUnknownArgumentType]
+        else:
+            continue
+        for key, value in items:  # pyright: ignore[reportAny]
+            if _is_ref(value):
+                # the target is at its own location in `data`, so it is visited from there
+                container[key] = _follow_ref(data, value[_REF_KEY])  # pyright: ignore[reportAny]
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+    return data
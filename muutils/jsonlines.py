@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import gzip
-import json
 from typing import Callable, Sequence
 
 from muutils.json_serialize import JSONitem
+from muutils.json_serialize.json_backend import json_dumps, json_loads
 
 _GZIP_EXTENSIONS: tuple = (".gz", ".gzip")
 
@@ -38,7 +38,7 @@ def jsonl_load(
     data: list[JSONitem] = list()
     with opener(path, "rt", encoding="UTF-8") as f:
         for line in f:
-            data.append(json.loads(line))
+            data.append(json_loads(line))
 
     return data
 
@@ -74,4 +74,4 @@ def jsonl_write(
 
     with opener(path, "wt", encoding="UTF-8", **opener_kwargs) as f:
         for item in items:
-            f.write(json.dumps(item) + "\n")
+            f.write(json_dumps(item) + "\n")
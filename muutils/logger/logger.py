@@ -9,13 +9,13 @@
 
 from __future__ import annotations
 
-import json
 import time
 import typing
 from functools import partial
 from typing import Any, Callable, Sequence
 
-from muutils.json_serialize import JSONitem, json_serialize
+from muutils.json_serialize import JSONitem
+from muutils.json_serialize.json_serialize import json_serialize_dumps
 from muutils.logger.exception_context import ExceptionContext
 from muutils.logger.headerfuncs import HEADER_FUNCTIONS, HeaderFunction
 from muutils.logger.loggingstream import LoggingStream
@@ -246,7 +246,7 @@ class Logger(SimpleLogger):
 
         # write
         # ========================================
-        logfile_msg: str = json.dumps(json_serialize(msg_dict)) + "\n"
+        logfile_msg: str = json_serialize_dumps(msg_dict) + "\n"
         if (
             (stream is None)
             or (stream not in self._streams)
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 import sys
 import time
 import typing
 from typing import Any, TextIO, Union
 
-from muutils.json_serialize import JSONitem, json_serialize
+from muutils.json_serialize import JSONitem
+from muutils.json_serialize.json_serialize import json_serialize_dumps
 
 
 class NullIO:
@@ -81,4 +81,4 @@ class SimpleLogger:
         if len(kwargs) > 0:
             msg_dict["_kwargs"] = kwargs
 
-        self._log_file_handle.write(json.dumps(json_serialize(msg_dict)) + "\n")
+        self._log_file_handle.write(json_serialize_dumps(msg_dict) + "\n")
@@ -148,12 +148,20 @@ SPARK_CHARS: Dict[OutputFormat, List[str]] = {
 def array_info(
     A: Any,
     hist_bins: int = 5,
+    median: bool = True,
 ) -> Dict[str, Any]:
     """Extract statistical information from an array-like object.
 
     # Parameters:
      - `A : array-like`
             Array to analyze (numpy array or torch tensor)
+     - `hist_bins : int`
+            Number of histogram bins
+            (defaults to `5`)
+     - `median : bool`
+            Whether to compute the median, which needs a copy and a partial sort of the array.
+            If `False`, `"median"` is `None`
+            (defaults to `True`)
 
     # Returns:
      - `Dict[str, Any]`
@@ -241,7 +249,8 @@ def array_info(
     # TODO: type checks fail on 3.10, see https://github.com/mivanit/muutils/actions/runs/18883100459/job/53891346225
     try:
         if len(A_np.shape) > 1:
-            A_flat = A_np.flatten()  # type: ignore[assignment]
+            # a view rather than a copy, if contiguous
+            A_flat = A_np.reshape(-1)  # type: ignore[assignment]
         else:
             A_flat = A_np  # type: ignore[assignment]
     except:  # noqa: E722
@@ -270,7 +279,8 @@ def array_info(
             result["max"] = float(np.nanmax(A_flat))
             result["mean"] = float(np.nanmean(A_flat))
             result["std"] = float(np.nanstd(A_flat))
-            result["median"] = float(np.nanmedian(A_flat))
+            if median:
+                result["median"] = float(np.nanmedian(A_flat))
             result["range"] = (result["min"], result["max"])
 
             # Remove NaNs for histogram
@@ -281,7 +291,8 @@ def array_info(
             result["max"] = float(np.max(A_flat))
             result["mean"] = float(np.mean(A_flat))
             result["std"] = float(np.std(A_flat))
-            result["median"] = float(np.median(A_flat))
+            if median:
+                result["median"] = float(np.median(A_flat))
             result["range"] = (result["min"], result["max"])
 
             A_hist = A_flat
@@ -0,0 +1,14 @@
+#==================================================
+import numpy as np
+import matplotlib.pyplot as plt
+
+#==================================================
+print("Hello world!")
+
+#==================================================
+array = np.array([1, 2, 3])
+print(array)
+
+#==================================================
+plt.plot(array)
+plt.show()
\ No newline at end of file
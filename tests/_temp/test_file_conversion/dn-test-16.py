@@ -0,0 +1,21 @@
+#%%
+import numpy as np
+import matplotlib.pyplot as plt
+
+#%%
+"""
+# heading
+
+this is a markdown cell, it should appear in the output as a comment
+"""
+
+#%%
+print("Hello world!")
+
+#%%
+array = np.array([1, 2, 3])
+print(array)
+
+#%%
+plt.plot(array)
+plt.show()
\ No newline at end of file
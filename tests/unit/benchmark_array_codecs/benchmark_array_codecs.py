@@ -0,0 +1,133 @@
+"""Benchmarks for compressed array modes of `muutils.json_serialize.array`: size vs encode/decode throughput per codec.
+
+Run with: python -m tests.unit.benchmark_array_codecs.benchmark_array_codecs
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from muutils.json_serialize import JsonSerializer
+from muutils.json_serialize.array import get_array_codec, load_array
+
+
+def make_activations(n: int) -> np.ndarray:
+    """post-relu activations: float32, about half zeros"""
+    rng: np.random.Generator = np.random.default_rng(0)
+    return np.maximum(rng.standard_normal((n, 256), dtype=np.float32), 0)
+
+
+def make_random(n: int) -> np.ndarray:
+    """uniform random float32, close to incompressible"""
+    rng: np.random.Generator = np.random.default_rng(0)
+    return rng.random((n, 256), dtype=np.float32)
+
+
+def make_token_ids(n: int) -> np.ndarray:
+    """int64 token ids from a small vocabulary"""
+    rng: np.random.Generator = np.random.default_rng(0)
+    return rng.integers(0, 1000, size=(n, 256), dtype=np.int64)
+
+
+DATA_FACTORIES: Dict[str, Callable[[int], np.ndarray]] = {
+    "activations": make_activations,
+    "random": make_random,
+    "token_ids": make_token_ids,
+}
+
+# (array_mode, codec, level), the first one is the baseline
+CONFIGS: List[Tuple[str, Optional[str], Optional[int]]] = [
+    ("array_b64_meta", None, None),
+    ("array_b64z_meta", "zlib", 1),
+    ("array_b64z_meta", "zlib", 6),
+    ("array_b64z_meta", "lz4", None),
+    ("array_b64z_meta", "zstd", 3),
+    ("array_b64z_meta", "zstd", 19),
+]
+
+
+def available_configs() -> List[Tuple[str, Optional[str], Optional[int]]]:
+    """`CONFIGS` without the codecs which are not installed"""
+    configs: List[Tuple[str, Optional[str], Optional[int]]] = []
+    for array_mode, codec, level in CONFIGS:
+        if codec is not None:
+            try:
+                get_array_codec(codec)
+            except ImportError:
+                continue
+        configs.append((array_mode, codec, level))
+    return configs
+
+
+def median_time(func: Callable[[], Any], runs: int) -> float:
+    """median time in seconds of `func()` over `runs` runs"""
+    times: List[float] = []
+    for _ in range(runs):
+        start: float = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main(
+    data_sizes: Sequence[int] = (1_000, 10_000),
+    runs: int = 5,
+    verbose: bool = True,
+) -> List[Dict[str, Any]]:
+    """serialize each dataset with each codec, recording json size and encode/decode throughput in MB/s of raw array data"""
+    results: List[Dict[str, Any]] = []
+    for data_name, factory in DATA_FACTORIES.items():
+        for n in data_sizes:
+            arr: np.ndarray = factory(n)
+            raw_mb: float = arr.nbytes / 1e6
+            baseline_size: Optional[int] = None
+            for array_mode, codec, level in available_configs():
+                jser: JsonSerializer = JsonSerializer(
+                    array_mode=array_mode,  # type: ignore[arg-type]
+                    array_codec=codec or "zlib",  # type: ignore[arg-type]
+                    array_codec_level=level,
+                )
+                serialized: Any = jser.json_serialize(arr)
+                assert np.array_equal(load_array(serialized), arr)
+                size: int = len(json.dumps(serialized))
+                if baseline_size is None:
+                    baseline_size = size
+
+                t_encode: float = median_time(lambda: jser.json_serialize(arr), runs)
+                t_decode: float = median_time(lambda: load_array(serialized), runs)
+                config_name: str = (
+                    "b64 (uncompressed)"
+                    if codec is None
+                    else f"{codec} level={serialized['level']}"
+                )
+                results.append(
+                    dict(
+                        data=data_name,
+                        n=n,
+                        config=config_name,
+                        size=size,
+                        ratio=baseline_size / size,
+                        encode_mb_s=(
+                            raw_mb / t_encode if t_encode > 0 else float("inf")
+                        ),
+                        decode_mb_s=(
+                            raw_mb / t_decode if t_decode > 0 else float("inf")
+                        ),
+                    )
+                )
+                if verbose:
+                    r: Dict[str, Any] = results[-1]
+                    print(
+                        f"{data_name:>12} n={n:<7} {config_name:<20} {size / 1e6:9.3f} MB  x{r['ratio']:5.2f}"
+                        f"  encode {r['encode_mb_s']:8.1f} MB/s  decode {r['decode_mb_s']:8.1f} MB/s"
+                    )
+    return results
+
+
+if __name__ == "__main__":
+    main()
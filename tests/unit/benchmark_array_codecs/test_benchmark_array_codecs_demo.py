@@ -0,0 +1,11 @@
+"""Simple demo of using the array codec benchmark scripts."""
+
+from .benchmark_array_codecs import main
+
+
+def test_main():
+    """Test the main function of the array codec benchmark script."""
+    results = main(data_sizes=(1, 10), runs=1, verbose=False)
+    assert len(results) > 0
+    assert all(r["size"] > 0 for r in results)
+    assert any(r["config"].startswith("zlib") for r in results)
@@ -0,0 +1,108 @@
+"""Benchmarks for `muutils.json_serialize.JsonSerializer` configurations.
+
+Run with: python -m tests.unit.benchmark_json_serialize.benchmark_json_serialize
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Sequence
+
+from muutils.json_serialize import BASE_HANDLERS, JsonSerializer
+
+
+def make_log_messages(n: int) -> List[Dict[str, Any]]:
+    """logger-style messages: flat dicts of json primitives, some with a flat list"""
+    return [
+        {
+            "step": i,
+            "loss": 1.0 / (i + 1),
+            "lr": 1e-3,
+            "tag": f"train/{i % 7}",
+            "done": i % 2 == 0,
+            "extra": None,
+            "values": [i, i * 0.5, "x", None],
+        }
+        for i in range(n)
+    ]
+
+
+def make_metrics_lists(n: int) -> List[List[float]]:
+    """lists of floats, like per-batch metrics"""
+    return [[float(i + j) for j in range(32)] for i in range(n)]
+
+
+DATA_FACTORIES: Dict[str, Callable[[int], Any]] = {
+    "log_messages": make_log_messages,
+    "metrics_lists": make_metrics_lists,
+}
+
+
+def serializer_configs() -> Dict[str, JsonSerializer]:
+    """serializers to compare, the first one is the baseline"""
+    return {
+        "BASE_HANDLERS, no fast path": JsonSerializer(
+            handlers_default=BASE_HANDLERS, native_fast_path=None
+        ),
+        "BASE_HANDLERS, fast path copy": JsonSerializer(
+            handlers_default=BASE_HANDLERS, native_fast_path="copy"
+        ),
+        "BASE_HANDLERS, fast path reference": JsonSerializer(
+            handlers_default=BASE_HANDLERS, native_fast_path="reference"
+        ),
+        "DEFAULT_HANDLERS, fast path copy": JsonSerializer(native_fast_path="copy"),
+    }
+
+
+def time_serialize(jser: JsonSerializer, data: Any, runs: int) -> float:
+    """median time in seconds of `jser.json_serialize(data)` over `runs` runs"""
+    times: List[float] = []
+    for _ in range(runs):
+        start: float = time.perf_counter()
+        jser.json_serialize(data)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main(
+    data_sizes: Sequence[int] = (1_000, 10_000, 100_000),
+    runs: int = 5,
+    verbose: bool = True,
+) -> List[Dict[str, Any]]:
+    """time each serializer config on each dataset, returning one record per combination"""
+    results: List[Dict[str, Any]] = []
+    for data_name, factory in DATA_FACTORIES.items():
+        for n in data_sizes:
+            data: Any = factory(n)
+            configs: Dict[str, JsonSerializer] = serializer_configs()
+            # check all configs agree before timing
+            expected: Any = None
+            baseline_time: float | None = None
+            for config_name, jser in configs.items():
+                output: Any = jser.json_serialize(data)
+                if expected is None:
+                    expected = output
+                assert output == expected, f"{config_name} output differs"
+
+                t: float = time_serialize(jser, data, runs)
+                if baseline_time is None:
+                    baseline_time = t
+                results.append(
+                    dict(
+                        data=data_name,
+                        n=n,
+                        config=config_name,
+                        time_s=t,
+                        speedup=baseline_time / t if t > 0 else float("inf"),
+                    )
+                )
+                if verbose:
+                    print(
+                        f"{data_name:>14} n={n:<8} {config_name:<36} {t * 1e3:10.2f} ms  x{results[-1]['speedup']:.2f}"
+                    )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+"""Simple demo of using the json_serialize benchmark scripts."""
+
+from .benchmark_json_serialize import main
+
+
+def test_main():
+    """Test the main function of the json_serialize benchmark script."""
+    results = main(data_sizes=(1, 10), runs=1, verbose=False)
+    assert len(results) > 0
+    assert all(r["time_s"] >= 0 for r in results)
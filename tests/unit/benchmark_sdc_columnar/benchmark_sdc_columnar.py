@@ -0,0 +1,105 @@
+"""Benchmark of the columnar `serialize_many` and `load_many` of serializable dataclasses against `serialize` and `load` of each instance.
+
+round trips `n` instances of a three field dataclass through each, and measures the size of the json
+
+Run with: python -m tests.unit.benchmark_sdc_columnar.benchmark_sdc_columnar
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import time
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from muutils.json_serialize import (
+    SerializableDataclass,
+    json_serialize,
+    serializable_dataclass,
+)
+
+
+@serializable_dataclass
+class Record(SerializableDataclass):
+    name: str
+    step: int
+    loss: float
+
+
+def per_row(records: List[Record]) -> Tuple[Any, Callable[[], List[Record]]]:
+    serialized: List[Dict[str, Any]] = [r.serialize() for r in records]
+    return serialized, lambda: [Record.load(d) for d in serialized]
+
+
+def columnar(records: List[Record]) -> Tuple[Any, Callable[[], List[Record]]]:
+    serialized: Dict[str, Any] = Record.serialize_many(records)
+    return serialized, lambda: Record.load_many(serialized)
+
+
+IMPLS: Dict[str, Callable[[List[Record]], Tuple[Any, Callable[[], List[Record]]]]] = {
+    "per_row": per_row,
+    "columnar": columnar,
+}
+
+
+def time_round_trip(
+    impl: Callable[[List[Record]], Tuple[Any, Callable[[], List[Record]]]], n: int
+) -> Dict[str, float]:
+    """seconds to serialize and to load `n` records, with the garbage collector paused as `timeit` does, and the size of the json"""
+    records: List[Record] = [Record(f"r{i}", i, 1.0 / (i + 1)) for i in range(n)]
+    # the first `load` generates the compiled version
+    Record.load(records[0].serialize())
+    gc.collect()
+    gc.disable()
+    try:
+        start: float = time.perf_counter()
+        serialized, load = impl(records)
+        serialize_s: float = time.perf_counter() - start
+        start = time.perf_counter()
+        loaded: List[Record] = load()
+        load_s: float = time.perf_counter() - start
+    finally:
+        gc.enable()
+    assert loaded == records
+    json_bytes: int = len(json.dumps(json_serialize(serialized)))
+    return dict(serialize_s=serialize_s, load_s=load_s, json_bytes=json_bytes)
+
+
+def main(
+    data_sizes: Sequence[int] = (10_000, 100_000, 1_000_000),
+    verbose: bool = True,
+) -> List[Dict[str, Any]]:
+    """time round trips with each implementation, returning one record per combination"""
+    results: List[Dict[str, Any]] = []
+    for n in data_sizes:
+        baseline: Dict[str, float] | None = None
+        for name, impl in IMPLS.items():
+            times: Dict[str, float] = time_round_trip(impl, n)
+            if baseline is None:
+                baseline = times
+            results.append(
+                dict(
+                    n=n,
+                    impl=name,
+                    **times,
+                    serialize_speedup=baseline["serialize_s"] / times["serialize_s"]
+                    if times["serialize_s"] > 0
+                    else float("inf"),
+                    load_speedup=baseline["load_s"] / times["load_s"]
+                    if times["load_s"] > 0
+                    else float("inf"),
+                    size_ratio=baseline["json_bytes"] / times["json_bytes"],
+                )
+            )
+            if verbose:
+                r: Dict[str, Any] = results[-1]
+                print(
+                    f"n={n:<8} {name:<9} serialize {times['serialize_s']:8.3f} s (x{r['serialize_speedup']:.2f})"
+                    f"  load {times['load_s']:8.3f} s (x{r['load_speedup']:.2f})"
+                    f"  json {int(times['json_bytes']):>11} bytes (x{r['size_ratio']:.2f} smaller)"
+                )
+    return results
+
+
+if __name__ == "__main__":
+    main()
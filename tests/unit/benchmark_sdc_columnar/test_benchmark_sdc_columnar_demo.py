@@ -0,0 +1,13 @@
+"""Simple demo of using the serializable dataclass columnar benchmark script."""
+
+from .benchmark_sdc_columnar import main
+
+
+def test_main():
+    """Test that both implementations round trip, and the columnar json is smaller."""
+    results = main(data_sizes=(10, 1_000), verbose=False)
+    assert {(r["n"], r["impl"]) for r in results} == {
+        (n, impl) for n in (10, 1_000) for impl in ("per_row", "columnar")
+    }
+    by_impl = {r["impl"]: r for r in results if r["n"] == 1_000}
+    assert by_impl["columnar"]["json_bytes"] < by_impl["per_row"]["json_bytes"]
@@ -0,0 +1,111 @@
+"""Benchmark of the generated `serialize` and `load` of `serializable_dataclass` against the generic ones.
+
+round trips `n` instances of a small nested dataclass through `serialize` and `load`, with
+`compile_methods=True` (the default) and `compile_methods=False`, including the default type validation on load
+
+Run with: python -m tests.unit.benchmark_sdc_compiled.benchmark_sdc_compiled
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+from typing import Any, Dict, List, Sequence
+
+from muutils.json_serialize import (
+    SerializableDataclass,
+    serializable_dataclass,
+    serializable_field,
+)
+
+
+@serializable_dataclass
+class Point(SerializableDataclass):
+    x: float
+    y: float
+
+
+@serializable_dataclass
+class Record(SerializableDataclass):
+    name: str
+    step: int
+    loss: float
+    point: Point
+    tags: List[str] = serializable_field(default_factory=list)
+
+
+@serializable_dataclass(compile_methods=False)
+class GenericPoint(SerializableDataclass):
+    x: float
+    y: float
+
+
+@serializable_dataclass(compile_methods=False)
+class GenericRecord(SerializableDataclass):
+    name: str
+    step: int
+    loss: float
+    point: GenericPoint
+    tags: List[str] = serializable_field(default_factory=list)
+
+
+CLASSES: Dict[str, Any] = {
+    "generic": (GenericRecord, GenericPoint),
+    "compiled": (Record, Point),
+}
+
+
+def time_round_trip(record_cls: Any, point_cls: Any, n: int) -> Dict[str, float]:
+    """seconds to serialize and to load `n` records, with the garbage collector paused as `timeit` does"""
+    records: List[Any] = [
+        record_cls(f"r{i}", i, 1.0 / (i + 1), point_cls(float(i), 0.5), ["a"])
+        for i in range(n)
+    ]
+    # the first `load` generates the compiled version
+    record_cls.load(records[0].serialize())
+    gc.collect()
+    gc.disable()
+    try:
+        start: float = time.perf_counter()
+        serialized: List[Dict[str, Any]] = [r.serialize() for r in records]
+        serialize_s: float = time.perf_counter() - start
+        start = time.perf_counter()
+        loaded: List[Any] = [record_cls.load(d) for d in serialized]
+        load_s: float = time.perf_counter() - start
+    finally:
+        gc.enable()
+    assert loaded == records
+    return dict(serialize_s=serialize_s, load_s=load_s)
+
+
+def main(
+    data_sizes: Sequence[int] = (10_000, 100_000, 1_000_000),
+    verbose: bool = True,
+) -> List[Dict[str, Any]]:
+    """time round trips with each implementation, returning one record per combination"""
+    results: List[Dict[str, Any]] = []
+    for n in data_sizes:
+        baseline: float | None = None
+        for name, (record_cls, point_cls) in CLASSES.items():
+            times: Dict[str, float] = time_round_trip(record_cls, point_cls, n)
+            total: float = times["serialize_s"] + times["load_s"]
+            if baseline is None:
+                baseline = total
+            results.append(
+                dict(
+                    n=n,
+                    impl=name,
+                    **times,
+                    total_s=total,
+                    speedup=baseline / total if total > 0 else float("inf"),
+                )
+            )
+            if verbose:
+                print(
+                    f"n={n:<8} {name:<9} serialize {times['serialize_s']:8.3f} s  load {times['load_s']:8.3f} s  x{results[-1]['speedup']:.2f}"
+                )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+"""Simple demo of using the serializable dataclass benchmark script."""
+
+from .benchmark_sdc_compiled import main
+
+
+def test_main():
+    """Test that both implementations round trip, and are timed for each data size."""
+    results = main(data_sizes=(10, 100), verbose=False)
+    assert len(results) == 4
+    assert {(r["n"], r["impl"]) for r in results} == {
+        (n, impl) for n in (10, 100) for impl in ("generic", "compiled")
+    }
+    assert all(r["total_s"] >= 0 for r in results)
@@ -0,0 +1,94 @@
+"""Benchmark of the memory used by instances of `serializable_dataclass` with and without `slots=True`.
+
+creates `n` instances of a small record class and measures the memory allocated for them with `tracemalloc`,
+not counting the values of the fields, which are shared between the instances
+
+Run with: python -m tests.unit.benchmark_sdc_slots.benchmark_sdc_slots
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+from typing import Any, Dict, List, Sequence
+
+from muutils.json_serialize import SerializableDataclass, serializable_dataclass
+
+
+@serializable_dataclass
+class Record(SerializableDataclass):
+    name: str
+    step: int
+    loss: float
+    tag: str
+
+
+@serializable_dataclass(slots=True)
+class SlottedRecord(SerializableDataclass):
+    name: str
+    step: int
+    loss: float
+    tag: str
+
+
+CLASSES: Dict[str, Any] = {
+    "dict": Record,
+    "slots": SlottedRecord,
+}
+
+
+def measure_instances(record_cls: Any, n: int) -> Dict[str, float]:
+    """bytes allocated per instance when creating `n` instances of `record_cls`"""
+    # the same field values for every instance, so only the instances themselves are measured
+    values: tuple[Any, ...] = ("record", 1, 0.5, "a")
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before: int = tracemalloc.get_traced_memory()[0]
+        records: List[Any] = [record_cls(*values) for _ in range(n)]
+        after: int = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # the list holding the instances
+    list_bytes: int = sys.getsizeof(records)
+    assert records[0].serialize() == record_cls.load(records[0].serialize()).serialize()
+    # `sys.getsizeof` of an instance doesn't include its `__dict__`
+    getsizeof: int = sys.getsizeof(records[0])
+    if hasattr(records[0], "__dict__"):
+        getsizeof += sys.getsizeof(records[0].__dict__)
+    return dict(
+        bytes_per_instance=(after - before - list_bytes) / n,
+        getsizeof=float(getsizeof),
+    )
+
+
+def main(
+    data_sizes: Sequence[int] = (10_000, 100_000, 1_000_000),
+    verbose: bool = True,
+) -> List[Dict[str, Any]]:
+    """measure instances of each class, returning one record per combination"""
+    results: List[Dict[str, Any]] = []
+    for n in data_sizes:
+        baseline: float | None = None
+        for name, record_cls in CLASSES.items():
+            sizes: Dict[str, float] = measure_instances(record_cls, n)
+            if baseline is None:
+                baseline = sizes["bytes_per_instance"]
+            results.append(
+                dict(
+                    n=n,
+                    impl=name,
+                    **sizes,
+                    ratio=sizes["bytes_per_instance"] / baseline,
+                )
+            )
+            if verbose:
+                print(
+                    f"n={n:<8} {name:<6} {sizes['bytes_per_instance']:7.1f} bytes/instance  getsizeof {sizes['getsizeof']:5.0f}  x{results[-1]['ratio']:.2f}"
+                )
+    return results
+
+
+if __name__ == "__main__":
+    main()
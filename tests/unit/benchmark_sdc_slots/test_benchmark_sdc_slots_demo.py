@@ -0,0 +1,13 @@
+"""Simple demo of using the serializable dataclass slots benchmark script."""
+
+from .benchmark_sdc_slots import main
+
+
+def test_main():
+    """Test that both classes are measured, and the slotted instances are smaller."""
+    results = main(data_sizes=(2_000,), verbose=False)
+    by_impl = {r["impl"]: r for r in results}
+    assert set(by_impl) == {"dict", "slots"}
+    assert (
+        by_impl["slots"]["bytes_per_instance"] < by_impl["dict"]["bytes_per_instance"]
+    )
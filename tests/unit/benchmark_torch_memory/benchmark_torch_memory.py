@@ -0,0 +1,89 @@
+"""Memory benchmark for serializing torch tensors with `muutils.json_serialize.array.serialize_array`.
+
+measures the peak memory traced by `tracemalloc` (which includes numpy allocations, but not torch ones)
+relative to the size of the tensor's data, for:
+
+- getting the raw bytes of the tensor, which every byte-based array mode does first. this ratio is the
+  number of copies made, and should be 0 for contiguous CPU tensors and 1 for non-contiguous ones,
+  compared to 2 for the previous `np.array(tensor.detach().cpu()).tobytes()`
+- the whole of `array_b64_meta` serialization, where the base64 bytes and string (each 4/3 of the data)
+  are included
+
+Run with: python -m tests.unit.benchmark_torch_memory.benchmark_torch_memory
+"""
+
+from __future__ import annotations
+
+import base64
+import tracemalloc
+from typing import Any, Callable, Dict, List, Sequence
+
+import numpy as np
+import torch
+
+from muutils.json_serialize import JsonSerializer
+from muutils.json_serialize.array import (
+    _as_bytes,  # pyright: ignore[reportPrivateUsage]
+    array_to_numpy,
+    serialize_array,
+)
+
+
+def legacy_bytes(tensor: torch.Tensor) -> bytes:
+    """the previous tensor path: `detach().cpu()`, then `np.array`, then `tobytes()`"""
+    return np.array(tensor.detach().cpu().numpy()).tobytes()
+
+
+def make_tensors(n: int) -> Dict[str, torch.Tensor]:
+    """float32 tensors of `n` x 256: contiguous, and a transposed view which must be copied once"""
+    tensor: torch.Tensor = torch.randn(n, 256)
+    return {"contiguous": tensor, "transposed": tensor.T}
+
+
+def peak_bytes(func: Callable[[], Any]) -> int:
+    """peak memory traced while running `func`, including its result"""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def main(
+    data_sizes: Sequence[int] = (1_000, 10_000),
+    verbose: bool = True,
+) -> List[Dict[str, Any]]:
+    """measure peak memory relative to the data size of each path, for each tensor layout"""
+    results: List[Dict[str, Any]] = []
+    jser: JsonSerializer = JsonSerializer(array_mode="array_b64_meta")
+    for n in data_sizes:
+        for layout, tensor in make_tensors(n).items():
+            nbytes: int = tensor.nelement() * tensor.element_size()
+            paths: Dict[str, Callable[[], Any]] = {
+                "bytes, legacy": lambda: legacy_bytes(tensor),
+                "bytes": lambda: _as_bytes(array_to_numpy(tensor)[0]),
+                "b64, legacy": lambda: base64.b64encode(legacy_bytes(tensor)).decode(),
+                "b64": lambda: serialize_array(jser, tensor, "x"),
+            }
+            for path, func in paths.items():
+                peak: int = peak_bytes(func)
+                results.append(
+                    dict(
+                        n=n,
+                        layout=layout,
+                        path=path,
+                        peak_mb=peak / 1e6,
+                        peak_ratio=peak / nbytes,
+                    )
+                )
+                if verbose:
+                    print(
+                        f"n={n:<7} {layout:<11} {path:<14} peak {peak / 1e6:8.2f} MB  x{peak / nbytes:5.2f} of data"
+                    )
+    return results
+
+
+if __name__ == "__main__":
+    main()
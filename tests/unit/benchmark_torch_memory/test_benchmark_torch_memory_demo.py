@@ -0,0 +1,14 @@
+"""Simple demo of using the torch memory benchmark scripts."""
+
+from .benchmark_torch_memory import main
+
+
+def test_main():
+    """Test that contiguous CPU tensors are copied at most once, and less than before."""
+    results = main(data_sizes=(512,), verbose=False)
+    by_key = {(r["layout"], r["path"]): r["peak_ratio"] for r in results}
+    for layout in ("contiguous", "transposed"):
+        assert by_key[(layout, "bytes")] <= 1.05
+        assert by_key[(layout, "bytes, legacy")] >= 1.95
+    assert by_key[("contiguous", "bytes")] < 0.05
+    assert by_key[("contiguous", "b64")] < by_key[("contiguous", "b64, legacy")]
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import json
+import typing
+
+import pytest
+
+from muutils.json_serialize import (
+    SerializableDataclass,
+    json_serialize,
+    serializable_dataclass,
+    serializable_field,
+)
+from muutils.errormode import ErrorMode
+from muutils.json_serialize.json_load import json_load
+from muutils.json_serialize.serializable_dataclass import FieldTypeMismatchError
+from muutils.json_serialize.types import _FORMAT_KEY
+
+# pylint: disable=missing-class-docstring
+
+
+@serializable_dataclass
+class ColPoint(SerializableDataclass):
+    x: float
+    y: float
+
+
+@serializable_dataclass(properties_to_serialize=["doubled"])
+class ColRecord(SerializableDataclass):
+    name: str
+    step: int
+    ok: bool
+    point: ColPoint
+    value: typing.Any = serializable_field(default=0, assert_type=False)
+    tags: typing.List[str] = serializable_field(default_factory=list)
+
+    @property
+    def doubled(self) -> int:
+        return self.step * 2
+
+
+def make_records(n: int) -> typing.List[ColRecord]:
+    return [
+        ColRecord(
+            f"r{i}", i, i % 2 == 0, ColPoint(i / 3, -0.0), value=i, tags=["a"] * i
+        )
+        for i in range(n)
+    ]
+
+
+def test_columnar_format():
+    records = make_records(3)
+    data = ColRecord.serialize_many(records)
+    assert data[_FORMAT_KEY] == "ColRecord(SerializableDataclass):columnar"
+    assert data["n"] == 3
+    assert data["fields"] == ["name", "step", "ok", "point", "value", "tags", "doubled"]
+    columns = dict(zip(data["fields"], data["columns"]))
+    assert columns["name"] == ["r0", "r1", "r2"]
+    assert columns["tags"] == [[], ["a"], ["a", "a"]]
+    assert columns["point"][1] == ColPoint(1 / 3, -0.0).serialize()
+    # numeric columns are arrays
+    for name in ("step", "ok", "value", "doubled"):
+        assert columns[name][_FORMAT_KEY] == "numpy.ndarray:array_b64_meta"
+    assert columns["step"]["dtype"] == "int64"
+    assert columns["ok"]["dtype"] == "bool"
+
+    list_meta = ColRecord.serialize_many(records, array_mode="array_list_meta")
+    assert dict(zip(list_meta["fields"], list_meta["columns"]))["step"]["data"] == [
+        0,
+        1,
+        2,
+    ]
+    with pytest.raises(ValueError, match="without data"):
+        ColRecord.serialize_many(records, array_mode="array_summary_meta")
+
+
+def test_columnar_round_trip():
+    records = make_records(20)
+    # mixed, and too large for an int64, so not stored as arrays
+    records[3].value = 2.5
+    records[4].value = 2**70
+    data = json.loads(json.dumps(json_serialize(ColRecord.serialize_many(records))))
+    loaded = ColRecord.load_many(data)
+    assert loaded == records
+    assert type(loaded[0].step) is int and type(loaded[0].ok) is bool
+    assert type(loaded[0].point) is ColPoint
+    # -0.0 survives the array column
+    assert str(loaded[0].point.y) == "-0.0"
+
+    # `json_load` recognizes the format, including nested in other data
+    assert json_load({"records": data})["records"] == records
+
+
+def test_columnar_edge_cases():
+    empty = ColRecord.serialize_many([])
+    assert empty["n"] == 0 and empty["columns"] == [[]] * len(empty["fields"])
+    assert ColRecord.load_many(empty) == []
+
+    class SubPoint(ColPoint):
+        pass
+
+    with pytest.raises(TypeError, match="exactly ColPoint"):
+        ColPoint.serialize_many([ColPoint(1.0, 2.0), SubPoint(1.0, 2.0)])
+    with pytest.raises(ValueError, match="columnar format"):
+        ColPoint.load_many(ColPoint(1.0, 2.0).serialize())
+
+    # columns of different lengths are not truncated to the shortest
+    records = make_records(3)
+    data = ColRecord.serialize_many(records)
+    short = dict(data, columns=[data["columns"][0][:2], *data["columns"][1:]])
+    with pytest.raises(ValueError, match="columns of 3 values"):
+        ColRecord.load_many(short)
+    with pytest.raises(ValueError, match="columns of 4 values"):
+        ColRecord.load_many(dict(data, n=4))
+
+
+@serializable_dataclass(on_typecheck_mismatch=ErrorMode.EXCEPT)
+class ColFunctions(SerializableDataclass):
+    step: int
+    scaled: float = serializable_field(
+        default=0.0,
+        serialization_fn=lambda x: x * 10,
+        deserialize_fn=lambda x: x / 10,
+    )
+    label: str = serializable_field(
+        default="",
+        loading_fn=lambda data: data["label"].upper(),
+    )
+    lazy: typing.List[int] = serializable_field(default_factory=list, lazy=True)
+    total: int = serializable_field(init=False, default=0, assert_type=False)
+
+    def __post_init__(self):
+        self.total = self.step * 2
+
+
+def test_columnar_field_functions():
+    items = [ColFunctions(i, i / 2, f"L{i}", [i] * i) for i in range(5)]
+    data = ColFunctions.serialize_many(items, array_mode="array_list_meta")
+    columns = dict(zip(data["fields"], data["columns"]))
+    assert columns["scaled"]["data"] == [i * 5 for i in range(5)]
+    assert columns["lazy"] == [[i] * i for i in range(5)]
+    loaded = ColFunctions.load_many(data)
+    assert loaded == items
+    assert [x.total for x in loaded] == [i * 2 for i in range(5)]
+    # lazy fields which were never loaded are written back as they were
+    assert ColFunctions.serialize_many(loaded, array_mode="array_list_meta") == data
+
+
+def test_columnar_type_mismatch():
+    data = ColFunctions.serialize_many([ColFunctions(1), ColFunctions(2)])
+    bad = dict(data, columns=[["1", 2], *data["columns"][1:]])
+    # each row is loaded with `load`, which handles the mismatch
+    with pytest.raises(FieldTypeMismatchError, match="step"):
+        ColFunctions.load_many(bad)
+
+    @serializable_dataclass(on_typecheck_mismatch=ErrorMode.IGNORE)
+    class Loose(SerializableDataclass):
+        step: int
+
+    loose = Loose.serialize_many([Loose(1), Loose(2)])
+    assert Loose.load_many(dict(loose, columns=[["1", 2]])) == [Loose("1"), Loose(2)]  # type: ignore[arg-type]
+
+
+def test_columnar_replaced_methods():
+    @serializable_dataclass(methods_no_override=["serialize", "load"])
+    class Custom(SerializableDataclass):
+        step: int
+
+        def serialize(self) -> typing.Dict[str, typing.Any]:
+            return {_FORMAT_KEY: "Custom(SerializableDataclass)", "step": -self.step}
+
+        @classmethod
+        def load(cls, data):
+            return cls(-data["step"])
+
+    data = Custom.serialize_many([Custom(1), Custom(2)], array_mode="array_list_meta")
+    assert data["columns"][0]["data"] == [-1, -2]
+    assert Custom.load_many(data) == [Custom(1), Custom(2)]
@@ -0,0 +1,144 @@
+"""the generated `serialize` and `load` (`compile_methods=True`) behave the same as the generic ones"""
+
+# no `from __future__ import annotations`, so the type hints of the classes defined in functions can be resolved
+import typing
+
+import pytest
+
+from muutils.errormode import ErrorMode
+from muutils.json_serialize import (
+    SerializableDataclass,
+    serializable_dataclass,
+    serializable_field,
+)
+from muutils.json_serialize.serializable_dataclass import (
+    FieldLoadingError,
+    FieldSerializationError,
+    FieldTypeMismatchError,
+)
+from muutils.json_serialize.types import _FORMAT_KEY
+
+# pylint: disable=missing-class-docstring
+
+
+class HasSerialize:
+    def __init__(self, x: int):
+        self.x = x
+
+    def serialize(self) -> dict:
+        return {"x": self.x}
+
+
+@serializable_dataclass(compile_methods=True)
+class CompiledBase(SerializableDataclass):
+    a: int
+    b: str = serializable_field(default="b")
+
+
+def make_classes(compile_methods: bool) -> typing.Any:
+    """define the same classes, with or without compiled methods"""
+
+    @serializable_dataclass(compile_methods=compile_methods)
+    class Inner(SerializableDataclass):
+        a: int
+        b: str = serializable_field(default="b")
+
+    @serializable_dataclass(
+        compile_methods=compile_methods, properties_to_serialize=["total"]
+    )
+    class Outer(SerializableDataclass):
+        inner: Inner
+        values: typing.List[int]
+        doubled: typing.List[int] = serializable_field(
+            default_factory=list,
+            serialization_fn=lambda x: [v * 2 for v in x],
+            deserialize_fn=lambda x: [v // 2 for v in x],
+        )
+        custom: typing.Any = serializable_field(default=None)
+        from_data: int = serializable_field(
+            default=0,
+            serialization_fn=lambda x: x + 1,
+            loading_fn=lambda data: data["from_data"] - 1,
+        )
+        hidden: int = serializable_field(default=7, init=False, serialize=False)
+
+        @property
+        def total(self) -> int:
+            return sum(self.values)
+
+    return Inner, Outer
+
+
+@pytest.mark.parametrize("compile_methods", [True, False])
+def test_compiled_matches_generic(compile_methods):
+    Inner, Outer = make_classes(compile_methods)
+    GenericInner, GenericOuter = make_classes(not compile_methods)
+
+    obj = Outer(Inner(1), [1, 2], doubled=[3], custom=HasSerialize(5), from_data=10)
+    expected = GenericOuter(
+        GenericInner(1),
+        [1, 2],
+        doubled=[3],
+        custom=HasSerialize(5),
+        from_data=10,
+    ).serialize()
+    serialized = obj.serialize()
+    assert serialized == expected
+    assert serialized == {
+        _FORMAT_KEY: "Outer(SerializableDataclass)",
+        "inner": {_FORMAT_KEY: "Inner(SerializableDataclass)", "a": 1, "b": "b"},
+        "values": [1, 2],
+        "doubled": [6],
+        "custom": {"x": 5},
+        "from_data": 11,
+        "total": 3,
+    }
+
+    serialized["custom"] = None
+    loaded = Outer.load(serialized)
+    assert loaded == Outer(Inner(1), [1, 2], doubled=[3], from_data=10)
+    assert Outer.load(serialized) == loaded
+    assert Outer.load(loaded) is loaded
+
+    with pytest.raises(FieldLoadingError):
+        Outer.load({**serialized, "inner": 5})
+    # type mismatches only warn by default
+    with pytest.warns(UserWarning, match="Type mismatch in fields of Inner"):
+        assert Inner.load({"a": "not an int"}).a == "not an int"
+
+
+@pytest.mark.parametrize("compile_methods", [True, False])
+def test_compiled_errors(compile_methods):
+    @serializable_dataclass(
+        compile_methods=compile_methods, on_typecheck_mismatch=ErrorMode.EXCEPT
+    )
+    class Strict(SerializableDataclass):
+        a: int
+        b: typing.Any = serializable_field(default=0, serialization_fn=lambda x: 1 // x)
+
+    with pytest.raises(FieldTypeMismatchError, match="a:"):
+        Strict.load({"a": "x"})
+    with pytest.raises(FieldSerializationError, match="Error serializing field 'b'"):
+        Strict(1, b=0).serialize()
+
+    @serializable_dataclass(
+        compile_methods=compile_methods, properties_to_serialize=["missing"]
+    )
+    class MissingProperty(SerializableDataclass):
+        a: int
+
+    with pytest.raises(AttributeError, match="Cannot serialize property 'missing'"):
+        MissingProperty(1).serialize()
+
+
+def test_compiled_subclass_uses_generic():
+    """undecorated subclasses keep their own class name and fields"""
+
+    class Sub(CompiledBase):
+        pass
+
+    assert Sub(1).serialize()[_FORMAT_KEY] == "Sub(SerializableDataclass)"
+    loaded = Sub.load({"a": 2})
+    assert type(loaded) is Sub
+    assert CompiledBase.load({"a": 2}) == CompiledBase(2)
+    assert type(CompiledBase.load({"a": 2})) is CompiledBase
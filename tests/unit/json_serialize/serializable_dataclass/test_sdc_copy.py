@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import copy
+import threading
+import typing
+
+import numpy as np
+import pytest
+
+from muutils.json_serialize import (
+    SerializableDataclass,
+    serializable_dataclass,
+    serializable_field,
+)
+
+# pylint: disable=missing-class-docstring
+
+
+@serializable_dataclass
+class ArrayConfig(SerializableDataclass):
+    name: str
+    weights: np.ndarray = serializable_field(
+        serialization_fn=lambda x: x.tolist(),
+        deserialize_fn=lambda x: np.array(x),
+    )
+    mask: np.ndarray = serializable_field(
+        serialization_fn=lambda x: x.tolist(),
+        deserialize_fn=lambda x: np.array(x),
+    )
+    extra: typing.List[typing.Any] = serializable_field(default_factory=list)
+
+
+@serializable_dataclass(frozen=True)
+class FrozenConfig(SerializableDataclass):
+    inner: ArrayConfig
+    tags: typing.Tuple[str, ...] = serializable_field(default=(), deserialize_fn=tuple)
+
+
+@serializable_dataclass
+class WithLock(SerializableDataclass):
+    x: int
+    lock: typing.Any = serializable_field(
+        default_factory=threading.Lock,
+        serialization_fn=lambda x: None,
+        deserialize_fn=lambda x: threading.Lock(),
+        assert_type=False,
+    )
+
+
+def test_deepcopy_structural():
+    weights = np.arange(6, dtype=np.float32).reshape(2, 3)
+    config = ArrayConfig("c", weights, weights, extra=[weights, {"k": [1]}])
+    copied = copy.deepcopy(config)
+    assert copied == config
+    assert copied.weights is not weights
+    assert np.array_equal(copied.weights, weights)
+    assert copied.weights.dtype == np.float32
+    # members shared within the instance stay shared in the copy
+    assert copied.mask is copied.weights
+    assert copied.extra[0] is copied.weights
+    assert copied.extra[1] is not config.extra[1]
+
+    weights[0, 0] = 100
+    config.extra[1]["k"].append(2)
+    assert copied.weights[0, 0] == 0
+    assert copied.extra[1] == {"k": [1]}
+
+    # the memo is honored across instances, and `copy.copy` is also a deep copy
+    pair = copy.deepcopy([config, config])
+    assert pair[0] is pair[1]
+    shallow = copy.copy(config)
+    assert shallow == config and shallow.weights is not config.weights
+
+
+def test_deepcopy_frozen_and_fallback():
+    config = ArrayConfig("c", np.zeros(2), np.ones(2))
+    frozen = FrozenConfig(config, ("a",))
+    copied = copy.deepcopy(frozen)
+    assert copied == frozen
+    assert copied.inner is not config
+
+    # locks can't be deep copied, so the json round trip is used
+    with_lock = WithLock(3)
+    copied_lock = copy.deepcopy(with_lock)
+    assert copied_lock.x == 3
+    assert copied_lock.lock is not with_lock.lock
+
+
+def test_deepcopy_tensor():
+    torch = pytest.importorskip("torch")
+
+    @serializable_dataclass
+    class TensorConfig(SerializableDataclass):
+        t: typing.Any = serializable_field(assert_type=False)
+        grad: typing.Any = serializable_field(assert_type=False)
+
+    t = torch.arange(4.0)
+    grad = torch.ones(3, requires_grad=True)
+    copied = copy.deepcopy(TensorConfig(t, grad))
+    assert torch.equal(copied.t, t) and copied.t.data_ptr() != t.data_ptr()
+    assert copied.grad.requires_grad and copied.grad.is_leaf
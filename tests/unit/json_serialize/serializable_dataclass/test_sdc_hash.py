@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import copy
+import pickle
+import typing
+
+import numpy as np
+import pytest
+
+from muutils.json_serialize import (
+    SerializableDataclass,
+    dc_hash,
+    serializable_dataclass,
+    serializable_field,
+)
+
+# pylint: disable=missing-class-docstring
+
+
+@serializable_dataclass(frozen=True)
+class FrozenPoint(SerializableDataclass):
+    x: int
+    tags: typing.List[str] = serializable_field(default_factory=list)
+
+
+@serializable_dataclass(frozen=True)
+class FrozenShape(SerializableDataclass):
+    name: str
+    points: typing.List[FrozenPoint]
+    weights: np.ndarray = serializable_field(
+        serialization_fn=lambda x: x.tolist(),
+        deserialize_fn=lambda x: np.array(x),
+    )
+
+
+@serializable_dataclass
+class MutablePoint(SerializableDataclass):
+    x: int
+
+
+@serializable_dataclass(unsafe_hash=True)
+class UnsafeHashPoint(SerializableDataclass):
+    x: int
+    tags: typing.List[str] = serializable_field(default_factory=list)
+
+
+def test_frozen_hash_equal_objects():
+    a = FrozenShape("s", [FrozenPoint(1, ["a"])], np.zeros(3))
+    b = FrozenShape("s", [FrozenPoint(1, ["a"])], np.zeros(3))
+    assert a == b and a is not b
+    assert hash(a) == hash(b)
+    assert hash(a) != hash(FrozenShape("s", [FrozenPoint(2)], np.zeros(3)))
+    assert len({a, b, FrozenShape("t", [], np.zeros(3))}) == 2
+    assert {a: 1}[b] == 1
+    assert hash(FrozenPoint.load(a.points[0].serialize())) == hash(a.points[0])
+
+
+def test_frozen_hash_cached():
+    point = FrozenPoint(1, ["a"])
+    first = hash(point)
+    assert getattr(point, "_hash_cache") == first == dc_hash(point)
+    # the cache is kept, even though the list was modified in place
+    point.tags.append("b")
+    assert hash(point) == first
+
+    # nested frozen instances reuse their cached hash
+    shape = FrozenShape("s", [point], np.zeros(2))
+    hash(shape)
+    assert getattr(shape.points[0], "_hash_cache") == first
+
+
+def test_hash_cache_not_copied():
+    point = FrozenPoint(1, ["a"])
+    hash(point)
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        loaded = pickle.loads(pickle.dumps(point, protocol=protocol))
+        assert loaded == point
+        assert not hasattr(loaded, "_hash_cache")
+        assert hash(loaded) == hash(point)
+    copied = copy.deepcopy(point)
+    assert not hasattr(copied, "_hash_cache")
+    assert hash(copied) == hash(point)
+
+
+def test_hash_mutable_and_unsafe():
+    with pytest.raises(TypeError, match="unhashable"):
+        hash(MutablePoint(1))
+    a = UnsafeHashPoint(1, ["a"])
+    assert hash(a) == hash(UnsafeHashPoint(1, ["a"]))
+    # not cached for mutable instances
+    a.tags.append("b")
+    assert hash(a) == hash(UnsafeHashPoint(1, ["a", "b"]))
+    assert not hasattr(a, "_hash_cache")
+
+
+def test_hash_explicit_or_no_override():
+    @serializable_dataclass(frozen=True)
+    class ExplicitHash(SerializableDataclass):
+        x: int
+
+        def __hash__(self) -> int:
+            return 5
+
+    @serializable_dataclass(frozen=True, methods_no_override=["__hash__"])
+    class DataclassesHash(SerializableDataclass):
+        x: int
+
+    assert hash(ExplicitHash(1)) == 5
+    assert hash(DataclassesHash(1)) == hash((1,))
+
+
+def test_hash_cache_with_builtin_bases():
+    # the base class has no slots, so it can be mixed in with builtins
+    @serializable_dataclass(frozen=True)
+    class FrozenError(Exception, SerializableDataclass):
+        code: int
+
+    @serializable_dataclass
+    class IntRecord(int, SerializableDataclass):
+        name: str = ""
+
+    @serializable_dataclass
+    class TupleRecord(tuple, SerializableDataclass):
+        name: str = ""
+
+    assert issubclass(IntRecord, int) and issubclass(TupleRecord, tuple)
+    error = FrozenError(3)
+    first = hash(error)
+    assert getattr(error, "_hash_cache") == first == hash(FrozenError(3))
+    with pytest.raises(FrozenError):
+        raise error
+    assert FrozenError.load(error.serialize()) == error
+    assert not hasattr(copy.deepcopy(error), "_hash_cache")
+
+
+def test_hash_cache_slots():
+    @serializable_dataclass(frozen=True, slots=True)
+    class SlotsPoint(SerializableDataclass):
+        x: int
+
+    point = SlotsPoint(1)
+    assert SlotsPoint.__slots__ == ("x", "_hash_cache")
+    assert not hasattr(point, "__dict__")
+    first = hash(point)
+    assert getattr(point, "_hash_cache") == first == hash(SlotsPoint(1))
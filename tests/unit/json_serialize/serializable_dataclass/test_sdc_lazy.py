@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import copy
+import pickle
+import typing
+
+import numpy as np
+import pytest
+
+from muutils.errormode import ErrorMode
+from muutils.json_serialize import (
+    SerializableDataclass,
+    serializable_dataclass,
+    serializable_field,
+)
+from muutils.json_serialize.serializable_dataclass import FieldTypeMismatchError
+
+# pylint: disable=missing-class-docstring
+
+LOADS: typing.List[int] = []
+
+
+def load_weights(x: typing.Any) -> np.ndarray:
+    LOADS.append(1)
+    return np.array(x)
+
+
+@serializable_dataclass
+class LazyMeta(SerializableDataclass):
+    step: int
+
+
+@serializable_dataclass
+class LazyConfig(SerializableDataclass):
+    name: str
+    weights: np.ndarray = serializable_field(
+        serialization_fn=lambda x: x.tolist(),
+        deserialize_fn=load_weights,
+        lazy=True,
+    )
+    meta: LazyMeta = serializable_field(default_factory=lambda: LazyMeta(0), lazy=True)
+    total: int = serializable_field(
+        default=0,
+        loading_fn=lambda data: sum(data.get("counts", [data["total"]])),
+        serialization_fn=lambda x: x,
+        lazy=True,
+    )
+
+
+@serializable_dataclass(slots=True, frozen=True)
+class LazyFrozen(SerializableDataclass):
+    name: str
+    weights: np.ndarray = serializable_field(
+        serialization_fn=lambda x: x.tolist(),
+        deserialize_fn=load_weights,
+        lazy=True,
+    )
+
+
+@pytest.mark.parametrize("cls", [LazyConfig, LazyFrozen])
+def test_lazy_load_on_access(cls):
+    weights = np.arange(6.0).reshape(2, 3)
+    data = cls("c", weights).serialize()
+    LOADS.clear()
+    loaded = cls.load(data)
+    assert loaded.name == "c"
+    assert LOADS == []
+
+    # the serialized value is written back as it was loaded
+    assert loaded.serialize()["weights"] is data["weights"]
+    assert LOADS == []
+
+    assert np.array_equal(loaded.weights, weights)
+    assert loaded.weights is loaded.weights
+    assert LOADS == [1]
+    assert loaded.serialize() == data
+
+
+def test_lazy_nested_and_loading_fn():
+    data = LazyConfig("c", np.zeros(2), LazyMeta(3), total=0).serialize()
+    data["counts"] = [1, 2]
+    loaded = LazyConfig.load(data)
+    assert loaded.meta == LazyMeta(3)
+    assert loaded.total == 3
+    # directly set values are not lazy
+    assert LazyConfig("d", np.ones(1)).meta == LazyMeta(0)
+
+
+def test_lazy_type_checked_on_access():
+    @serializable_dataclass(on_typecheck_mismatch=ErrorMode.EXCEPT)
+    class Strict(SerializableDataclass):
+        name: str
+        count: int = serializable_field(default=0, lazy=True)
+
+    loaded = Strict.load({"name": "s", "count": "not an int"})
+    # the value is not kept after a failed check, so every access raises
+    for _ in range(2):
+        with pytest.raises(FieldTypeMismatchError, match="count"):
+            loaded.count
+
+    with pytest.raises(ValueError, match="lazy=True and init=False"):
+        serializable_field(default=0, init=False, serialize=False, lazy=True)
+
+
+@pytest.mark.parametrize("cls", [LazyConfig, LazyFrozen])
+def test_lazy_copy_pickle_eq(cls):
+    weights = np.arange(3.0)
+    data = cls("c", weights).serialize()
+    for copied in (
+        copy.deepcopy(cls.load(data)),
+        pickle.loads(pickle.dumps(cls.load(data))),
+    ):
+        assert np.array_equal(copied.weights, weights)
+        assert copied == cls("c", weights)
+    assert cls.load(data) == cls.load(data)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import copy
+import pickle
+import typing
+
+import pytest
+
+from muutils.json_serialize import (
+    SerializableDataclass,
+    serializable_dataclass,
+    serializable_field,
+)
+from muutils.json_serialize.json_load import json_load
+
+# pylint: disable=missing-class-docstring
+
+
+@serializable_dataclass(slots=True, properties_to_serialize=["total"])
+class SlotsRecord(SerializableDataclass):
+    name: str
+    values: typing.List[int] = serializable_field(default_factory=list)
+    scale: float = serializable_field(default=1.0)
+
+    @property
+    def total(self) -> float:
+        return sum(self.values) * self.scale
+
+
+@serializable_dataclass(slots=True, frozen=True)
+class SlotsFrozen(SerializableDataclass):
+    x: int
+    record: SlotsRecord
+
+
+@serializable_dataclass(slots=True)
+class SlotsChild(SlotsRecord):
+    seen: typing.List[str] = serializable_field(
+        default_factory=list, init=False, serialize=False
+    )
+
+    def __post_init__(self):
+        # zero-argument `super()` refers to the new slotted class
+        super().__init_subclass__()
+        self.seen.append(self.name)
+
+
+def test_slots_instances():
+    record = SlotsRecord("r", [1, 2], scale=2.0)
+    assert SlotsRecord.__slots__ == ("name", "values", "scale")
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.other = 1  # type: ignore[attr-defined]
+    # the defaults are kept, although the class attributes are replaced by slots
+    assert SlotsRecord("r").values == [] and SlotsRecord("r").scale == 1.0
+
+    serialized = record.serialize()
+    assert serialized["total"] == 6.0
+    assert SlotsRecord.load(serialized) == record
+    assert json_load(serialized) == record
+    assert SlotsRecord.load_many(SlotsRecord.serialize_many([record])) == [record]
+
+
+def test_slots_frozen_and_inherited():
+    frozen = SlotsFrozen(1, SlotsRecord("r", [1]))
+    assert SlotsFrozen.load(frozen.serialize()) == frozen
+    assert hash(frozen) == hash(SlotsFrozen(1, SlotsRecord("r", [1])))
+    with pytest.raises(AttributeError):
+        frozen.x = 2  # type: ignore[misc]
+
+    child = SlotsChild("c", [3])
+    assert child.seen == ["c"]
+    assert not hasattr(child, "__dict__")
+    assert "seen" in SlotsChild.__slots__
+    assert SlotsChild.load(child.serialize()) == child
+
+
+def test_slots_copy_and_pickle():
+    record = SlotsRecord("r", [1, 2])
+    frozen = SlotsFrozen(1, record)
+    hash(frozen)
+    for obj in (record, frozen):
+        for copied in (
+            copy.deepcopy(obj),
+            pickle.loads(pickle.dumps(obj)),
+            pickle.loads(pickle.dumps(obj, protocol=0)),
+        ):
+            assert copied == obj
+            assert not hasattr(copied, "_hash_cache")
+    assert copy.deepcopy(record).values is not record.values
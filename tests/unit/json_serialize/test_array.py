@@ -1,14 +1,43 @@
+import json
+import typing
+
 import numpy as np
 import pytest
 
-from muutils.json_serialize import JsonSerializer
+from muutils.json_serialize import (
+    JsonLoader,
+    JsonSerializer,
+    SerializableDataclass,
+    json_load,
+    json_serialize,
+    resolve_refs,
+    serializable_dataclass,
+    serializable_field,
+)
+from muutils.json_serialize import array as array_module
 from muutils.json_serialize.array import (
+    ARRAY_SUMMARY_KEYS,
+    array_content_key,
+    ArrayBlobRef,
+    ArrayBlobWriter,
     ArrayMode,
     ArrayModeWithMeta,
     arr_metadata,
+    array_from_text,
     array_n_elements,
+    array_to_text,
+    dequantize_array,
+    dump_array_chunked,
+    infer_array_mode,
     load_array,
+    load_array_rows,
+    quantize_array,
     serialize_array,
+    SerializedArrayChunked,
+    SerializedArrayCompressed,
+    SerializedArrayQuantized,
+    SerializedArraySummary,
+    SerializedArrayWithMeta,
 )
 from muutils.json_serialize.types import _FORMAT_KEY
 
@@ -127,7 +156,7 @@ class TestArray:
 
 
 @pytest.mark.parametrize(
-    "mode", ["array_list_meta", "array_hex_meta", "array_b64_meta"]
+    "mode", ["array_list_meta", "array_text_meta", "array_hex_meta", "array_b64_meta"]
 )
 def test_array_shape_dtype_preservation(mode: ArrayModeWithMeta):
     """Test that various shapes and dtypes are preserved through serialization."""
@@ -215,7 +244,7 @@ def test_array_serialization_handlers():
 
 
 @pytest.mark.parametrize(
-    "mode", ["array_list_meta", "array_hex_meta", "array_b64_meta"]
+    "mode", ["array_list_meta", "array_text_meta", "array_hex_meta", "array_b64_meta"]
 )
 def test_array_edge_cases(mode: ArrayModeWithMeta):
     """Test edge cases: empty arrays, unusual dtypes, and boundary conditions."""
@@ -258,3 +287,383 @@ def test_array_edge_cases(mode: ArrayModeWithMeta):
     assert np.isnan(loaded[2]) and np.isnan(special_arr[2])
     assert np.array_equal(loaded[:2], special_arr[:2])  # inf values
     assert np.array_equal(loaded[3:], special_arr[3:])  # zeros
+
+
+def test_array_blob_meta(tmp_path):
+    """Test writing arrays to a binary sidecar and memory-mapping them back."""
+    blob_path = tmp_path / "arrays.bin"
+    arrays: dict[str, np.ndarray] = {
+        "a": np.arange(12, dtype=np.float32).reshape(3, 4),
+        # non-contiguous, and not a multiple of the alignment
+        "b": np.arange(15, dtype=np.int16).reshape(3, 5)[:, ::2],
+        "empty": np.zeros((2, 0), dtype=np.float64),
+    }
+    with ArrayBlobWriter(blob_path, alignment=64) as blob:
+        jser = JsonSerializer(array_mode="array_blob_meta", array_blob=blob)
+        serialized = jser.json_serialize(arrays)
+    assert isinstance(serialized, dict)
+    ser_arrays = typing.cast(dict[str, SerializedArrayWithMeta], serialized)
+    ser_a = ser_arrays["a"]
+    assert ser_a[_FORMAT_KEY] == "numpy.ndarray:array_blob_meta"
+    assert ser_a["data"] == {"file": str(blob_path), "offset": 0, "nbytes": 48}
+    assert typing.cast(ArrayBlobRef, ser_arrays["b"]["data"])["offset"] == 64
+
+    for key, arr in arrays.items():
+        loaded = load_array(ser_arrays[key])
+        assert loaded.dtype == arr.dtype
+        assert loaded.shape == arr.shape
+        assert np.array_equal(loaded, arr)
+    loaded_a = load_array(ser_a)
+    assert isinstance(loaded_a, np.memmap)
+    assert not loaded_a.flags.writeable
+
+    # relative paths are resolved against `blob_dir`
+    blob_ref = typing.cast(ArrayBlobRef, ser_a["data"])
+    relative = SerializedArrayWithMeta(**ser_a)
+    relative["data"] = ArrayBlobRef(
+        file="arrays.bin", offset=blob_ref["offset"], nbytes=blob_ref["nbytes"]
+    )
+    assert np.array_equal(load_array(relative, blob_dir=tmp_path), arrays["a"])
+
+    # a blob writer is required, and object arrays can't be written
+    with pytest.raises(ValueError, match="ArrayBlobWriter"):
+        serialize_array(
+            JsonSerializer(), arrays["a"], "test", array_mode="array_blob_meta"
+        )
+    with ArrayBlobWriter(tmp_path / "objects.bin") as blob:
+        with pytest.raises(ValueError, match="object dtype"):
+            blob.write(np.array([object()]))
+
+
+def test_array_b64z_meta(monkeypatch):
+    """Test compressed array serialization, including falling back to zlib for missing codecs."""
+    arr = np.zeros((64, 32), dtype=np.float32)
+    arr[::3] = np.arange(32)
+    jser = JsonSerializer(array_mode="array_b64z_meta", array_codec_level=9)
+    serialized = typing.cast(
+        SerializedArrayCompressed, serialize_array(jser, arr, "test")
+    )
+    assert isinstance(serialized, dict)
+    assert serialized[_FORMAT_KEY] == "numpy.ndarray:array_b64z_meta"
+    assert serialized["codec"] == "zlib"
+    assert serialized["level"] == 9
+    uncompressed = serialize_array(jser, arr, "test", array_mode="array_b64_meta")
+    assert len(serialized["data"]) < len(uncompressed["data"]) / 4  # type: ignore[arg-type]
+
+    assert infer_array_mode(serialized) == "array_b64z_meta"
+    loaded = load_array(serialized)
+    assert loaded.dtype == arr.dtype
+    assert np.array_equal(loaded, arr)
+    # empty arrays, and the default level is recorded
+    empty = typing.cast(
+        SerializedArrayCompressed,
+        serialize_array(
+            JsonSerializer(array_mode="array_b64z_meta"),
+            np.zeros((3, 0), dtype=np.int8),
+            "test",
+        ),
+    )
+    assert empty["level"] == 6
+    assert load_array(empty).shape == (3, 0)
+
+    # unknown codecs are an error, codecs which aren't installed fall back to zlib
+    with pytest.raises(ValueError, match="unknown array codec"):
+        JsonSerializer(array_codec="not_a_codec")  # type: ignore[arg-type]
+
+    def raise_import_error():
+        raise ImportError("pretend this is not installed")
+
+    monkeypatch.setitem(array_module._CODEC_FACTORIES, "zstd", raise_import_error)
+    with pytest.warns(ImportWarning, match="falling back to zlib"):
+        jser_zstd = JsonSerializer(
+            array_mode="array_b64z_meta", array_codec="zstd", array_codec_level=19
+        )
+    serialized = typing.cast(
+        SerializedArrayCompressed, serialize_array(jser_zstd, arr, "test")
+    )
+    assert (serialized["codec"], serialized["level"]) == ("zlib", 6)
+    assert np.array_equal(load_array(serialized), arr)
+
+
+def test_array_text_meta():
+    """Test the bulk text format: exact round-trips, precision, and errors."""
+    rng = np.random.default_rng(0)
+    arrays: list[np.ndarray] = [
+        rng.standard_normal((7, 5)),
+        rng.standard_normal((3, 4)).astype(np.float32),
+        np.array([np.iinfo(np.uint64).max, 0], dtype=np.uint64),
+        np.array([np.iinfo(np.int64).min, -1], dtype=np.int64),
+        np.array([[True, False]]),
+    ]
+    jser = JsonSerializer(array_mode="array_text_meta")
+    for arr in arrays:
+        serialized = typing.cast(
+            SerializedArrayWithMeta, serialize_array(jser, arr, "test")
+        )
+        assert serialized[_FORMAT_KEY] == "numpy.ndarray:array_text_meta"
+        assert infer_array_mode(serialized) == "array_text_meta"
+        loaded = load_array(serialized)
+        assert loaded.dtype == arr.dtype
+        assert np.array_equal(loaded, arr)
+
+    assert array_to_text(np.array([[1, 2], [3, 4]])) == "1,2,3,4"
+    assert array_to_text(np.array([0.1, 1e300, -2.5])) == "0.1,1e+300,-2.5"
+    assert array_to_text(np.array([np.pi]), precision=3) == "3.14"
+    jser_lossy = JsonSerializer(array_mode="array_text_meta", array_text_precision=3)
+    serialized = typing.cast(
+        SerializedArrayWithMeta, serialize_array(jser_lossy, arrays[0], "test")
+    )
+    assert np.allclose(load_array(serialized), arrays[0], rtol=1e-2)
+    assert not np.array_equal(load_array(serialized), arrays[0])
+
+    # values are formatted in chunks
+    large = np.arange(array_module._TEXT_CHUNK_SIZE * 2 + 3, dtype=np.int32)
+    loaded = array_from_text(array_to_text(large), "int32", large.shape)
+    assert np.array_equal(loaded, large)
+
+    with pytest.raises(ValueError, match="bool, integer, or float"):
+        array_to_text(np.array([1 + 2j]))
+    with pytest.raises(ValueError, match="expected 4 values"):
+        array_from_text("1,2,3", "int64", [2, 2])
+
+
+def test_array_chunked_meta(tmp_path):
+    """Test chunked serialization, incremental writing, and loading slices of rows."""
+    arr = np.arange(10 * 3, dtype=np.float32).reshape(10, 3)
+    # 3 rows of 12 bytes per block
+    jser = JsonSerializer(array_mode="array_chunked_meta", array_chunk_bytes=40)
+    serialized = typing.cast(SerializedArrayChunked, serialize_array(jser, arr, "test"))
+    blocks = typing.cast("list[str]", serialized["data"])
+    assert serialized[_FORMAT_KEY] == "numpy.ndarray:array_chunked_meta"
+    assert serialized["chunk_rows"] == 3
+    assert len(blocks) == 4
+    assert infer_array_mode(serialized) == "array_chunked_meta"
+    loaded = load_array(serialized)
+    assert loaded.dtype == arr.dtype
+    assert np.array_equal(loaded, arr)
+
+    # only the needed blocks are decoded
+    blocks[0] = "not valid"
+    for rows in [slice(3, 7), slice(4, None, 2), slice(-1, 2, -3), slice(8, 100)]:
+        assert np.array_equal(load_array_rows(serialized, rows), arr[rows])
+    assert load_array_rows(serialized, slice(5, 5)).shape == (0, 3)
+    # other modes just slice the loaded array
+    as_list: list = arr.tolist()
+    assert np.array_equal(load_array_rows(as_list, slice(1, 3)), arr[1:3])
+
+    # writing incrementally gives the same json, also from a memmap
+    mmap = np.lib.format.open_memmap(
+        tmp_path / "arr.npy", mode="w+", dtype=np.int16, shape=(1000, 7)
+    )
+    mmap[:] = np.arange(7000).reshape(1000, 7)
+    for source in [arr, mmap]:
+        json_path = tmp_path / "arr.json"
+        with open(json_path, "w") as f:
+            dump_array_chunked(source, f, codec="none", chunk_bytes=100)
+        jser_none = JsonSerializer(
+            array_mode="array_chunked_meta", array_codec="none", array_chunk_bytes=100
+        )
+        expected = serialize_array(jser_none, source, "test")
+        assert json_path.read_text() == json.dumps(expected)
+        assert np.array_equal(load_array(json.loads(json_path.read_text())), source)
+
+    # empty and one-dimensional arrays
+    for edge in [np.zeros((0, 4)), np.arange(5)]:
+        edge_serialized = serialize_array(jser, edge, "test")
+        assert np.array_equal(load_array(edge_serialized), edge)
+        assert load_array(edge_serialized).shape == edge.shape
+
+
+@pytest.mark.parametrize(
+    "method, stored_dtype, max_error",
+    [
+        ("float16", "float16", 1e-3),
+        ("bfloat16", "uint16", 1e-2),
+        ("int8", "int8", 0.02),
+    ],
+)
+def test_array_quantize(method, stored_dtype, max_error):
+    """Test lossy quantized storage, restoring the original or a requested dtype."""
+    arr = np.random.default_rng(0).uniform(-1, 1, size=(20, 30))
+    jser = JsonSerializer(array_mode="array_b64_meta", array_quantize=method)
+    serialized = typing.cast(
+        SerializedArrayQuantized, serialize_array(jser, arr, "test")
+    )
+    assert serialized["dtype"] == stored_dtype
+    assert serialized["orig_dtype"] == "float64"
+    assert serialized["quantize"]["method"] == method
+    unquantized = serialize_array(
+        JsonSerializer(array_mode="array_b64_meta"), arr, "test", "array_b64_meta"
+    )
+    assert len(serialized["data"]) * 3 < len(unquantized["data"])  # type: ignore[arg-type]
+
+    loaded = load_array(json.loads(json.dumps(serialized)))
+    assert loaded.dtype == np.float64
+    assert loaded.shape == arr.shape
+    assert np.abs(loaded - arr).max() < max_error
+    assert load_array(serialized, dtype="float32").dtype == np.float32
+
+    # works in other modes, and non-float arrays are left alone
+    for mode in ["array_list_meta", "array_hex_meta", "array_b64z_meta"]:
+        jser_mode = JsonSerializer(array_mode=mode, array_quantize=method)  # type: ignore[arg-type]
+        loaded = load_array(serialize_array(jser_mode, arr, "test"))
+        assert np.abs(loaded - arr).max() < max_error
+    ints = np.arange(5)
+    serialized_ints = serialize_array(jser, ints, "test")
+    assert "quantize" not in serialized_ints
+    assert np.array_equal(load_array(serialized_ints), ints)
+
+
+def test_quantize_array_edge_cases():
+    """Test quantization of special values, constant arrays, and invalid input."""
+    special = np.array([np.nan, np.inf, -np.inf, 0.0, 1.5], dtype=np.float32)
+    for method in ["float16", "bfloat16"]:
+        restored = dequantize_array(*quantize_array(special, method))  # type: ignore[arg-type]
+        np.testing.assert_array_equal(restored, special)
+
+    quantized, params = quantize_array(special, "int8")
+    restored = dequantize_array(quantized, params)
+    assert restored[1] == pytest.approx(1.5, abs=0.01)
+    assert restored[2] == pytest.approx(0.0, abs=0.01)
+
+    constant = np.full(4, 1000.0)
+    assert np.array_equal(dequantize_array(*quantize_array(constant, "int8")), constant)
+    empty_q, empty_params = quantize_array(np.zeros((0, 3)), "int8")
+    assert dequantize_array(empty_q, empty_params).shape == (0, 3)
+
+    with pytest.raises(ValueError, match="float arrays"):
+        quantize_array(np.arange(3), "int8")
+    with pytest.raises(ValueError, match="invalid array_quantize"):
+        JsonSerializer(array_quantize="int4")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="not supported"):
+        serialize_array(
+            JsonSerializer(array_mode="array_chunked_meta", array_quantize="int8"),
+            special,
+            "test",
+        )
+
+
+def test_array_summary_meta():
+    """Test that summary mode stores statistics from array_info instead of the data."""
+    arr = np.arange(100, dtype=np.float32).reshape(10, 10)
+    arr[0, 0] = np.nan
+    jser = JsonSerializer(array_mode="array_summary_meta")
+    serialized = jser.json_serialize({"arr": arr})
+    assert isinstance(serialized, dict)
+    summary_item = serialized["arr"]
+    assert isinstance(summary_item, dict)
+    assert summary_item[_FORMAT_KEY] == "numpy.ndarray:array_summary_meta"
+    assert summary_item["shape"] == [10, 10]
+    assert "data" not in summary_item
+    summary = summary_item["summary"]
+    assert isinstance(summary, dict)
+    assert set(summary) == set(ARRAY_SUMMARY_KEYS)
+    assert summary["status"] == "ok"
+    assert summary["nan_count"] == 1
+    assert (summary["min"], summary["max"]) == (1.0, 99.0)
+    assert summary["mean"] == pytest.approx(50.0)
+    assert sum(summary["histogram"]) == 99  # type: ignore[arg-type]
+    # all values are plain json
+    assert json.loads(json.dumps(serialized)) == serialized
+
+    # typed for the array modes with data, but any serialized array is accepted
+    summary_as_meta = typing.cast(SerializedArrayWithMeta, summary_item)
+    assert infer_array_mode(summary_as_meta) == "array_summary_meta"
+    with pytest.raises(ValueError, match="only store statistics"):
+        load_array(summary_as_meta)
+    assert json_load(serialized) == serialized
+
+    empty = typing.cast(
+        SerializedArraySummary, serialize_array(jser, np.zeros((0, 2)), "test")
+    )
+    assert empty["summary"]["status"] == "empty array"
+
+
+@pytest.mark.parametrize("array_mode", ["array_list_meta", "array_b64_meta"])
+def test_array_dedup(array_mode):
+    """Test that arrays with the same contents are written once, and loaded as one shared array."""
+    mask = np.arange(12, dtype=np.float32).reshape(3, 4)
+    obj = {
+        "first": mask,
+        "records": [{"mask": mask.copy()}, {"mask": mask}, {"mask": mask.T}],
+        "other_dtype": mask.astype(np.float64),
+        "scalar": np.array(1.0),
+    }
+    jser = JsonSerializer(array_mode=array_mode, array_dedup=True)
+    serialized = jser.json_serialize(obj)
+    assert isinstance(serialized, dict)
+    records = serialized["records"]
+    assert isinstance(records, list)
+    assert records[0] == {"mask": {"$ref": "#/first"}}
+    assert records[1] == {"mask": {"$ref": "#/first"}}
+    # same bytes, but different shapes or dtypes are not the same array
+    assert _FORMAT_KEY in records[2]["mask"]  # type: ignore[index, operator]
+    assert _FORMAT_KEY in serialized["other_dtype"]  # type: ignore[operator]
+    assert "".join(jser.iter_encode(obj)) == json.dumps(serialized)
+
+    loaded = JsonLoader(resolve_refs=True).load(json.loads(json.dumps(serialized)))
+    assert loaded["records"][0]["mask"] is loaded["first"]
+    assert loaded["records"][1]["mask"] is loaded["first"]
+    assert not loaded["first"].flags.writeable
+    assert np.array_equal(loaded["first"], mask)
+    assert np.array_equal(loaded["records"][2]["mask"], mask.T)
+
+    # without dedup, every array is written in full
+    plain = JsonSerializer(array_mode=array_mode).json_serialize(obj)
+    assert _FORMAT_KEY in plain["records"][0]["mask"]  # type: ignore[call-overload, index, operator]
+    with pytest.raises(ValueError):
+        JsonSerializer(array_dedup=True, memo_size=4)
+    with pytest.raises(ValueError, match="array_dedup"):
+        jser.json_serialize_many([mask, mask])
+
+
+@serializable_dataclass
+class DedupMaskRecord(SerializableDataclass):
+    name: str
+    mask: np.ndarray = serializable_field(serialization_fn=lambda x: json_serialize(x))
+
+
+@serializable_dataclass
+class DedupMaskText(SerializableDataclass):
+    mask: np.ndarray = serializable_field(
+        serialization_fn=lambda x: json.dumps(json_serialize(x))
+    )
+
+
+def test_array_dedup_nested_calls():
+    """Test that arrays serialized by nested json_serialize calls, as in serializable dataclasses, are deduplicated."""
+    mask = np.arange(6, dtype=np.float32).reshape(2, 3)
+    records = [
+        DedupMaskRecord("a", mask),
+        DedupMaskRecord("b", mask.copy()),
+        {"c": DedupMaskRecord("c", mask)},
+    ]
+    jser = JsonSerializer(array_mode="array_list_meta", array_dedup=True)
+    serialized = jser.json_serialize(records)
+    assert isinstance(serialized, list)
+    assert _FORMAT_KEY in serialized[0]["mask"]  # type: ignore[index, operator]
+    assert serialized[1]["mask"] == {"$ref": "#/0/mask"}  # type: ignore[index, call-overload]
+    assert serialized[2]["c"]["mask"] == {"$ref": "#/0/mask"}  # type: ignore[index, call-overload]
+    assert "".join(jser.iter_encode(records)) == json.dumps(serialized)
+    assert resolve_refs(serialized)[1]["mask"] == serialized[0]["mask"]  # type: ignore[index, call-overload]
+
+    # the settings of the outer serializer apply, so a plain serializer writes every array
+    plain = JsonSerializer(array_mode="array_list_meta").json_serialize(records)
+    assert _FORMAT_KEY in plain[1]["mask"]  # type: ignore[index, operator]
+
+    # an array written inside a string can't be referred to
+    serialized = jser.json_serialize([DedupMaskText(mask), {"m": mask}])
+    assert isinstance(serialized[0]["mask"], str)  # type: ignore[index, call-overload]
+    assert _FORMAT_KEY in serialized[1]["m"]  # type: ignore[index, operator]
+
+
+def test_array_content_key():
+    """Test that the content key depends on the type, dtype, shape, and bytes."""
+    arr = np.arange(6, dtype=np.int32)
+    key, data = array_content_key(arr)
+    assert key == array_content_key(arr.copy())[0]
+    assert data.dtype == np.uint8 and data.nbytes == arr.nbytes
+    assert key != array_content_key(arr.reshape(2, 3))[0]
+    assert key != array_content_key(arr.astype(np.uint32))[0]
+    arr[0] = 100
+    assert key != array_content_key(arr)[0]
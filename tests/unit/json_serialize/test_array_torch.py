@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import typing
+
 import numpy as np
 import pytest
 import torch
 
-from muutils.json_serialize import JsonSerializer
+from muutils.json_serialize import JsonSerializer, json_load
 from muutils.json_serialize.array import (
     ArrayModeWithMeta,
     arr_metadata,
     array_n_elements,
+    array_to_numpy,
     load_array,
     serialize_array,
+    SerializedArrayWithMeta,
 )
 from muutils.json_serialize.types import _FORMAT_KEY  # pyright: ignore[reportPrivateUsage]
 
@@ -252,3 +256,65 @@ def test_mixed_numpy_torch():
     torch_format = serialized["torch_tensor"][_FORMAT_KEY]  # ty: ignore[invalid-argument-type]
     assert isinstance(torch_format, str)
     assert "torch" in torch_format
+
+
+def test_array_to_numpy_views():
+    """Test that CPU tensors are viewed rather than copied, including ones needing grad or non-contiguous."""
+    tensor = torch.arange(12, dtype=torch.float32).reshape(3, 4)
+    arr, dtype_tag = array_to_numpy(tensor)
+    assert dtype_tag is None
+    assert np.shares_memory(arr, tensor.numpy())
+
+    grad_tensor = torch.ones(3, requires_grad=True)
+    arr, _ = array_to_numpy(grad_tensor)
+    assert np.array_equal(arr, np.ones(3, dtype=np.float32))
+
+    transposed = tensor.T
+    arr, _ = array_to_numpy(transposed)
+    assert np.shares_memory(arr, tensor.numpy())
+    assert np.array_equal(arr, tensor.numpy().T)
+
+    conj = torch.tensor([1 + 2j]).conj()
+    arr, _ = array_to_numpy(conj)
+    assert arr[0] == 1 - 2j
+
+    # numpy arrays are returned as-is
+    np_arr = np.zeros(3)
+    assert array_to_numpy(np_arr)[0] is np_arr
+
+
+_BFLOAT16_ARRAY_MODES: list[ArrayModeWithMeta] = [
+    "array_list_meta",
+    "array_text_meta",
+    "array_hex_meta",
+    "array_b64_meta",
+    "array_b64z_meta",
+    "array_chunked_meta",
+]
+
+
+@pytest.mark.parametrize("mode", _BFLOAT16_ARRAY_MODES)
+def test_torch_bfloat16(mode: ArrayModeWithMeta):
+    """Test that dtypes numpy lacks round-trip through the dtype tag."""
+    tensor = torch.randn(4, 5).to(torch.bfloat16)
+    serialized = JsonSerializer(array_mode=mode).json_serialize(
+        {"t": tensor, "t0": tensor[0, 0]}
+    )
+    assert isinstance(serialized, dict)
+    assert isinstance(serialized["t"], dict)
+    ser_t = typing.cast(SerializedArrayWithMeta, serialized["t"])
+    assert ser_t.get("dtype_tag") == "torch.bfloat16"
+    # raw bytes for byte modes, values for value modes
+    if mode in ("array_list_meta", "array_text_meta"):
+        assert ser_t["dtype"] == "float32"
+        assert np.array_equal(load_array(ser_t), tensor.float().numpy())
+    else:
+        assert ser_t["dtype"] == "uint16"
+        raw = tensor.view(torch.int16).numpy().view(np.uint16)
+        assert np.array_equal(load_array(ser_t), raw)
+
+    loaded = json_load(serialized)
+    assert loaded["t"].dtype == torch.bfloat16
+    assert torch.equal(loaded["t"], tensor)
+    assert loaded["t0"].dtype == torch.bfloat16
+    assert loaded["t0"] == tensor[0, 0]
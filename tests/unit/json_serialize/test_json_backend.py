@@ -0,0 +1,121 @@
+"""Tests for muutils.json_serialize.json_backend module."""
+
+from __future__ import annotations
+
+import json
+import warnings
+
+import numpy as np
+import pytest
+
+from muutils.json_serialize import json_backend
+from muutils.json_serialize.array import load_array
+from muutils.json_serialize.json_backend import (
+    JsonBackend,
+    get_json_backend,
+    json_dumps,
+    json_loads,
+    set_json_backend,
+)
+from muutils.json_serialize.json_serialize import JsonSerializer
+
+
+@pytest.fixture
+def restore_backend():
+    """restore the globally selected backend after the test"""
+    original: JsonBackend = get_json_backend()
+    yield
+    json_backend._CURRENT_BACKEND = original
+
+
+def test_stdlib_backend_matches_json():
+    """Test that the stdlib backend is identical to the json module."""
+    backend: JsonBackend = get_json_backend("stdlib")
+    data = {"a": [1, 2.5, None, True], "b": {"c": "text"}, "nan": float("nan")}
+    assert backend.dumps(data) == json.dumps(data)
+    assert backend.loads(json.dumps(data))["a"] == data["a"]
+    assert backend.native_numpy is False
+
+
+def test_invalid_backend():
+    """Test that unknown backend names raise."""
+    with pytest.raises(ValueError, match="unknown json backend"):
+        get_json_backend("not_a_backend")  # type: ignore[arg-type]
+
+
+def test_missing_backend_falls_back(monkeypatch):
+    """Test that a backend which can't be imported falls back to stdlib with a warning."""
+
+    def raise_import_error() -> JsonBackend:
+        raise ImportError("pretend this is not installed")
+
+    monkeypatch.setitem(json_backend._BACKEND_FACTORIES, "msgspec", raise_import_error)
+    monkeypatch.delitem(json_backend._BACKENDS, "msgspec", raising=False)
+
+    with pytest.warns(ImportWarning, match="falling back to stdlib"):
+        backend: JsonBackend = get_json_backend("msgspec")
+    assert backend.name == "stdlib"
+
+
+def test_set_json_backend(restore_backend):
+    """Test that set_json_backend changes json_dumps and json_loads."""
+    set_json_backend("stdlib")
+    assert json_dumps({"a": 1}) == '{"a": 1}'
+    assert json_loads('{"a": 1}') == {"a": 1}
+
+    backend: JsonBackend = set_json_backend("auto")
+    assert get_json_backend() is backend
+    assert json_loads(json_dumps({"a": [1, 2]})) == {"a": [1, 2]}
+
+
+def test_orjson_backend():
+    """Test the orjson backend, including fallbacks for things orjson can't encode."""
+    pytest.importorskip("orjson")
+    backend: JsonBackend = get_json_backend("orjson")
+    assert backend.name == "orjson"
+    assert backend.native_numpy is True
+
+    data = {"a": [1, 2.5, None, True], "b": {"c": "text"}}
+    assert backend.dumps(data) == '{"a":[1,2.5,null,true],"b":{"c":"text"}}'
+    assert backend.loads(backend.dumps(data)) == data
+    # ints wider than 64 bits fall back to stdlib
+    assert json.loads(backend.dumps({"big": 2**70})) == {"big": 2**70}
+    # numpy arrays, including ones orjson can't handle directly
+    assert backend.dumps(np.arange(3)) == "[0,1,2]"
+    assert json.loads(backend.dumps(np.arange(6).reshape(2, 3).T)) == [
+        [0, 3],
+        [1, 4],
+        [2, 5],
+    ]
+
+
+@pytest.mark.parametrize("array_mode", ["array_list_meta", "list"])
+def test_JsonSerializer_dumps_native_arrays(array_mode):
+    """Test that JsonSerializer.dumps output is the same with and without native array encoding."""
+    pytest.importorskip("orjson")
+    arr = np.arange(12, dtype=np.float64).reshape(3, 4) / 7
+    obj = {"arr": arr, "nested": [arr[0], {"x": 1}]}
+
+    jser_stdlib = JsonSerializer(array_mode=array_mode, json_backend="stdlib")
+    jser_orjson = JsonSerializer(array_mode=array_mode, json_backend="orjson")
+
+    from_stdlib = json.loads(jser_stdlib.dumps(obj))
+    from_orjson = json.loads(jser_orjson.dumps(obj))
+    assert from_stdlib == from_orjson
+    assert np.array_equal(load_array(from_orjson["arr"]), arr)
+
+    # native array mode is only active during `dumps`
+    serialized = jser_orjson.json_serialize(obj)
+    assert isinstance(serialized, dict)
+    assert isinstance(serialized["arr"], (dict, list))
+    if array_mode == "array_list_meta":
+        assert isinstance(serialized["arr"], dict)
+        assert isinstance(serialized["arr"]["data"], list)
+
+
+def test_JsonSerializer_dumps_default_backend(restore_backend):
+    """Test that JsonSerializer.dumps uses the global backend when none is given."""
+    set_json_backend("stdlib")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert JsonSerializer().dumps({"a": (1, 2)}) == '{"a": [1, 2]}'
@@ -0,0 +1,176 @@
+"""Tests for muutils.json_serialize.json_load module."""
+
+from __future__ import annotations
+
+import json
+import warnings
+
+import numpy as np
+import pytest
+
+from muutils.errormode import ErrorMode
+from muutils.json_serialize import (
+    JsonSerializer,
+    SerializableDataclass,
+    serializable_dataclass,
+    serializable_field,
+)
+from muutils.json_serialize.json_load import (
+    JsonLoader,
+    LazyLoadedDict,
+    LazyLoadedList,
+    LoaderHandler,
+    format_key,
+    json_load,
+)
+from muutils.json_serialize.types import _FORMAT_KEY
+from muutils.json_serialize.util import JSONdict, SerializationException
+
+
+@serializable_dataclass
+class LoadTestRecord(SerializableDataclass):
+    name: str
+    tags: list = serializable_field(default_factory=list)
+
+
+def roundtrip(obj, **kwargs):
+    """serialize with `JsonSerializer`, through json text, and load again"""
+    serialized = JsonSerializer(**kwargs).json_serialize(obj)
+    return json_load(json.loads(json.dumps(serialized)))
+
+
+def test_format_key():
+    """Test the keys handlers are registered under."""
+    assert format_key("set") == "set"
+    assert format_key("numpy.ndarray:array_list_meta") == "numpy.ndarray"
+    assert format_key("torch.Tensor:zero_dim") == "torch.Tensor"
+    assert format_key("MyClass(SerializableDataclass)") == "(SerializableDataclass)"
+
+
+def test_load_plain_and_sets():
+    """Test loading plain json, sets, and frozensets."""
+    assert json_load({"a": [1, 2.5, None, "x", True]}) == {
+        "a": [1, 2.5, None, "x", True]
+    }
+    loaded = roundtrip({"s": {1, 2}, "f": frozenset(["x"]), "nested": [{(1, 2)}]})
+    assert loaded == {"s": {1, 2}, "f": frozenset(["x"]), "nested": [{(1, 2)}]}
+    assert isinstance(loaded["f"], frozenset)
+    # unknown formats are left as plain dicts
+    assert json_load({_FORMAT_KEY: "unknown", "x": [1]}) == {
+        _FORMAT_KEY: "unknown",
+        "x": [1],
+    }
+
+
+@pytest.mark.parametrize(
+    "array_mode",
+    [
+        "array_list_meta",
+        "array_text_meta",
+        "array_hex_meta",
+        "array_b64_meta",
+        "array_b64z_meta",
+        "array_chunked_meta",
+    ],
+)
+def test_load_arrays(array_mode):
+    """Test loading numpy arrays and torch tensors in each array mode."""
+    torch = pytest.importorskip("torch")
+    arr = np.arange(6, dtype=np.float32).reshape(2, 3)
+    loaded = roundtrip(
+        {"np": arr, "t": torch.tensor(arr), "t0": torch.tensor(1.5)},
+        array_mode=array_mode,
+    )
+    assert isinstance(loaded["np"], np.ndarray)
+    assert np.array_equal(loaded["np"], arr)
+    assert loaded["np"].dtype == np.float32
+    assert isinstance(loaded["t"], torch.Tensor)
+    assert torch.equal(loaded["t"], torch.tensor(arr))
+    assert loaded["t0"].dtype == torch.float32
+    assert loaded["t0"].item() == 1.5
+
+
+def test_load_pandas_and_dataclass():
+    """Test loading pandas DataFrames and serializable dataclasses."""
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    record = LoadTestRecord("r", ["t1", "t2"])
+    loaded = roundtrip({"df": df, "rec": record, "recs": [record]})
+    assert loaded["df"].equals(df)
+    assert loaded["rec"] == record
+    assert loaded["recs"] == [record]
+
+
+def test_custom_handler_and_errors():
+    """Test registering handlers, which take priority, and error modes."""
+    point_handler = LoaderHandler(
+        key="Point",
+        load_func=lambda loader, item, path: (item["x"], item["y"]),
+        uid="point",
+        desc="points as tuples",
+    )
+    loader = JsonLoader(handlers_pre=(point_handler,))
+    assert loader.load([{_FORMAT_KEY: "Point:v1", "x": 1, "y": 2}]) == [(1, 2)]
+
+    override = LoaderHandler(
+        key="set",
+        load_func=lambda loader, item, path: sorted(item["data"]),
+        uid="set as sorted list",
+        desc="",
+    )
+    assert JsonLoader(handlers_pre=(override,)).load(
+        {_FORMAT_KEY: "set", "data": [3, 1]}
+    ) == [1, 3]
+
+    bad: JSONdict = {
+        "x": {_FORMAT_KEY: "NotARegisteredClass(SerializableDataclass)", "a": 1}
+    }
+    with pytest.raises(SerializationException, match=r"path = \('x',\)"):
+        JsonLoader().load(bad)
+    with pytest.warns(UserWarning, match="will load as plain dict"):
+        assert JsonLoader(error_mode=ErrorMode.WARN).load(bad) == bad
+
+
+def test_lazy_loading(monkeypatch):
+    """Test that lazy loading only reconstructs what is accessed."""
+    calls: list = []
+
+    def counting_load(loader, item, path):
+        calls.append(tuple(path))
+        return np.array(item["data"])
+
+    handler = LoaderHandler(
+        key="numpy.ndarray", load_func=counting_load, uid="counting", desc=""
+    )
+    serialized = JsonSerializer().json_serialize(
+        {"arrays": [np.zeros(3), np.ones(3)], "other": {"arr": np.arange(3)}}
+    )
+    loader = JsonLoader(handlers_pre=(handler,), lazy=True)
+    loaded = loader.load(serialized)
+    assert isinstance(loaded, LazyLoadedDict)
+    assert calls == []
+
+    arrays = loaded["arrays"]
+    assert isinstance(arrays, LazyLoadedList)
+    assert len(arrays) == 2
+    assert np.array_equal(arrays[-1], np.ones(3))
+    assert calls == [("arrays", 1)]
+    # loaded items are cached
+    assert arrays[1] is arrays[1]
+    assert calls == [("arrays", 1)]
+
+    assert set(loaded) == {"arrays", "other"}
+    assert "other" in loaded
+    with pytest.raises(IndexError):
+        arrays[2]
+    assert len(arrays[:]) == 2
+    assert calls == [("arrays", 1), ("arrays", 0)]
+    # compared by value, like a list
+    with pytest.raises(TypeError):
+        hash(arrays)
+
+    # lazy views compare equal to the eager result
+    eager = JsonLoader(handlers_pre=(handler,)).load({"a": [1, {"b": [2]}]})
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert loader.load({"a": [1, {"b": [2]}]}) == eager
@@ -6,6 +6,8 @@ and utility function tests are in test_util.py. We focus on JsonSerializer class
 
 from __future__ import annotations
 
+import json
+import sys
 import warnings
 from collections import namedtuple
 from dataclasses import dataclass
@@ -23,7 +25,7 @@ from muutils.json_serialize.json_serialize import (
     json_serialize,
 )
 from muutils.json_serialize.types import _FORMAT_KEY
-from muutils.json_serialize.util import SerializationException
+from muutils.json_serialize.util import SerializationException, resolve_refs
 
 
 # ============================================================================
@@ -67,6 +69,14 @@ class UnserializableClass:
         self.data = "test"
 
 
+def _is_int_check(self, obj, path):
+    return type(obj) is int
+
+
+def _int_to_str(self, obj, path):
+    return str(obj)
+
+
 # ============================================================================
 # Tests for basic type serialization
 # ============================================================================
@@ -306,6 +316,70 @@ def test_fallback_handler():
     assert "repr" in result
 
 
+def test_fallback_handler_light():
+    """Test that the light fallback mode only writes the type and repr."""
+    obj = UnserializableClass()
+    result = JsonSerializer(fallback_mode="light").json_serialize(obj)
+    assert result == {"type": "UnserializableClass", "repr": repr(obj)}
+
+    with pytest.raises(ValueError, match="fallback_mode"):
+        JsonSerializer(fallback_mode="nope")  # type: ignore[arg-type]
+
+
+def test_fallback_source_lookup_cached(monkeypatch):
+    """Test that source lookups in the fallback handler are cached per type, and per class or function."""
+    import inspect
+
+    calls: list = []
+    original_getsource = inspect.getsource
+
+    def counting_getsource(x):
+        calls.append(x)
+        return original_getsource(x)
+
+    monkeypatch.setattr(inspect, "getsource", counting_getsource)
+
+    class Opaque:
+        pass
+
+    serializer = JsonSerializer()
+    first = serializer.json_serialize(Opaque())
+    second = serializer.json_serialize(Opaque())
+    assert isinstance(first, dict) and isinstance(second, dict)
+    assert len(calls) == 1
+    assert first["code"] == second["code"]
+    assert isinstance(first["code"], str) and first["code"].startswith("TypeError")
+
+    # the class itself has source, separately from its instances
+    class_result = serializer.json_serialize(Opaque)
+    serializer.json_serialize(Opaque)
+    assert isinstance(class_result, dict) and isinstance(class_result["code"], str)
+    assert len(calls) == 2
+    assert "class Opaque" in class_result["code"]
+
+
+def test_fallback_source_lookup_wrapped():
+    """Test that objects with `__wrapped__`, whose source `inspect` finds by unwrapping, each get their own source."""
+    import functools
+
+    @functools.lru_cache
+    def wrapped_foo(x: int) -> int:
+        return x
+
+    @functools.lru_cache
+    def wrapped_bar(x: int) -> int:
+        return x + 1
+
+    serializer = JsonSerializer()
+    for _ in range(2):
+        foo = serializer.json_serialize(wrapped_foo)
+        bar = serializer.json_serialize(wrapped_bar)
+        assert isinstance(foo, dict) and isinstance(bar, dict)
+        assert isinstance(foo["code"], str) and isinstance(bar["code"], str)
+        assert "def wrapped_foo" in foo["code"]
+        assert "def wrapped_bar" in bar["code"]
+
+
 # ============================================================================
 # Tests for nested structures
 # ============================================================================
@@ -628,6 +702,247 @@ def test_path_tracking():
     assert ("a", "b", 1) in paths_seen  # second element
 
 
+# ============================================================================
+# Tests for the per-type dispatch cache
+# ============================================================================
+
+
+def test_dispatch_cache_checks_once_per_type():
+    """Test that handlers with cache_by_type=True have check called once per type."""
+    n_checks: dict[str, int] = {"cached": 0}
+
+    def counting_check(self, obj, path):
+        n_checks["cached"] += 1
+        return isinstance(obj, int)
+
+    cached_handler = SerializerHandler(
+        check=counting_check,
+        serialize_func=lambda self, obj, path: obj * 10,
+        uid="cached_int",
+        desc="times ten, cached by type",
+        cache_by_type=True,
+    )
+
+    # disable the native fast path, which would also dispatch on sample values
+    serializer = JsonSerializer(handlers_pre=(cached_handler,), native_fast_path=None)
+    assert serializer.json_serialize([1, 2, 3, 4]) == [10, 20, 30, 40]
+    # once for the list (which does not match), once for int
+    assert n_checks["cached"] == 2
+
+    assert serializer.json_serialize({"a": 5}) == {"a": 50}
+    # only the dict type is new
+    assert n_checks["cached"] == 3
+
+
+def test_dispatch_cache_value_dependent_handler():
+    """Test that handlers with cache_by_type=False are checked for every object."""
+    n_checks: dict[str, int] = {"value": 0}
+
+    def value_check(self, obj, path):
+        n_checks["value"] += 1
+        return isinstance(obj, str) and obj.startswith("X")
+
+    value_handler = SerializerHandler(
+        check=value_check,
+        serialize_func=lambda self, obj, path: obj.lower(),
+        uid="value_dependent",
+        desc="lowercase strings starting with X",
+    )
+
+    serializer = JsonSerializer(handlers_pre=(value_handler,))
+    assert serializer.json_serialize(["Xa", "b", "XC", "d"]) == ["xa", "b", "xc", "d"]
+    # checked for the list and each of the 4 elements
+    assert n_checks["value"] == 5
+
+
+def test_dispatch_cache_reset_on_handlers_change():
+    """Test that setting `handlers` resets the dispatch cache."""
+    serializer = JsonSerializer()
+    assert serializer.json_serialize(1) == 1
+
+    serializer.handlers = (
+        SerializerHandler(
+            check=lambda self, obj, path: True,
+            serialize_func=lambda self, obj, path: "replaced",
+            uid="replace_all",
+            desc="replace everything",
+            cache_by_type=True,
+        ),
+    )
+    assert serializer.json_serialize(1) == "replaced"
+
+
+def test_dispatch_cache_dataclass_class():
+    """Test that serializing a dataclass class does not cache the dataclass handler for `type`."""
+
+    @dataclass
+    class Point:
+        x: int
+        y: int
+
+    serializer = JsonSerializer()
+    cls_serialized = serializer.json_serialize(Point)
+    assert isinstance(cls_serialized, dict)
+    assert cls_serialized["type"] == "type"
+    # other classes share the type `type`, and must not be sent to the dataclass handler
+    int_serialized = serializer.json_serialize(int)
+    assert isinstance(int_serialized, dict)
+    assert int_serialized["str"] == "<class 'int'>"
+    # instances are still serialized as dataclasses
+    assert serializer.json_serialize(Point(1, 2)) == {"x": 1, "y": 2}
+
+
+# ============================================================================
+# Tests for the native json fast path
+# ============================================================================
+
+
+def test_native_fast_path_modes():
+    """Test that plain json containers are copied or referenced according to native_fast_path."""
+    flat_dict: dict = {"a": 1, "b": 2.5, "c": "s", "d": None, "e": True}
+    flat_list: list = [1, 2.5, "s", None, False]
+    obj: dict = {"d": flat_dict, "l": flat_list, "t": (1, 2)}
+
+    for mode in ("copy", "reference", None):
+        result = JsonSerializer(native_fast_path=mode).json_serialize(obj)
+        assert result == {"d": flat_dict, "l": flat_list, "t": [1, 2]}
+        assert isinstance(result, dict)
+        if mode == "reference":
+            assert result["d"] is flat_dict
+            assert result["l"] is flat_list
+        else:
+            assert result["d"] is not flat_dict
+            assert result["l"] is not flat_list
+
+    with pytest.raises(ValueError):
+        JsonSerializer(native_fast_path="invalid")  # type: ignore[arg-type]
+
+
+def test_native_fast_path_not_applied():
+    """Test that the fast path falls back to the handlers when the container is not plain json."""
+    serializer = JsonSerializer(native_fast_path="reference")
+
+    # non-str keys get converted
+    int_keys: dict = {1: "a"}
+    assert serializer.json_serialize(int_keys) == {"1": "a"}
+    # nested containers and non-json values go through the handlers
+    nested: list = [1, [2]]
+    assert serializer.json_serialize(nested) is not nested
+    assert serializer.json_serialize([Path("a")]) == ["a"]
+
+    # handlers which override base types disable the fast path for those types
+    upper_handler = SerializerHandler(
+        check=lambda self, obj, path: isinstance(obj, str),
+        serialize_func=lambda self, obj, path: obj.upper(),
+        uid="upper",
+        desc="uppercase strings",
+    )
+    serializer_upper = JsonSerializer(
+        handlers_pre=(upper_handler,), native_fast_path="reference"
+    )
+    assert serializer_upper.json_serialize({"a": "x", "b": 1}) == {"a": "X", "b": 1}
+    assert serializer_upper.json_serialize([1, 2]) == [1, 2]
+
+    # _FORMAT_KEY still gets renamed with write_only_format
+    serializer_wof = JsonSerializer(
+        write_only_format=True, native_fast_path="reference"
+    )
+    assert serializer_wof.json_serialize({_FORMAT_KEY: "f", "x": 1}) == {
+        "x": 1,
+        "__write_format__": "f",
+    }
+
+
+# ============================================================================
+# Tests for streaming encoding
+# ============================================================================
+
+
+def test_iter_encode_matches_json_dumps():
+    """Test that iter_encode produces the same text as json.dumps(json_serialize(...))."""
+    Point = namedtuple("Point", ["x", "y"])
+    obj = {
+        "a": [1, 2.5, None, True, "str"],
+        "nested": {"b": (1, 2), 3: "int key"},
+        "set": {1},
+        "frozenset": frozenset(),
+        "point": Point(1, [2]),
+        "dataclass": SimpleDataclass(x=1, y="q"),
+        "path": Path("a/b"),
+        "custom": ClassWithSerialize(3),
+        "empty": [[], {}],
+    }
+
+    for write_only_format in (False, True):
+        serializer = JsonSerializer(write_only_format=write_only_format)
+        expected: str = json.dumps(serializer.json_serialize(obj))
+        for chunk_size in (1, 16, 1 << 20):
+            chunks: list[str] = list(serializer.iter_encode(obj, chunk_size=chunk_size))
+            assert "".join(chunks) == expected
+        assert len(list(serializer.iter_encode(obj, chunk_size=1))) > 1
+
+    # primitives at the root
+    assert "".join(JsonSerializer().iter_encode("x")) == '"x"'
+
+
+def test_iter_encode_write_only_format():
+    """Test that _FORMAT_KEY is moved to the end as __write_format__ when streaming."""
+    serializer = JsonSerializer(write_only_format=True)
+    obj = {"x": {_FORMAT_KEY: "fmt", "data": [1]}, "s": {2}}
+    result: str = "".join(serializer.iter_encode(obj))
+    assert result == json.dumps(serializer.json_serialize(obj))
+    assert json.loads(result) == {
+        "x": {"data": [1], "__write_format__": "fmt"},
+        "s": {"data": [2], "__write_format__": "set"},
+    }
+
+
+def test_iter_encode_colliding_keys():
+    """Test that keys equal after str() are written once, like json.dumps(json_serialize(...))."""
+    serializer = JsonSerializer()
+    for obj in (
+        {1: "a", "1": "b"},
+        {"1": "b", 1: "a", "x": [1]},
+        {"outer": {1: "a", 2: "c", "1": "b"}},
+        [{True: 1, "True": 2}],
+    ):
+        expected: str = json.dumps(serializer.json_serialize(obj))
+        assert "".join(serializer.iter_encode(obj)) == expected
+
+    assert "".join(serializer.iter_encode({1: "a", "1": "b"})) == '{"1": "b"}'
+
+
+def test_dump_to_file(tmp_path: Path):
+    """Test that dump writes the encoded json to a file."""
+    obj = {"a": [{"b": i} for i in range(100)], "c": "text"}
+    fname: Path = tmp_path / "out.json"
+    with open(fname, "w") as fp:
+        JsonSerializer().dump(obj, fp, chunk_size=64)
+
+    assert json.loads(fname.read_text()) == obj
+
+
+def test_iter_encode_errors():
+    """Test error handling when streaming."""
+
+    def bad_gen():
+        yield 1
+        raise RuntimeError("generator broke")
+
+    # failure partway through a container can't be recovered, even with error_mode ignore
+    with pytest.raises(SerializationException, match="already streamed"):
+        "".join(JsonSerializer(error_mode=ErrorMode.IGNORE).iter_encode([bad_gen()]))
+
+    # circular references are detected
+    circular: dict = {"a": 1}
+    circular["self"] = circular
+    with pytest.raises(SerializationException, match="circular reference"):
+        "".join(JsonSerializer().iter_encode(circular))
+    assert json.loads(
+        "".join(JsonSerializer(error_mode=ErrorMode.IGNORE).iter_encode(circular))
+    ) == {"a": 1, "self": repr(circular)}
+
+
 # ============================================================================
 # Tests for initialization
 # ============================================================================
@@ -691,24 +1006,357 @@ def test_empty_handlers():
         serializer.json_serialize(42)
 
 
-# TODO: Implement circular reference protection in the future. see https://github.com/mivanit/muutils/issues/62
-@pytest.mark.skip(
-    reason="we don't currently have circular reference protection, see https://github.com/mivanit/muutils/issues/62"
-)
 def test_circular_reference_protection():
-    """Test that circular references don't cause infinite loops (will hit recursion limit)."""
-    # Note: This test verifies the expected behavior (recursion error) rather than
-    # infinite loop, as the module doesn't explicitly handle circular references
+    """Test that circular references are detected instead of looping forever."""
     serializer = JsonSerializer()
 
     # Create circular reference
     circular = {"a": None}
     circular["a"] = circular  # type: ignore
 
-    # Should eventually raise RecursionError
-    with pytest.raises(RecursionError):
+    with pytest.raises(SerializationException, match="circular reference"):
         serializer.json_serialize(circular)
 
+    # with error_mode ignore, the repeated object is replaced by its repr
+    serializer_ignore = JsonSerializer(error_mode=ErrorMode.IGNORE)
+    assert serializer_ignore.json_serialize(circular) == {"a": repr(circular)}
+
+    # the same object appearing twice without a cycle is fine
+    shared = [1, 2]
+    assert serializer.json_serialize({"x": shared, "y": shared}) == {
+        "x": [1, 2],
+        "y": [1, 2],
+    }
+
+
+def test_very_deep_nesting():
+    """Test that nesting deeper than the recursion limit can be serialized."""
+    serializer = JsonSerializer()
+    depth: int = sys.getrecursionlimit() * 5
+
+    deep: list = []
+    current: list = deep
+    for _ in range(depth):
+        nxt: list = []
+        current.append(nxt)
+        current = nxt
+    current.append({"leaf": (1, 2)})
+
+    result = serializer.json_serialize(deep)
+    for _ in range(depth):
+        assert isinstance(result, list)
+        assert len(result) == 1
+        result = result[0]
+    assert result == [{"leaf": [1, 2]}]
+
+
+def test_error_path_in_nested_structure():
+    """Test that errors deep inside containers report the full path."""
+
+    def error_serialize(self, obj, path):
+        raise ValueError("Intentional error")
+
+    error_handler = SerializerHandler(
+        check=lambda self, obj, path: obj == "ERROR",
+        serialize_func=error_serialize,
+        uid="error_handler",
+        desc="Handler that raises errors",
+    )
+
+    serializer = JsonSerializer(handlers_pre=(error_handler,))
+    with pytest.raises(SerializationException, match=r"\('a', 'b', 1\)"):
+        serializer.json_serialize({"a": {"b": [0, "ERROR"]}})
+
+
+def test_failing_iterable_error_modes():
+    """Test that an error while iterating a container is handled at that container."""
+
+    def bad_gen():
+        yield 1
+        raise RuntimeError("generator broke")
+
+    with pytest.raises(SerializationException, match=r"path = \('g',\)"):
+        JsonSerializer().json_serialize({"g": bad_gen()})
+
+    gen = bad_gen()
+    result = JsonSerializer(error_mode=ErrorMode.IGNORE).json_serialize(
+        {"g": gen, "x": 1}
+    )
+    assert result == {"g": repr(gen), "x": 1}
+
+
+def test_shared_refs():
+    """Test that shared objects are written once and later occurrences as $ref."""
+    serializer = JsonSerializer(shared_refs=True)
+
+    shared = [1, 2]
+    point = {"x": 1.0}
+    obj = {"a": shared, "b": [shared, point], "c": {"p": point}, "s": "str", "n": 5}
+    result = serializer.json_serialize(obj)
+    assert result == {
+        "a": [1, 2],
+        "b": [{"$ref": "#/a"}, {"x": 1.0}],
+        "c": {"p": {"$ref": "#/b/1"}},
+        "s": "str",
+        "n": 5,
+    }
+    # primitives are never references, even when they are the same object
+    assert serializer.json_serialize(["text", "text", 7, 7]) == ["text", "text", 7, 7]
+    # references are tracked per call
+    assert serializer.json_serialize(obj) == result
+
+    loaded: Any = resolve_refs(json.loads(json.dumps(result)))
+    assert loaded["b"][0] is loaded["a"]
+    assert loaded["c"]["p"] is loaded["b"][1]
+
+    # disabled by default
+    plain: Any = JsonSerializer().json_serialize(obj)
+    assert plain["b"][0] == [1, 2]
+
+
+def test_shared_refs_colliding_keys():
+    """Test that refs never point at a key which is overwritten by a later key with the same `str()`."""
+    serializer = JsonSerializer(shared_refs=True)
+    shared = [1, 2]
+    # the last value for `"1"` is kept, at the position of the first key, as without `shared_refs`
+    obj = {1: shared, "1": [9], 2: shared}
+    result = serializer.json_serialize(obj)
+    assert result == {"1": [9], "2": [1, 2]}
+    assert result == JsonSerializer().json_serialize(obj)
+    # also when the overwritten key refers to an earlier object
+    nested = serializer.json_serialize({"a": shared, "b": {1: shared, "1": [9]}})
+    assert nested == {"a": [1, 2], "b": {"1": [9]}}
+
+
+def test_shared_refs_cycles():
+    """Test that cycles become references to the ancestor instead of an error."""
+    serializer = JsonSerializer(shared_refs=True)
+
+    circular: dict = {"name": "root", "children": []}
+    circular["children"].append({"parent": circular})
+    circular["children"].append(circular["children"])
+    result = serializer.json_serialize(circular)
+    assert result == {
+        "name": "root",
+        "children": [{"parent": {"$ref": "#"}}, {"$ref": "#/children"}],
+    }
+
+    loaded: Any = resolve_refs(json.loads(json.dumps(result)))
+    assert loaded["children"][0]["parent"] is loaded
+    assert loaded["children"][1] is loaded["children"]
+
+
+def test_shared_refs_sets_and_escaping():
+    """Test ref paths through sets and keys which need escaping in a json pointer."""
+    serializer = JsonSerializer(shared_refs=True)
+    inner = (1, 2)
+    result = serializer.json_serialize({"a/b~c": [{inner}, inner]})
+    assert result == {
+        "a/b~c": [
+            {_FORMAT_KEY: "set", "data": [[1, 2]]},
+            {"$ref": "#/a~1b~0c/0/data/0"},
+        ]
+    }
+    loaded: Any = resolve_refs(json.loads(json.dumps(result)))
+    assert loaded["a/b~c"][1] is loaded["a/b~c"][0]["data"][0]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1024])
+def test_shared_refs_iter_encode(chunk_size):
+    """Test that iter_encode writes the same references as json_serialize."""
+    serializer = JsonSerializer(shared_refs=True)
+    shared = {"k": [1, 2, 3]}
+    obj: dict = {
+        "first": shared,
+        "more": [shared, {shared["k"][0], 9}],
+        "dc": SimpleDataclass(1, "b", False),
+    }
+    obj["more"].append(obj)
+    obj["point_again"] = obj["dc"]
+
+    encoded = "".join(serializer.iter_encode(obj, chunk_size=chunk_size))
+    assert json.loads(encoded) == serializer.json_serialize(obj)
+    assert json.loads(encoded)["point_again"] == {"$ref": "#/dc"}
+
+
+@dataclass(frozen=True)
+class FrozenPoint:
+    """Frozen dataclass for testing the memo."""
+
+    x: int
+    y: int
+
+
+def test_memo_reuses_immutable_outputs():
+    """Test that immutable objects are serialized once and reused across calls."""
+    from muutils.misc.freezing import FrozenDict, FrozenList
+
+    serializer = JsonSerializer(memo_size=16)
+    point = FrozenPoint(1, 2)
+    pair = (1, "a")
+    path = Path("a/b")
+    frozen_dict = FrozenDict(a=1, b=2)
+    frozen_list = FrozenList([1, 2])
+    obj = [point, pair, path, frozen_dict, frozen_list, [1, 2]]
+
+    first = serializer.json_serialize(obj)
+    assert first == JsonSerializer().json_serialize(obj)
+    assert serializer.memo_info() == dict(hits=0, misses=5, size=5, maxsize=16)
+
+    second = serializer.json_serialize(obj)
+    assert second == first
+    assert serializer.memo_info()["hits"] == 5
+    # the cached output is reused, not recomputed
+    assert second[0] is first[0]  # type: ignore[index]
+
+    # mutable objects and tuples containing non-primitives are never cached
+    serializer.json_serialize([[1], ([1],), {"a": 1}])
+    assert serializer.memo_info()["size"] == 5
+
+    serializer.clear_memo()
+    assert serializer.memo_info() == dict(hits=0, misses=0, size=0, maxsize=16)
+    # disabled by default
+    assert JsonSerializer().memo_info()["maxsize"] == 0
+
+
+def test_memo_lru_and_weakrefs():
+    """Test that the memo evicts least recently used entries and drops collected objects."""
+    import gc
+
+    serializer = JsonSerializer(memo_size=2)
+    a, b, c = FrozenPoint(0, 0), FrozenPoint(1, 1), FrozenPoint(2, 2)
+    serializer.json_serialize(a)
+    serializer.json_serialize(b)
+    serializer.json_serialize(a)  # hit, `a` is now most recently used
+    serializer.json_serialize(c)  # evicts `b`
+    assert serializer.memo_info() == dict(hits=1, misses=3, size=2, maxsize=2)
+    serializer.json_serialize(b)
+    assert serializer.memo_info()["misses"] == 4
+
+    # weakly held entries are removed when the object is collected
+    del b, c
+    gc.collect()
+    assert serializer.memo_info()["size"] == 0
+
+    with pytest.raises(ValueError):
+        JsonSerializer(memo_size=4, shared_refs=True)
+    with pytest.raises(ValueError):
+        JsonSerializer(memo_size=-1)
+
+
+def test_memo_not_filled_with_native_arrays():
+    """Test that outputs holding raw arrays from `dumps` with orjson are not reused by json_serialize."""
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("orjson")
+
+    @dataclass(frozen=True)
+    class FrozenArray:
+        arr: Any
+
+    serializer = JsonSerializer(
+        memo_size=10, json_backend="orjson", array_mode="array_list_meta"
+    )
+    obj = FrozenArray(np.arange(3))
+    expected = JsonSerializer(array_mode="array_list_meta").json_serialize(obj)
+    assert json.loads(serializer.dumps(obj)) == expected
+    # would raise a TypeError if the ndarray from `dumps` was reused
+    assert json.loads(json.dumps(serializer.json_serialize(obj))) == expected
+
+
+def test_pickle_JsonSerializer():
+    """Test that serializers with the default handlers can be pickled."""
+    import pickle
+
+    custom_handler = SerializerHandler(
+        check=_is_int_check,
+        serialize_func=_int_to_str,
+        uid="int_to_str",
+        desc="ints as strings",
+    )
+    serializer = JsonSerializer(
+        handlers_pre=(custom_handler,),
+        error_mode=ErrorMode.WARN,
+        write_only_format=True,
+    )
+    loaded = pickle.loads(pickle.dumps(serializer))
+    assert loaded.handlers == serializer.handlers
+    assert loaded.handlers[1] is DEFAULT_HANDLERS[0]
+    assert loaded.error_mode == ErrorMode.WARN
+    assert loaded.write_only_format is True
+    assert loaded.json_serialize({"a": [1, {2}]}) == serializer.json_serialize(
+        {"a": [1, {2}]}
+    )
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_json_serialize_many(monkeypatch, start_method):
+    """Test that json_serialize_many matches serializing each item, in order."""
+    import multiprocessing
+
+    items = [SimpleDataclass(i, str(i)) for i in range(20)] + [{1, 2}, (3, 4)]
+    serializer = JsonSerializer()
+    expected = [serializer.json_serialize(item) for item in items]
+
+    assert serializer.json_serialize_many(items) == expected
+    assert serializer.json_serialize_many(iter(items)) == expected
+
+    # `spawn` is only pretended, to check that chunks are pickled and sent to the workers
+    monkeypatch.setattr(
+        multiprocessing, "get_start_method", lambda allow_none=False: start_method
+    )
+    assert serializer.json_serialize_many(items, parallel=2, chunksize=3) == expected
+    assert serializer.json_serialize_many(items, parallel=2) == expected
+    assert serializer.json_serialize_many([], parallel=2) == []
+
+    with pytest.raises(SerializationException, match=r"path = \('items', 1\)"):
+        JsonSerializer(handlers_default=BASE_HANDLERS).json_serialize_many(
+            [1, object()], parallel=2, path=("items",)
+        )
+    with pytest.raises(ValueError, match="shared_refs"):
+        JsonSerializer(shared_refs=True).json_serialize_many(items)
+
+
+def test_profile():
+    """Test that profiling records calls, time, and values produced per handler."""
+    serializer = JsonSerializer(profile=True)
+    obj = {"a": [1, 2, {3}], "path": Path("x/y"), "custom": ClassWithSerialize(1)}
+    result = serializer.json_serialize(obj)
+    assert result == JsonSerializer().json_serialize(obj)
+
+    stats = serializer.profile_stats()
+    assert stats["dictionaries"]["calls"] == 1
+    assert stats["(list, tuple) -> list"]["calls"] == 1
+    assert stats["base types"]["calls"] == 3
+    assert stats["base types"]["elements"] == 3
+    assert stats[".serialize override"]["elements"] == 3
+    assert stats["path -> str"]["calls"] == 1
+    assert all(s["time_s"] >= 0 for s in stats.values())
+    # containers traversed by json_serialize are one value, their children are counted separately
+    assert sum(s["elements"] for s in stats.values()) == 10
+
+    report = serializer.profile_report()
+    assert report.splitlines()[0].startswith("handler")
+    assert ".serialize override" in report
+
+    # streaming records the same calls
+    serializer.reset_profile()
+    assert serializer.profile_stats() == {}
+    "".join(serializer.iter_encode(obj))
+    assert serializer.profile_stats()["base types"]["calls"] == 3
+
+    # errors are attributed to the handler which failed, or to no handler
+    failing = JsonSerializer(
+        handlers_default=BASE_HANDLERS, profile=True, error_mode=ErrorMode.IGNORE
+    )
+    failing.json_serialize([object()])
+    assert failing.profile_stats()["no handler matched"]["calls"] == 1
+
+    # not profiling leaves no trace
+    plain = JsonSerializer()
+    plain.json_serialize(obj)
+    assert plain.profile_stats() == {}
+    assert "_serialize_node" not in vars(plain)
+
 
 def test_large_nested_structure():
     """Test serialization of large nested structure."""
@@ -1,6 +1,6 @@
 from collections import namedtuple
 from dataclasses import dataclass, field
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
 import pytest
 
@@ -9,11 +9,15 @@ import pytest
 # Module code assumed to be imported from my_module
 from muutils.json_serialize.types import _FORMAT_KEY
 from muutils.json_serialize.util import (
+    JSONdict,
     UniversalContainer,
     _recursive_hashify,
     array_safe_eq,
+    array_safe_hash,
     dc_eq,
+    dc_hash,
     isinstance_namedtuple,
+    resolve_refs,
     safe_getsource,
     string_as_lines,
     try_catch,
@@ -188,6 +192,49 @@ def test_array_safe_eq():
         pass  # Skip torch tests if not available
 
 
+def test_array_safe_hash():
+    """objects equal under `array_safe_eq` hash equal"""
+    import numpy as np
+
+    equal_pairs = [
+        (1, 1),
+        ("ab", "ab"),
+        ([1, [2, "x"]], [1, [2, "x"]]),
+        ({"a": [1], "b": {"c": 2}}, {"a": [1], "b": {"c": 2}}),
+        ({1, 2}, {2, 1}),
+        # broadcasting and signed zeros compare equal
+        (np.zeros((2, 3)), np.zeros(3)),
+        (np.array([0.0]), np.array([-0.0])),
+        ([np.arange(3), 1], [np.arange(3), 1]),
+    ]
+    for a, b in equal_pairs:
+        assert array_safe_eq(a, b)
+        assert array_safe_hash(a) == array_safe_hash(b)
+
+    assert array_safe_hash([1, 2]) != array_safe_hash([2, 1])
+    assert array_safe_hash({"a": [1]}) != array_safe_hash({"a": [2]})
+
+
+def test_dc_hash():
+    @dataclass
+    class Point:
+        x: int
+        y: list = field(default_factory=list)
+        note: str = field(default="", compare=False)
+
+    @dataclass
+    class Other:
+        x: int
+        y: list = field(default_factory=list)
+
+    assert dc_hash(Point(1, [2])) == dc_hash(Point(1, [2], note="ignored"))
+    assert dc_eq(Point(1, [2]), Point(1, [2], note="ignored"))
+    assert dc_hash(Point(1, [2])) != dc_hash(Point(1, [3]))
+    assert dc_hash(Point(1, [2])) != dc_hash(Other(1, [2]))
+    # nested unhashable dataclasses are hashed structurally too
+    assert dc_hash(Point(1, [Point(2)])) == dc_hash(Point(1, [Point(2)]))
+
+
 def test_dc_eq():
     """Test dc_eq for dataclasses equal and unequal cases."""
 
@@ -379,3 +426,31 @@ def test_edge_cases():
     assert [] in uc
     assert {} in uc
     assert object() in uc
+
+
+def test_resolve_refs():
+    # shared items become the same object, cycles are restored
+    data: dict[str, Any] = {
+        "a": [1, 2],
+        "b": [{"$ref": "#/a"}, {"$ref": "#/c~1d/0"}],
+        "c/d": [{"x": 1}],
+        "self": {"$ref": "#"},
+    }
+    result: Any = resolve_refs(data)
+    assert result is data
+    assert result["b"][0] is result["a"]
+    assert result["b"][1] is result["c/d"][0]
+    assert result["self"] is result
+
+    # dicts with other keys, or non-string refs, are left alone
+    not_refs: JSONdict = {"x": {"$ref": "#/a", "other": 1}, "y": {"$ref": 5}, "a": 1}
+    assert resolve_refs(not_refs) == {
+        "x": {"$ref": "#/a", "other": 1},
+        "y": {"$ref": 5},
+        "a": 1,
+    }
+
+    with pytest.raises(KeyError, match="could not resolve"):
+        resolve_refs({"a": {"$ref": "#/missing"}})
+    with pytest.raises(ValueError):
+        resolve_refs({"$ref": "#"})
@@ -5,7 +5,7 @@ from typing import Any
 import numpy as np
 import pytest
 
-from muutils.tensor_info import array_summary, generate_sparkline
+from muutils.tensor_info import array_info, array_summary, generate_sparkline
 
 
 @pytest.mark.parametrize(
@@ -27,6 +27,19 @@ def test_array_summary_failure(bad_input: Any) -> None:
     assert summary_str
 
 
+def test_array_info_median() -> None:
+    """
+    Test that array_info computes the median unless median=False.
+    """
+    arr = np.array([[1.0, 2.0], [3.0, 10.0]])
+    info = array_info(arr)
+    assert info["median"] == 2.5
+    info_no_median = array_info(arr, median=False)
+    assert info_no_median["median"] is None
+    assert info_no_median["mean"] == info["mean"]
+    assert info_no_median["histogram"] is not None
+
+
 def test_generate_sparkline_basic() -> None:
     """
     Test the sparkline generator with a fixed histogram.